@@ -0,0 +1,411 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Manifest-driven registration and execution of SOAR marketplace actions."""
+
+import functools
+import inspect
+import json
+from pathlib import Path
+from typing import Annotated, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.tools import Tool
+from mcp.types import Tool as MCPTool
+from mcp.server.fastmcp.utilities.func_metadata import FuncMetadata, func_metadata
+from pydantic import BaseModel, Field
+
+from logger_utils import get_logger
+from secops_soar_mcp import bindings
+from secops_soar_mcp.utils.consts import Endpoints
+from secops_soar_mcp.utils.models import (
+    ApiManualActionDataModel,
+    EmailContent,
+    TargetEntity,
+)
+from secops_soar_mcp.utils.pydantic_list_field import PydanticListField
+
+logger = get_logger(__name__)
+
+MANIFEST_PATH = Path(__file__).resolve().parent / "marketplace" / "manifest.jsonl"
+
+PARAMETER_TYPES = {
+    "str": str,
+    "bool": bool,
+    "List[str]": List[str],
+    "Union[str, dict]": Union[str, dict],
+    "EmailContent": EmailContent,
+}
+
+RETURNS_DOC = (
+    "\n\nReturns:\n"
+    "    dict: A dictionary containing the result of the action execution."
+)
+
+
+def load_manifest(
+    modules: Iterable[str], path: Path = MANIFEST_PATH
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Loads the manifest rows of the given integration modules.
+
+    Args:
+        modules: Normalized integration names, as passed to `--integrations`.
+        path: Path to the JSON lines manifest.
+
+    Returns:
+        A dictionary mapping each module found in the manifest to its action rows.
+    """
+    wanted = set(modules)
+    actions: Dict[str, List[Dict[str, Any]]] = {}
+    if not wanted or not path.is_file():
+        return actions
+    prefix = '{"module":"'
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            # Rows always start with the module name, so rows of integrations
+            # that are not enabled are skipped without being decoded.
+            if not line.startswith(prefix):
+                continue
+            module = line[len(prefix) : line.index('"', len(prefix))]
+            if module in wanted:
+                actions.setdefault(module, []).append(json.loads(line))
+    return actions
+
+
+async def get_instance(integration: str) -> Tuple[Optional[str], Optional[dict]]:
+    """Returns the cached instance identifier, or a failure response."""
+    try:
+        instance_identifier = await bindings.instance_cache.get(integration)
+    except Exception as e:
+        logger.error("Error fetching instance for %s: %s", integration, e)
+        return None, {"Status": "Failed", "Message": f"Error fetching instance: {e}"}
+
+    if not instance_identifier:
+        logger.warning("No active integration instance found for %s", integration)
+        return None, {"Status": "Failed", "Message": "No active instance found."}
+    return instance_identifier, None
+
+
+async def execute_action(
+    integration: str,
+    action_name: str,
+    script_params: Dict[str, Any],
+    case_id: str,
+    alert_group_identifiers: List[str],
+    target_entities: List[TargetEntity],
+    scope: str,
+) -> dict:
+    """Runs a marketplace action through the SOAR ExecuteManualAction endpoint.
+
+    Args:
+        integration: The SOAR integration name (e.g. "Alexa").
+        action_name: The integration action script name (e.g. "Alexa_Ping").
+        script_params: Script parameters keyed by their SOAR display names.
+        case_id: The ID of the case to run the action in.
+        alert_group_identifiers: Identifiers for the alert groups.
+        target_entities: Specific entities to run on; overrides scope when set.
+        scope: The predefined entity scope, used when no entities are given.
+
+    Returns:
+        The execution response, or a dict with "Status" and "Message" on failure.
+    """
+    if target_entities:
+        # Specific target entities provided, ignore scope parameter
+        final_target_entities = target_entities
+        final_scope = None
+        is_predefined_scope = False
+    else:
+        if scope not in bindings.valid_scopes:
+            allowed_values_str = ", ".join(sorted(list(bindings.valid_scopes)))
+            return {
+                "Status": "Failed",
+                "Message": f"Invalid scope '{scope}'. Allowed values are: {allowed_values_str}",
+            }
+        final_target_entities = []
+        final_scope = scope
+        is_predefined_scope = True
+
+    instance_identifier, error = await get_instance(integration)
+    if error is not None:
+        return error
+
+    action_data = ApiManualActionDataModel(
+        alertGroupIdentifiers=alert_group_identifiers,
+        caseId=case_id,
+        targetEntities=final_target_entities,
+        scope=final_scope,
+        isPredefinedScope=is_predefined_scope,
+        actionProvider="Scripts",
+        actionName=action_name,
+        properties={
+            "IntegrationInstance": instance_identifier,
+            "ScriptName": action_name,
+            "ScriptParametersEntityFields": json.dumps(script_params),
+        },
+    )
+
+    try:
+        execution_response = await bindings.http_client.post(
+            Endpoints.EXECUTE_MANUAL_ACTION, req=action_data.model_dump()
+        )
+    except Exception as e:
+        logger.error("Error executing action %s for %s: %s", action_name, integration, e)
+        bindings.instance_cache.invalidate(integration)
+        return {"Status": "Failed", "Message": f"Error executing action: {e}"}
+    if execution_response is None:
+        # The cached instance may have been removed; look it up again next time.
+        bindings.instance_cache.invalidate(integration)
+    elif bindings.case_mirror is not None:
+        # Actions can comment on the case and update its alerts.
+        await bindings.case_mirror.invalidate_related(case_id)
+    return execution_response
+
+
+def script_params(
+    specs: List[Dict[str, Any]], action_params: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Maps action parameters to script parameters keyed by their SOAR names."""
+    params = {}
+    for spec in specs:
+        value = action_params.get(spec["name"])
+        if value is None and not spec["required"]:
+            continue
+        if isinstance(value, BaseModel):
+            value = value.model_dump()
+        params[spec["key"]] = value
+    return params
+
+
+def _build_signature(row: Dict[str, Any]) -> inspect.Signature:
+    def parameter(name, annotation):
+        return inspect.Parameter(
+            name, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=annotation
+        )
+
+    parameters = [
+        parameter(
+            "case_id", Annotated[str, Field(..., description="The ID of the case.")]
+        ),
+        parameter(
+            "alert_group_identifiers",
+            Annotated[
+                List[str], Field(..., description="Identifiers for the alert groups.")
+            ],
+        ),
+    ]
+    for spec in row["parameters"]:
+        field = (
+            Field(..., description=spec["description"])
+            if spec["required"]
+            else Field(default=None, description=spec["description"])
+        )
+        parameters.append(
+            parameter(spec["name"], Annotated[PARAMETER_TYPES[spec["type"]], field])
+        )
+    parameters += [
+        parameter(
+            "target_entities",
+            Annotated[
+                List[TargetEntity],
+                PydanticListField(
+                    TargetEntity,
+                    description="Optional list of specific target entities (Identifier, EntityType) to run the action on.",
+                ),
+            ],
+        ),
+        parameter(
+            "scope",
+            Annotated[
+                str,
+                Field(
+                    default="All entities",
+                    description="Defines the scope for the action.",
+                ),
+            ],
+        ),
+    ]
+    return inspect.Signature(parameters, return_annotation=dict)
+
+
+def _tool_function(row: Dict[str, Any]):
+    integration = row["integration"]
+    action_name = row["action"]
+    specs = row["parameters"]
+
+    async def tool(
+        case_id: str,
+        alert_group_identifiers: List[str],
+        target_entities: List[TargetEntity],
+        scope: str,
+        **action_params: Any,
+    ) -> dict:
+        return await execute_action(
+            integration,
+            action_name,
+            script_params(specs, action_params),
+            case_id,
+            alert_group_identifiers,
+            target_entities,
+            scope,
+        )
+
+    tool.__name__ = row["name"]
+    tool.__qualname__ = row["name"]
+    tool.__doc__ = row["description"] + RETURNS_DOC
+    return tool
+
+
+def build_tool(row: Dict[str, Any]):
+    """Builds the MCP tool function for one manifest row."""
+    tool = _tool_function(row)
+    tool.__signature__ = _build_signature(row)
+    return tool
+
+
+@functools.cache
+def _common_schema() -> Dict[str, Any]:
+    row = {
+        "integration": "",
+        "action": "",
+        "name": "common",
+        "description": "",
+        "parameters": [],
+    }
+    return Tool.from_function(build_tool(row)).parameters
+
+
+def input_schema(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns the tool input schema of a manifest row.
+
+    Rows only store the schema of their action parameters; the parameters
+    shared by every action are added here.
+    """
+    common = _common_schema()
+    common_properties = list(common["properties"].items())
+    action_schema = row["schema"]
+    schema = {}
+    if "$defs" in action_schema:
+        schema["$defs"] = action_schema["$defs"]
+    schema["properties"] = dict(
+        common_properties[:2]
+        + list(action_schema["properties"].items())
+        + common_properties[2:]
+    )
+    schema["required"] = common["required"] + action_schema["required"]
+    schema["title"] = f"{row['name']}Arguments"
+    schema["type"] = "object"
+    return schema
+
+
+class ManifestTool(Tool):
+    """A marketplace tool whose argument model is built on its first call.
+
+    The input schema advertised in `tools/list` comes precomputed from the
+    manifest, so registering a tool does not build any pydantic model.
+    """
+
+    row: Dict[str, Any] = Field(exclude=True)
+    fn_metadata: Optional[FuncMetadata] = None
+
+    @property
+    def output_schema(self) -> Optional[Dict[str, Any]]:
+        return None
+
+    def _ensure_metadata(self):
+        if self.fn_metadata is None:
+            self.fn.__signature__ = _build_signature(self.row)
+            self.fn_metadata = func_metadata(self.fn)
+
+    async def run(self, *args, **kwargs) -> Any:
+        self._ensure_metadata()
+        return await super().run(*args, **kwargs)
+
+    def script_params(self, action_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Validates action parameters and maps them to script parameters.
+
+        Raises:
+            ValueError: If a parameter is unknown, missing or invalid.
+        """
+        names = {spec["name"] for spec in self.row["parameters"]}
+        unknown = set(action_params) - names
+        if unknown:
+            raise ValueError(f"Unknown parameters: {', '.join(sorted(unknown))}")
+        self._ensure_metadata()
+        arguments = self.fn_metadata.arg_model.model_validate(
+            {"case_id": "", "alert_group_identifiers": [], **action_params}
+        ).model_dump_one_level()
+        return script_params(self.row["parameters"], arguments)
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "ManifestTool":
+        fn = _tool_function(row)
+        return cls(
+            fn=fn,
+            name=row["name"],
+            description=fn.__doc__,
+            parameters=input_schema(row),
+            is_async=True,
+            row=row,
+        )
+
+
+class ManifestServer(FastMCP):
+    """A FastMCP server that also serves the tools of manifest rows.
+
+    FastMCP's add_tool builds the argument model of every tool it registers,
+    so manifest tools are kept in `actions` instead and served by extending
+    the server's tool listing and call handlers.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.actions: Dict[str, ManifestTool] = {}
+
+    async def list_tools(self) -> List[MCPTool]:
+        tools = await super().list_tools()
+        return tools + [
+            MCPTool(
+                name=tool.name,
+                title=tool.title,
+                description=tool.description,
+                inputSchema=tool.parameters,
+                annotations=tool.annotations,
+            )
+            for tool in self.actions.values()
+        ]
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
+        tool = self.actions.get(name)
+        if tool is None:
+            return await super().call_tool(name, arguments)
+        return await tool.run(
+            arguments, context=self.get_context(), convert_result=True
+        )
+
+
+def register_tools(
+    mcp: ManifestServer, rows: Iterable[Dict[str, Any]]
+) -> Dict[str, ManifestTool]:
+    """Registers one MCP tool per manifest row.
+
+    Returns:
+        The registered tools by name.
+    """
+    registered = {}
+    for row in rows:
+        if row["name"] in mcp.actions:
+            logger.warning("Tool already exists: %s", row["name"])
+            continue
+        tool = ManifestTool.from_row(row)
+        mcp.actions[tool.name] = registered[tool.name] = tool
+    return registered
@@ -17,7 +17,9 @@ import os
 
 import dotenv
 from logger_utils import get_logger
-from secops_soar_mcp.http_client import HttpClient
+from secops_soar_mcp.case_mirror import CaseMirror
+from secops_soar_mcp.http_client import HttpClient, TransportConfig
+from secops_soar_mcp.instance_cache import InstanceCache
 from secops_soar_mcp.utils import consts
 
 dotenv.load_dotenv()
@@ -26,6 +28,8 @@ logger = get_logger(__name__)
 
 
 http_client: HttpClient = None
+instance_cache: InstanceCache = None
+case_mirror: CaseMirror = None
 valid_scopes = set()
 
 
@@ -40,13 +44,39 @@ async def _get_valid_scopes():
 
 async def bind():
     """Binds global variables."""
-    global http_client, valid_scopes
+    global http_client, instance_cache, case_mirror, valid_scopes
     http_client = HttpClient(
-        os.getenv(consts.ENV_SOAR_URL), os.getenv(consts.ENV_SOAR_APP_KEY)
+        os.getenv(consts.ENV_SOAR_URL),
+        os.getenv(consts.ENV_SOAR_APP_KEY),
+        TransportConfig.from_env(),
     )
+    instance_cache = InstanceCache(
+        http_client,
+        float(
+            os.getenv(
+                consts.ENV_SOAR_INSTANCE_CACHE_TTL, consts.DEFAULT_INSTANCE_CACHE_TTL
+            )
+        ),
+    )
+    mirror_path = os.getenv(consts.ENV_SOAR_CASE_MIRROR_PATH)
+    if mirror_path:
+        case_mirror = CaseMirror(
+            http_client,
+            mirror_path,
+            float(
+                os.getenv(
+                    consts.ENV_SOAR_CASE_MIRROR_POLL_INTERVAL,
+                    consts.DEFAULT_CASE_MIRROR_POLL_INTERVAL,
+                )
+            ),
+        )
     valid_scopes = await _get_valid_scopes()
 
 
 async def cleanup():
     """Cleans up global variables."""
+    if instance_cache is not None:
+        await instance_cache.close()
+    if case_mirror is not None:
+        await case_mirror.close()
     await http_client.close()
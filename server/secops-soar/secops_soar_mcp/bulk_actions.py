@@ -0,0 +1,172 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Bulk execution of marketplace actions across many cases."""
+
+import asyncio
+from typing import Annotated, Any, Dict, List, Optional
+
+from mcp.server.fastmcp import FastMCP
+from pydantic import Field
+
+from logger_utils import get_logger
+from secops_soar_mcp.action_manifest import (
+    ManifestTool,
+    execute_action,
+    get_instance,
+)
+from secops_soar_mcp.utils.models import BulkActionTarget
+from secops_soar_mcp.utils.pydantic_list_field import PydanticListField
+
+logger = get_logger(__name__)
+
+MAX_TARGETS = 500
+MAX_CONCURRENCY = 50
+
+
+def _failed(response: Any) -> bool:
+    return response is None or (
+        isinstance(response, dict) and response.get("Status") == "Failed"
+    )
+
+
+def register_tools(mcp: FastMCP, actions: Dict[str, ManifestTool]):
+    """Registers the bulk executor for the given marketplace action tools."""
+
+    @mcp.tool()
+    async def execute_bulk_action(
+        action_tool: Annotated[
+            str,
+            Field(
+                ...,
+                description="The name of the marketplace action tool to run (e.g. 'alexa_ping').",
+            ),
+        ],
+        targets: Annotated[
+            List[BulkActionTarget],
+            PydanticListField(
+                BulkActionTarget,
+                description="The cases to run the action in, each with optional alert group identifiers and target entities.",
+            ),
+        ],
+        action_parameters: Annotated[
+            Optional[Dict[str, Any]],
+            Field(
+                default=None,
+                description="The action parameters, by parameter name, shared by every target.",
+            ),
+        ],
+        scope: Annotated[
+            str,
+            Field(
+                default="All entities",
+                description="The entity scope, used for targets without target entities.",
+            ),
+        ],
+        max_concurrency: Annotated[
+            int,
+            Field(
+                default=10,
+                ge=1,
+                le=MAX_CONCURRENCY,
+                description="The maximum number of actions running at the same time.",
+            ),
+        ],
+    ) -> dict:
+        """Run one marketplace action across many cases or entity sets in a single call.
+
+        Instead of calling a marketplace action tool once per case, this tool runs the
+        same action with the same parameters for every target concurrently, and reports
+        the outcome of each. Use it for mass containment or enrichment, e.g. blocking
+        an IOC in every case where it appears.
+
+        Args:
+            action_tool (str): The name of an enabled marketplace action tool, as listed
+                               in the available tools. (Example: "virustotal_v3_enrich_hash")
+            targets (List[BulkActionTarget]): The targets to run the action for. Each has a
+                               `case_id`, and optionally `alert_group_identifiers` and
+                               `target_entities` (Identifier, EntityType) to run on.
+            action_parameters (Optional[Dict[str, Any]]): The action parameters, by the
+                               parameter names of `action_tool`.
+            scope (str): The predefined entity scope for targets without target entities.
+            max_concurrency (int): How many actions run at the same time (1-50).
+
+        Returns:
+            dict: The number of targets, succeeded and failed, and a 'results' list with
+                  the case ID, 'status' ("Succeeded" or "Failed") and raw execution
+                  response of each target, in the order of `targets`.
+
+        **Next Steps (using MCP-enabled tools):**
+        - Retry the failed targets, e.g. with a lower `max_concurrency`.
+        - Document the bulk action in the affected cases using a case commenting tool.
+        """
+        tool = actions.get(action_tool)
+        if tool is None:
+            return {
+                "Status": "Failed",
+                "Message": f"'{action_tool}' is not an enabled marketplace action tool.",
+            }
+        if len(targets) > MAX_TARGETS:
+            return {
+                "Status": "Failed",
+                "Message": f"At most {MAX_TARGETS} targets can be run in one call.",
+            }
+        try:
+            params = tool.script_params(action_parameters or {})
+        except ValueError as e:
+            return {"Status": "Failed", "Message": f"Invalid action parameters: {e}"}
+
+        integration = tool.row["integration"]
+        # Fail every target at once if the integration has no instance. Each
+        # target still resolves the instance through the cache, so targets
+        # after a failure that invalidated it run on a freshly looked up one.
+        _, error = await get_instance(integration)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(target: BulkActionTarget):
+            if error is not None:
+                response = error
+            else:
+                async with semaphore:
+                    try:
+                        response = await execute_action(
+                            integration,
+                            tool.row["action"],
+                            params,
+                            target.case_id,
+                            target.alert_group_identifiers,
+                            target.target_entities,
+                            scope,
+                        )
+                    except Exception as e:
+                        logger.error(
+                            "Error running %s in case %s: %s",
+                            action_tool,
+                            target.case_id,
+                            e,
+                        )
+                        response = {"Status": "Failed", "Message": str(e)}
+            return {
+                "case_id": target.case_id,
+                "status": "Failed" if _failed(response) else "Succeeded",
+                "response": response,
+            }
+
+        results = await asyncio.gather(*map(run, targets))
+        failed = sum(result["status"] == "Failed" for result in results)
+        return {
+            "total": len(results),
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "results": results,
+        }
@@ -13,12 +13,15 @@
 # limitations under the License.
 import asyncio
 from secops_soar_mcp import bindings
+from secops_soar_mcp.case_mirror import MODIFICATION_FIELD
+from secops_soar_mcp.case_snapshot import CaseSnapshot
 from mcp.server.fastmcp import FastMCP
 from secops_soar_mcp.utils.consts import Endpoints
 from secops_soar_mcp.utils.models import CasePriority
 from logger_utils import get_logger
 from typing import Annotated, Optional, List
 from pydantic import Field
+from secops_soar_mcp.utils.pagination import MAX_PAGE_SIZE, fetch_page
 from secops_soar_mcp.utils.pydantic_list_field import PydanticListField
 
 logger = get_logger(__name__)
@@ -34,6 +37,15 @@ def register_tools(mcp: FastMCP):
                 description="The nextPageToken to fetch the next page of results.",
             ),
         ],
+        page_size: Annotated[
+            Optional[int],
+            Field(
+                default=None,
+                ge=1,
+                le=MAX_PAGE_SIZE,
+                description="The maximum number of results to return. If not set, one page of the API's default size is returned.",
+            ),
+        ],
     ) -> dict:
         """List cases available in the Security Orchestration, Automation, and Response (SOAR) platform.
 
@@ -43,6 +55,11 @@ def register_tools(mcp: FastMCP):
         This is useful for getting a high-level list of recent security issues or finding
         a specific incident to investigate further.
 
+        Args:
+            next_page_token (Optional[str]): The nextPageToken of the previous response, to continue the listing.
+            page_size (Optional[int]): The maximum number of cases to return. Use it with
+                           next_page_token to walk large case queues page by page.
+
         Returns:
             dict: A dictionary representing the raw API response from the SOAR platform,
                   usually containing a list of case objects with their summary details (e.g., ID, name, status, priority).
@@ -59,12 +76,20 @@ def register_tools(mcp: FastMCP):
         - Use a tool to change the case priority if initial assessment suggests it's warranted (like `change_case_priority`).
         - Begin enrichment by extracting key indicators from the case summary and using appropriate SIEM, TI, or other security tool MCP integrations.
         """
-        if next_page_token:
-            return await bindings.http_client.get(
+        try:
+            if bindings.case_mirror is not None:
+                page = await bindings.case_mirror.list_page(next_page_token, page_size)
+                if page is not None:
+                    return page
+            return await fetch_page(
+                bindings.http_client,
                 Endpoints.BASE_CASE_URL,
-                params={"$expand": "tags", "pageToken": next_page_token},
+                page_token=next_page_token,
+                page_size=page_size,
+                params={"$expand": "tags"} if next_page_token or page_size else None,
             )
-        return await bindings.http_client.get(Endpoints.BASE_CASE_URL)
+        except ValueError as e:
+            return {"Status": "Failed", "Message": str(e)}
 
     @mcp.tool()
     async def post_case_comment(
@@ -100,10 +125,13 @@ def register_tools(mcp: FastMCP):
         - Use comments to justify changes in case priority (using a case priority tool) or status.
         - Share key comments or findings with other relevant systems if needed (e.g., ticketing, reporting).
         """
-        return await bindings.http_client.post(
+        response = await bindings.http_client.post(
             Endpoints.BASE_CASE_COMMENTS_URL.format(CASE_ID=case_id),
             req={"Comment": comment},
         )
+        if bindings.case_mirror is not None:
+            await bindings.case_mirror.invalidate_related(case_id)
+        return response
 
     @mcp.tool()
     async def list_alerts_by_case(
@@ -115,6 +143,15 @@ def register_tools(mcp: FastMCP):
                 description="The nextPageToken to fetch the next page of results.",
             ),
         ],
+        page_size: Annotated[
+            Optional[int],
+            Field(
+                default=None,
+                ge=1,
+                le=MAX_PAGE_SIZE,
+                description="The maximum number of results to return. If not set, one page of the API's default size is returned.",
+            ),
+        ],
     ) -> dict:
         """List the security alerts associated with a specific case ID in the SOAR platform.
 
@@ -126,6 +163,9 @@ def register_tools(mcp: FastMCP):
         Args:
             case_id (str): The unique identifier (ID) of the case for which associated
                            alerts should be retrieved. (Example: "523")
+            next_page_token (Optional[str]): The nextPageToken of the previous response, to continue the listing.
+            page_size (Optional[int]): The maximum number of alerts to return. Use it with
+                           next_page_token to walk large cases page by page.
 
         Returns:
             dict: A dictionary representing the raw API response, typically containing
@@ -146,14 +186,15 @@ def register_tools(mcp: FastMCP):
         - Extract indicators from alert details and use SIEM entity lookup or event search tools for enrichment.
         - Correlate alert details with findings from other security tools (EDR, Network, Cloud, TI) via their MCP tools.
         """
-        if next_page_token:
-            return await bindings.http_client.get(
+        try:
+            return await fetch_page(
+                bindings.http_client,
                 Endpoints.BASE_ALERT_URL.format(CASE_ID=case_id),
-                params={"pageToken": next_page_token},
+                page_token=next_page_token,
+                page_size=page_size,
             )
-        return await bindings.http_client.get(
-            Endpoints.BASE_ALERT_URL.format(CASE_ID=case_id)
-        )
+        except ValueError as e:
+            return {"Status": "Failed", "Message": str(e)}
 
     @mcp.tool()
     async def list_alert_group_identifiers_by_case(
@@ -214,6 +255,15 @@ def register_tools(mcp: FastMCP):
                 description="The nextPageToken to fetch the next page of results.",
             ),
         ],
+        page_size: Annotated[
+            Optional[int],
+            Field(
+                default=None,
+                ge=1,
+                le=MAX_PAGE_SIZE,
+                description="The maximum number of results to return. If not set, one page of the API's default size is returned.",
+            ),
+        ],
     ):
         """List the underlying security events associated with a specific alert within a given case.
 
@@ -226,6 +276,9 @@ def register_tools(mcp: FastMCP):
             case_id (str): The unique identifier (ID) of the case containing the alert. (Example: "523")
             alert_id (str): The unique identifier (ID) of the specific alert whose
                             associated events are to be listed. (Example: "751")
+            next_page_token (Optional[str]): The nextPageToken of the previous response, to continue the listing.
+            page_size (Optional[int]): The maximum number of events to return. Use it with
+                            next_page_token to walk large alerts page by page.
 
         Returns:
             dict: A dictionary representing the raw API response from the SOAR platform,
@@ -245,18 +298,17 @@ def register_tools(mcp: FastMCP):
         - Correlate event details with other related events using SIEM event search tools.
         - Document findings in the relevant case management system using a commenting tool.
         """
-        if next_page_token:
-            return await bindings.http_client.get(
+        try:
+            return await fetch_page(
+                bindings.http_client,
                 Endpoints.LIST_INVOLVED_EVENTS_BY_ALERT.format(
                     CASE_ID=case_id, ALERT_ID=alert_id
                 ),
-                params={"pageToken": next_page_token},
-            )
-        return await bindings.http_client.get(
-            Endpoints.LIST_INVOLVED_EVENTS_BY_ALERT.format(
-                CASE_ID=case_id, ALERT_ID=alert_id
+                page_token=next_page_token,
+                page_size=page_size,
             )
-        )
+        except ValueError as e:
+            return {"Status": "Failed", "Message": str(e)}
 
     @mcp.tool()
     async def change_case_priority(
@@ -512,6 +564,13 @@ def register_tools(mcp: FastMCP):
     @mcp.tool()
     async def get_case_full_details(
         case_id: Annotated[str, Field(..., description="The ID of the case.")],
+        deep: Annotated[
+            bool,
+            Field(
+                default=False,
+                description="Also fetch the events of every alert, the entities of every alert group and the details of every entity.",
+            ),
+        ],
     ):
         """Retrieve comprehensive details for a specific case by aggregating its core information, associated alerts, and comments.
 
@@ -524,12 +583,22 @@ def register_tools(mcp: FastMCP):
         Args:
             case_id (str): The unique identifier (ID) of the case for which full details
                            are required. (Example: "523")
+            deep (bool): If True, build a full snapshot of the case in one call, fetching
+                         the referenced events, alert group entities and entity details
+                         concurrently. Parts that fail or time out are listed in 'errors'
+                         and left empty, so the snapshot may be partial. (Default: False)
 
         Returns:
             dict: A dictionary containing the aggregated results from three separate API calls:
                   - 'case_details': The raw API response for the basic case information.
                   - 'case_alerts': The raw API response containing the list of alerts associated with the case.
                   - 'case_comments': The raw API response containing the list of comments for the case.
+                  In deep mode, it also contains:
+                  - 'alert_events': The events of each alert, with its alert ID and alert group identifier.
+                  - 'alert_group_entities': The entities response of each alert group identifier.
+                  - 'entities': The SOAR details of each distinct entity ('entities_truncated' is True
+                    if there were too many entities to fetch them all).
+                  - 'errors': The parts of the snapshot that could not be fetched.
                   **Triage Note:** Use the `priority` field as an initial guide only. Analyze the combined details (alerts, comments, entities involved, potential impact, related threat intelligence) gathered by this tool and others to determine the true importance and urgency of the case.
 
         **Workflow Integration:**
@@ -546,16 +615,36 @@ def register_tools(mcp: FastMCP):
         - Document investigation progress using a case commenting tool.
         - Consider adjusting case priority using a priority management tool based on findings.
         """
+        if deep:
+            return await CaseSnapshot(bindings.http_client, case_id).build()
         case_coro = bindings.http_client.get(
             Endpoints.BASE_SPECIFIC_CASE_URL.format(CASE_ID=case_id)
         )
-        case_alerts_coro = bindings.http_client.get(
-            Endpoints.BASE_ALERT_URL.format(CASE_ID=case_id)
-        )
-        case_comments_coro = bindings.http_client.get(
-            Endpoints.BASE_CASE_COMMENTS_URL.format(CASE_ID=case_id)
-        )
-        results = await asyncio.gather(case_coro, case_alerts_coro, case_comments_coro)
+
+        def related_coros():
+            return (
+                bindings.http_client.get(
+                    Endpoints.BASE_ALERT_URL.format(CASE_ID=case_id)
+                ),
+                bindings.http_client.get(
+                    Endpoints.BASE_CASE_COMMENTS_URL.format(CASE_ID=case_id)
+                ),
+            )
+
+        if bindings.case_mirror is None:
+            results = await asyncio.gather(case_coro, *related_coros())
+        else:
+            case_details = await case_coro
+            # The mirrored alerts and comments are only used if they were
+            # fetched at the case's current modification time.
+            related = None
+            if isinstance(case_details, dict):
+                related = await bindings.case_mirror.get_related(
+                    case_id, case_details.get(MODIFICATION_FIELD)
+                )
+            if related is None:
+                related = await asyncio.gather(*related_coros())
+            results = (case_details, *related)
         return {
             "case_details:": results[0],
             "case_alerts": results[1],
@@ -0,0 +1,482 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Local SQLite mirror of SOAR cases, alerts and comments."""
+
+import asyncio
+import json
+import re
+import sqlite3
+import threading
+import time
+from typing import Annotated, Any, Dict, List, Optional, Set, Tuple
+
+from mcp.server.fastmcp import FastMCP
+from pydantic import Field
+
+from logger_utils import get_logger
+from secops_soar_mcp.http_client import HttpClient
+from secops_soar_mcp.utils.consts import Endpoints
+
+logger = get_logger(__name__)
+
+# Case fields used for delta polling.
+CASE_ID_FIELD = "id"
+MODIFICATION_FIELD = "updateTime"
+
+FULL_SYNC_INTERVAL = 3600
+MAX_QUERY_LIMIT = 1000
+DEFAULT_PAGE_SIZE = 100
+# list_cases page tokens served by the mirror carry this prefix.
+PAGE_TOKEN_PREFIX = "mirror."
+_FIELD_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*$")
+
+# Alert and comment fetches in flight at once during a sync.
+RELATED_CONCURRENCY = 8
+
+# case_alerts and case_comments hold the raw API responses of a case, along
+# with the case modification time they were fetched at.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cases (
+    id TEXT PRIMARY KEY,
+    modified TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cases_modified ON cases (modified);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS case_alerts (
+    case_id TEXT PRIMARY KEY,
+    modified TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS case_comments (
+    case_id TEXT PRIMARY KEY,
+    modified TEXT,
+    data TEXT NOT NULL
+);
+"""
+_RELATED_TABLES = ("case_alerts", "case_comments")
+
+
+def _json_path(field: str) -> str:
+    if not _FIELD_PATTERN.match(field):
+        raise ValueError(f"Invalid field name: {field}")
+    return "$." + field
+
+
+class CaseMirror:
+    """Keeps a local copy of the cases of a SOAR tenant.
+
+    The first sync walks every case. Later syncs only request the cases whose
+    modification time is not older than the latest one seen, and fetch the
+    alerts and comments of the cases that changed. A full sync runs every
+    `FULL_SYNC_INTERVAL` seconds to drop deleted cases.
+
+    Database work runs in a worker thread, one statement or transaction at a
+    time, so it never blocks the event loop.
+    """
+
+    def __init__(
+        self, http_client: HttpClient, path: str, poll_interval: float = 60
+    ):
+        self.http_client = http_client
+        self.poll_interval = poll_interval
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._db_lock = threading.Lock()
+        self._sync_lock = asyncio.Lock()
+        self._sync_task: Optional[asyncio.Task] = None
+        self._last_full_sync = 0.0
+        self.ready = self._get_state("watermark") is not None
+
+    def _get_state(self, key: str) -> Optional[str]:
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT value FROM sync_state WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value: str):
+        self._db.execute(
+            "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+            (key, value),
+        )
+
+    def _store_page(
+        self, cases: List[Dict[str, Any]], latest: Optional[str]
+    ) -> Tuple[List[str], List[Tuple[str, Optional[str]]], Optional[str]]:
+        """Stores a page of cases and advances the watermark.
+
+        Returns:
+            The IDs of the cases, the (ID, modification time) of the cases
+            that changed and the new watermark.
+        """
+        case_ids = []
+        changed = []
+        with self._db_lock, self._db:
+            for case in cases:
+                case_id = str(case[CASE_ID_FIELD])
+                modified = case.get(MODIFICATION_FIELD)
+                case_ids.append(case_id)
+                row = self._db.execute(
+                    "SELECT modified FROM cases WHERE id = ?", (case_id,)
+                ).fetchone()
+                # Cases at the watermark are listed again by every sync; an
+                # unchanged one is not written again.
+                if row is None or modified is None or row[0] != str(modified):
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO cases (id, modified, data) VALUES (?, ?, ?)",
+                        (case_id, modified, json.dumps(case)),
+                    )
+                    changed.append((case_id, modified))
+                if modified is not None and (
+                    latest is None or str(modified) > latest
+                ):
+                    latest = str(modified)
+            # Advance the watermark page by page, so an interrupted sync
+            # resumes where it stopped.
+            if latest is not None:
+                self._set_state("watermark", latest)
+        return case_ids, changed, latest
+
+    def _store_related(
+        self, case_id: str, modified: Optional[str], alerts: Any, comments: Any
+    ):
+        """Stores the alerts and comments of a case; failed fetches are dropped."""
+        with self._db_lock, self._db:
+            for table, data in zip(_RELATED_TABLES, (alerts, comments)):
+                if data is None:
+                    self._db.execute(f"DELETE FROM {table} WHERE case_id = ?", (case_id,))
+                else:
+                    self._db.execute(
+                        f"INSERT OR REPLACE INTO {table} (case_id, modified, data) VALUES (?, ?, ?)",
+                        (case_id, modified, json.dumps(data)),
+                    )
+
+    async def _sync_related(self, changed: List[Tuple[str, Optional[str]]]):
+        semaphore = asyncio.Semaphore(RELATED_CONCURRENCY)
+
+        async def fetch(case_id: str, modified: Optional[str]):
+            async with semaphore:
+                alerts, comments = await asyncio.gather(
+                    self.http_client.get(Endpoints.BASE_ALERT_URL.format(CASE_ID=case_id)),
+                    self.http_client.get(
+                        Endpoints.BASE_CASE_COMMENTS_URL.format(CASE_ID=case_id)
+                    ),
+                )
+            await asyncio.to_thread(
+                self._store_related,
+                case_id,
+                None if modified is None else str(modified),
+                alerts,
+                comments,
+            )
+
+        await asyncio.gather(*(fetch(case_id, modified) for case_id, modified in changed))
+
+    def _finish_sync(self, full: bool, seen: Set[str], latest: Optional[str]):
+        with self._db_lock, self._db:
+            if full:
+                self._db.execute(
+                    "CREATE TEMP TABLE IF NOT EXISTS seen (id TEXT PRIMARY KEY)"
+                )
+                self._db.execute("DELETE FROM seen")
+                self._db.executemany(
+                    "INSERT INTO seen (id) VALUES (?)", ((i,) for i in seen)
+                )
+                self._db.execute(
+                    "DELETE FROM cases WHERE id NOT IN (SELECT id FROM seen)"
+                )
+                for table in _RELATED_TABLES:
+                    self._db.execute(
+                        f"DELETE FROM {table} WHERE case_id NOT IN (SELECT id FROM seen)"
+                    )
+            if latest is None:
+                self._set_state("watermark", "")
+
+    async def sync(self, full: bool = False) -> int:
+        """Fetches the cases modified since the last sync.
+
+        Args:
+            full: Whether to walk every case and drop the ones not found.
+
+        Returns:
+            The number of cases added or changed.
+        """
+        async with self._sync_lock:
+            watermark = (
+                None if full else await asyncio.to_thread(self._get_state, "watermark")
+            )
+            params = {"$expand": "tags", "$orderby": f"{MODIFICATION_FIELD} asc"}
+            if watermark:
+                # Cases modified at the watermark itself are listed again, so
+                # that no update sharing its timestamp is missed.
+                params["$filter"] = f"{MODIFICATION_FIELD} ge {watermark}"
+            latest = watermark
+            seen = set()
+            count = 0
+            async for page in self.http_client.paginate(
+                Endpoints.BASE_CASE_URL, params=params
+            ):
+                cases = [c for c in page.items if isinstance(c, dict)]
+                case_ids, changed, latest = await asyncio.to_thread(
+                    self._store_page, cases, latest
+                )
+                await self._sync_related(changed)
+                seen.update(case_ids)
+                count += len(changed)
+            await asyncio.to_thread(self._finish_sync, full, seen, latest)
+            if full:
+                self._last_full_sync = time.monotonic()
+            self.ready = True
+            logger.debug("Case mirror synced %d cases", count)
+            return count
+
+    def _query(self, sql: str, args: List[Any]) -> List[Dict[str, Any]]:
+        with self._db_lock:
+            rows = self._db.execute(sql, args).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    async def query_cases(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        text: Optional[str] = None,
+        order_by: Optional[str] = None,
+        descending: bool = True,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Returns mirrored cases matching the given filters.
+
+        Args:
+            filters: Case field values to match, by field name. Nested fields
+                are separated by dots (e.g. "assignee.name"). Values must be
+                strings, numbers, booleans or None, and are compared as text,
+                so "1" matches 1.
+            text: A substring to search for anywhere in the case.
+            order_by: The case field to sort by (default: modification time).
+            descending: Whether to sort in descending order.
+            limit: The maximum number of cases to return.
+            offset: The number of matching cases to skip.
+
+        Raises:
+            ValueError: If a field name or filter value is invalid.
+        """
+        clauses = []
+        args: List[Any] = []
+        for field, value in (filters or {}).items():
+            if value is None:
+                clauses.append("json_extract(data, ?) IS NULL")
+                args.append(_json_path(field))
+                continue
+            if isinstance(value, bool):
+                # json_extract returns JSON booleans as 1 and 0.
+                value = int(value)
+            elif not isinstance(value, (str, int, float)):
+                raise ValueError(
+                    f"Filter value of {field} must be a string, number, boolean or null"
+                )
+            clauses.append("CAST(json_extract(data, ?) AS TEXT) = CAST(? AS TEXT)")
+            args += [_json_path(field), value]
+        if text:
+            clauses.append("instr(lower(data), lower(?)) > 0")
+            args.append(text)
+        sql = "SELECT data FROM cases"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        if order_by:
+            sql += " ORDER BY json_extract(data, ?)"
+            args.append(_json_path(order_by))
+        else:
+            sql += " ORDER BY modified"
+        sql += " DESC" if descending else " ASC"
+        sql += " LIMIT ? OFFSET ?"
+        args += [limit, offset]
+        return await asyncio.to_thread(self._query, sql, args)
+
+    def _drop_related(self, case_id: str):
+        with self._db_lock, self._db:
+            for table in _RELATED_TABLES:
+                self._db.execute(f"DELETE FROM {table} WHERE case_id = ?", (case_id,))
+
+    async def invalidate_related(self, case_id: str):
+        """Drops the mirrored alerts and comments of a case.
+
+        Tools that change a case's alerts or comments call this, since SOAR
+        may not update the case's modification time for such changes. The
+        case is served from the API until the next sync fetches them again.
+        """
+        await asyncio.to_thread(self._drop_related, str(case_id))
+
+    def _get_related(self, case_id: str) -> List[Tuple[Optional[str], str]]:
+        with self._db_lock:
+            return [
+                self._db.execute(
+                    f"SELECT modified, data FROM {table} WHERE case_id = ?", (case_id,)
+                ).fetchone()
+                for table in _RELATED_TABLES
+            ]
+
+    async def get_related(
+        self, case_id: str, modified: Any
+    ) -> Optional[Tuple[Any, Any]]:
+        """Returns the mirrored alerts and comments responses of a case.
+
+        Args:
+            case_id: The case ID.
+            modified: The case's current modification time, as just fetched.
+
+        Returns:
+            (alerts, comments), or None unless both were mirrored at that
+            modification time.
+        """
+        if not self.ready or modified is None:
+            return None
+        rows = await asyncio.to_thread(self._get_related, str(case_id))
+        if any(row is None or row[0] != str(modified) for row in rows):
+            return None
+        return tuple(json.loads(row[1]) for row in rows)
+
+    async def list_page(
+        self, page_token: Optional[str], page_size: Optional[int]
+    ) -> Optional[Dict[str, Any]]:
+        """Serves a list_cases page, most recently modified cases first.
+
+        Returns:
+            The cases and the next page token, or None if the mirror cannot
+            serve the page (it is not ready or the token is an API token).
+
+        Raises:
+            ValueError: If a mirror page token is malformed.
+        """
+        if not self.ready:
+            return None
+        if page_token and not page_token.startswith(PAGE_TOKEN_PREFIX):
+            return None
+        offset = 0
+        if page_token:
+            offset_text = page_token[len(PAGE_TOKEN_PREFIX) :]
+            if not offset_text.isdigit():
+                raise ValueError(f"Invalid page token: {page_token}")
+            offset = int(offset_text)
+        page_size = page_size or DEFAULT_PAGE_SIZE
+        cases = await self.query_cases(limit=page_size + 1, offset=offset)
+        result = {"cases": cases[:page_size]}
+        if len(cases) > page_size:
+            result["nextPageToken"] = f"{PAGE_TOKEN_PREFIX}{offset + page_size}"
+        return result
+
+    async def _sync_loop(self):
+        while True:
+            full = time.monotonic() - self._last_full_sync >= FULL_SYNC_INTERVAL
+            try:
+                await self.sync(full=full)
+            except Exception as e:
+                logger.warning("Case mirror sync failed: %s", e)
+            await asyncio.sleep(self.poll_interval)
+
+    def start(self):
+        """Starts syncing the mirror in the background."""
+        if self._sync_task is None:
+            self._sync_task = asyncio.create_task(self._sync_loop())
+
+    async def close(self):
+        """Stops the background sync and closes the database."""
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            try:
+                await self._sync_task
+            except asyncio.CancelledError:
+                pass
+            self._sync_task = None
+        with self._db_lock:
+            self._db.close()
+
+
+def register_tools(mcp: FastMCP, mirror: CaseMirror):
+    @mcp.tool()
+    async def query_cases(
+        filters: Annotated[
+            Optional[Dict[str, Any]],
+            Field(
+                default=None,
+                description='Case field values to match, e.g. {"status": "Opened", "priority": "PriorityHigh"}.',
+            ),
+        ],
+        text: Annotated[
+            Optional[str],
+            Field(default=None, description="A substring to search for in the cases."),
+        ],
+        order_by: Annotated[
+            Optional[str],
+            Field(
+                default=None,
+                description="The case field to sort by. Defaults to the last modification time.",
+            ),
+        ],
+        descending: Annotated[
+            bool, Field(default=True, description="Whether to sort in descending order.")
+        ],
+        limit: Annotated[
+            int,
+            Field(
+                default=100,
+                ge=1,
+                le=MAX_QUERY_LIMIT,
+                description="The maximum number of cases to return.",
+            ),
+        ],
+        offset: Annotated[
+            int, Field(default=0, ge=0, description="The number of cases to skip.")
+        ],
+    ) -> dict:
+        """Filter and sort SOAR cases from the local case mirror.
+
+        The server keeps a local copy of the SOAR cases that is refreshed in the
+        background, so this tool answers in milliseconds and can be called repeatedly
+        while triaging. Cases are returned as the SOAR API returns them; recent changes
+        may take up to the mirror's poll interval to appear.
+
+        Args:
+            filters (Optional[Dict[str, Any]]): Case field values to match, by field
+                               name. Use dots for nested fields (e.g. "assignee.name").
+                               Values are strings, numbers, booleans or null.
+            text (Optional[str]): A case-insensitive substring to search for anywhere in the case.
+            order_by (Optional[str]): The case field to sort by (e.g. "priority").
+            descending (bool): Whether to sort in descending order.
+            limit (int): The maximum number of cases to return.
+            offset (int): The number of matching cases to skip, for paging.
+
+        Returns:
+            dict: 'cases' with the matching case objects, or 'Status' and 'Message' if
+                  the mirror has not finished its first sync yet.
+
+        **Next Steps (using MCP-enabled tools):**
+        - Use `get_case_full_details` for the alerts and comments of a case of interest;
+          they are served from the mirror while it is up to date.
+        """
+        if not mirror.ready:
+            return {
+                "Status": "Failed",
+                "Message": "The case mirror is not ready yet; use list_cases instead.",
+            }
+        try:
+            cases = await mirror.query_cases(
+                filters, text, order_by, descending, limit, offset
+            )
+        except ValueError as e:
+            return {"Status": "Failed", "Message": str(e)}
+        return {"cases": cases}
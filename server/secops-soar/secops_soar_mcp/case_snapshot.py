@@ -0,0 +1,206 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Builds deep snapshots of SOAR cases with bounded concurrent fan-out."""
+
+import asyncio
+from typing import Any, Awaitable, Dict, Iterator, List, Optional
+
+from logger_utils import get_logger
+from secops_soar_mcp.http_client import HttpClient
+from secops_soar_mcp.utils.consts import Endpoints
+
+logger = get_logger(__name__)
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_BRANCH_TIMEOUT = 30
+MAX_ENTITIES = 200
+
+
+def _items(response: Any) -> List[Any]:
+    if isinstance(response, list):
+        return response
+    if isinstance(response, dict):
+        for value in response.values():
+            if isinstance(value, list):
+                return value
+    return []
+
+
+def _find_entities(response: Any) -> Iterator[Dict[str, Any]]:
+    """Yields every entity object found anywhere in an entities response."""
+    if isinstance(response, list):
+        for value in response:
+            yield from _find_entities(value)
+    elif isinstance(response, dict):
+        if "identifier" in response and (
+            "entityType" in response or "type" in response
+        ):
+            yield response
+            return
+        for value in response.values():
+            yield from _find_entities(value)
+
+
+class CaseSnapshot:
+    """Fetches a case and everything it references into one structure.
+
+    Every request runs as a separate branch, at most `concurrency` at a time
+    and each bounded by `branch_timeout` seconds. A failed or timed out branch
+    is recorded in `errors` and leaves its part of the snapshot as None, so a
+    slow alert never costs the rest of the snapshot.
+    """
+
+    def __init__(
+        self,
+        http_client: HttpClient,
+        case_id: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        branch_timeout: float = DEFAULT_BRANCH_TIMEOUT,
+    ):
+        self.http_client = http_client
+        self.case_id = case_id
+        self.branch_timeout = branch_timeout
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.errors: List[Dict[str, str]] = []
+
+    async def _branch(self, name: str, request: Awaitable[Any]) -> Optional[Any]:
+        try:
+            async with self._semaphore:
+                response = await asyncio.wait_for(request, self.branch_timeout)
+        except asyncio.TimeoutError:
+            self.errors.append({"branch": name, "error": "Timed out"})
+            return None
+        except Exception as e:
+            self.errors.append({"branch": name, "error": str(e)})
+            return None
+        if response is None:
+            self.errors.append({"branch": name, "error": "Request failed"})
+        return response
+
+    async def _alert_events(self, alert: Dict[str, Any]) -> Dict[str, Any]:
+        alert_id = str(alert.get("id"))
+        events = await self._branch(
+            f"events:{alert_id}",
+            self.http_client.get(
+                Endpoints.LIST_INVOLVED_EVENTS_BY_ALERT.format(
+                    CASE_ID=self.case_id, ALERT_ID=alert_id
+                )
+            ),
+        )
+        return {
+            "alert_id": alert_id,
+            "alert_group_identifier": alert.get("alertGroupIdentifier"),
+            "events": events,
+        }
+
+    async def _group_entities(self, group: str) -> Optional[Any]:
+        return await self._branch(
+            f"entities:{group}",
+            self.http_client.post(
+                Endpoints.GET_ALERT_GROUP_IDENTIFIERS_ENTITIES,
+                req={"caseId": self.case_id, "alertGroupIdentifiers": [group]},
+            ),
+        )
+
+    async def _entity_details(self, entity: Dict[str, Any]) -> Dict[str, Any]:
+        details = await self._branch(
+            f"entity:{entity['identifier']}",
+            self.http_client.post(
+                Endpoints.FETCH_FULL_UNIQUE_ENTITY,
+                req={
+                    "EntityIdentifier": entity["identifier"],
+                    "EntityType": entity["type"],
+                    "EntityEnvironment": entity["environment"],
+                    "LastCaseType": 0,
+                    "CaseDistributionType": 0,
+                },
+            ),
+        )
+        return {**entity, "details": details}
+
+    async def build(self) -> Dict[str, Any]:
+        """Fetches the snapshot.
+
+        Returns:
+            The case details, alerts and comments as returned by the API, plus
+            the events of every alert, the entities of every alert group, the
+            details of every distinct entity and the errors of failed branches.
+        """
+        case, alerts, comments = await asyncio.gather(
+            self._branch(
+                "case",
+                self.http_client.get(
+                    Endpoints.BASE_SPECIFIC_CASE_URL.format(CASE_ID=self.case_id)
+                ),
+            ),
+            self._branch(
+                "alerts",
+                self.http_client.get(
+                    Endpoints.BASE_ALERT_URL.format(CASE_ID=self.case_id)
+                ),
+            ),
+            self._branch(
+                "comments",
+                self.http_client.get(
+                    Endpoints.BASE_CASE_COMMENTS_URL.format(CASE_ID=self.case_id)
+                ),
+            ),
+        )
+        alert_items = [a for a in _items(alerts) if isinstance(a, dict)]
+        groups = list(
+            dict.fromkeys(
+                a["alertGroupIdentifier"]
+                for a in alert_items
+                if a.get("alertGroupIdentifier")
+            )
+        )
+        default_environment = (case or {}).get("environment", "")
+
+        # Events and entities do not depend on each other, so both fan out at
+        # once; entity details only start once their group has been listed.
+        async def groups_and_entities():
+            responses = await asyncio.gather(*map(self._group_entities, groups))
+            entities = {}
+            for entity in _find_entities(responses):
+                key = (
+                    entity["identifier"],
+                    entity.get("entityType") or entity.get("type"),
+                    entity.get("environment") or default_environment,
+                )
+                entities.setdefault(key, None)
+            truncated = len(entities) > MAX_ENTITIES
+            details = await asyncio.gather(
+                *(
+                    self._entity_details(
+                        {"identifier": i, "type": t, "environment": env}
+                    )
+                    for i, t, env in list(entities)[:MAX_ENTITIES]
+                )
+            )
+            return dict(zip(groups, responses)), details, truncated
+
+        alert_events, (group_entities, entities, truncated) = await asyncio.gather(
+            asyncio.gather(*map(self._alert_events, alert_items)),
+            groups_and_entities(),
+        )
+        return {
+            "case_details:": case,
+            "case_alerts": alerts,
+            "case_comments": comments,
+            "alert_events": list(alert_events),
+            "alert_group_entities": group_entities,
+            "entities": entities,
+            "entities_truncated": truncated,
+            "errors": self.errors,
+        }
@@ -13,26 +13,142 @@
 # limitations under the License.
 """HTTP client for making requests to the SecOps SOAR API."""
 
+import asyncio
 import json
-from typing import Any, Dict
+import os
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import aiohttp
 from logger_utils import get_logger
+from secops_soar_mcp.utils import consts
+from secops_soar_mcp.utils.json_decoder import JsonDecoder, default_decoder
 
 logger = get_logger(__name__)
 
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+# Statuses for which the server did not process the request, so retrying is
+# safe even for requests with side effects (e.g. executing an action).
+REJECTED_STATUSES = {429, 503}
+IDEMPOTENT_METHODS = {"GET"}
+
+
+@dataclass
+class TransportConfig:
+    """Connection pool, timeout and retry settings of the HTTP client."""
+
+    pool_size: int = 100
+    pool_size_per_host: int = 20
+    connect_timeout: float = 10.0
+    read_timeout: float = 120.0
+    dns_cache_ttl: int = 300
+    keepalive_timeout: float = 30.0
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    response_cache_ttl: float = 5.0
+    response_cache_size: int = 256
+
+    @classmethod
+    def from_env(cls) -> "TransportConfig":
+        """Builds a config, overriding defaults with SOAR_HTTP_* variables."""
+        config = cls()
+        types = {setting.name: setting.type for setting in fields(cls)}
+        for name, env_var in consts.ENV_SOAR_HTTP_SETTINGS.items():
+            value = os.getenv(env_var)
+            if value:
+                setattr(config, name, types[name](value))
+        return config
+
+
+@dataclass
+class Page:
+    """One page of a paginated listing."""
+
+    items: List[Any]
+    # Key of the items in the response object, None for bare array responses.
+    items_key: Optional[str]
+    # The token this page was fetched with, None for the first page.
+    page_token: Optional[str]
+    next_page_token: Optional[str]
+    # The other top-level values of the response (e.g. a total count).
+    fields: Dict[str, Any] = field(default_factory=dict)
+
+
+def _page_items(response: Any, items_key: Optional[str]) -> Tuple[Optional[str], List[Any]]:
+    if isinstance(response, list):
+        return None, response
+    if items_key is not None:
+        return items_key, response.get(items_key) or []
+    # Listings hold their items in the only list-valued key of the response.
+    for key, value in response.items():
+        if isinstance(value, list):
+            return key, value
+    return None, []
+
+
+def _retry_after(response: aiohttp.ClientResponse) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
 
 class HttpClient:
     """HTTP client for making requests to the SecOps SOAR API."""
 
-    def __init__(self, base_url: str, app_key: str):
+    def __init__(
+        self,
+        base_url: str,
+        app_key: str,
+        config: Optional[TransportConfig] = None,
+        decoder: Optional[JsonDecoder] = None,
+    ):
         self.base_url = base_url
         self.app_key = app_key
+        self.config = config or TransportConfig()
+        # Decodes response bodies straight from bytes (orjson if installed).
+        self.decoder = decoder or default_decoder()
         self._session = None
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Raw response bodies, decoded again for every caller so that callers
+        # never share (and cannot corrupt) a cached object.
+        # At most response_cache_size entries, least recently used first;
+        # values are (body, expiry).
+        self._response_cache: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        # Bumped before and after every write, so that GETs started before
+        # the write completed do not cache their (possibly stale) responses.
+        self._cache_generation = 0
 
     def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(
+                limit=self.config.pool_size,
+                limit_per_host=self.config.pool_size_per_host,
+                use_dns_cache=self.config.dns_cache_ttl > 0,
+                ttl_dns_cache=self.config.dns_cache_ttl or None,
+                keepalive_timeout=self.config.keepalive_timeout,
+            )
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=self.config.connect_timeout,
+                sock_read=self.config.read_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=timeout
+            )
         return self._session
 
     async def _get_headers(self):
@@ -41,32 +157,245 @@ class HttpClient:
             headers["AppKey"] = self.app_key
         return headers
 
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.config.backoff_max)
+        # Full jitter, so that concurrent callers do not retry in lockstep.
+        return random.uniform(
+            0, min(self.config.backoff_max, self.config.backoff_base * 2**attempt)
+        )
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        req: Dict[str, Any] = None,
+        params: Dict[str, Any] = None,
+        decode: bool = True,
+    ):
+        """Sends a request, retrying throttled and failed attempts.
+
+        Returns:
+            The decoded JSON response (the raw body if not `decode`), or None
+            if an error occurred.
+        """
+        headers = await self._get_headers()
+        idempotent = method in IDEMPOTENT_METHODS
+        retryable = RETRYABLE_STATUSES if idempotent else REJECTED_STATUSES
+        attempt = 0
+        while True:
+            retry_after = None
+            try:
+                async with self._get_session().request(
+                    method,
+                    self.base_url + endpoint,
+                    json=req,
+                    params=params,
+                    headers=headers,
+                ) as response:
+                    if (
+                        response.status in retryable
+                        and attempt < self.config.max_retries
+                    ):
+                        retry_after = _retry_after(response)
+                        logger.debug(
+                            "%s %s returned %s, retrying",
+                            method,
+                            endpoint,
+                            response.status,
+                        )
+                    else:
+                        response.raise_for_status()  # Raise an exception for 4xx/5xx responses
+                        data = await response.read()
+                        return self.decoder(data) if decode else data
+            except aiohttp.ClientResponseError as e:
+                logger.debug("HTTP error occurred: %s", e)
+                return None
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if not idempotent or attempt >= self.config.max_retries:
+                    logger.debug("An error occurred: %s", e)
+                    return None
+                logger.debug("%s %s failed (%s), retrying", method, endpoint, e)
+            except Exception as e:
+                logger.debug("An error occurred: %s", e)
+                return None
+            await asyncio.sleep(self._backoff(attempt, retry_after))
+            attempt += 1
+
+    @staticmethod
+    def _request_key(endpoint: str, params: Optional[Dict[str, Any]]) -> str:
+        return endpoint + "?" + json.dumps(params or {}, sort_keys=True, default=str)
+
+    def _invalidate_responses(self):
+        """Drops cached responses and detaches in-flight GETs.
+
+        GETs already in flight finish for their callers, but are neither
+        cached nor shared with later callers.
+        """
+        self._cache_generation += 1
+        self._response_cache.clear()
+        self._inflight.clear()
+
+    async def _write(
+        self,
+        method: str,
+        endpoint: str,
+        req: Dict[str, Any],
+        params: Dict[str, Any],
+    ):
+        """Sends a write, invalidating responses before and after it."""
+        self._invalidate_responses()
+        try:
+            return await self._request(method, endpoint, req=req, params=params)
+        finally:
+            # GETs sent while the write was in flight may hold pre-write data.
+            self._invalidate_responses()
+
+    def _on_get_done(self, key: str, generation: int, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if generation != self._cache_generation:
+            return
+        result = task.result()
+        if result is None or self.config.response_cache_ttl <= 0:
+            return
+        now = time.monotonic()
+        for stale in [k for k, (_, expiry) in self._response_cache.items() if expiry <= now]:
+            del self._response_cache[stale]
+        self._response_cache[key] = (result, now + self.config.response_cache_ttl)
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > max(1, self.config.response_cache_size):
+            self._response_cache.popitem(last=False)
+
+    def _cached_response(self, key: str) -> Optional[bytes]:
+        cached = self._response_cache.get(key)
+        if cached is None:
+            return None
+        if cached[1] <= time.monotonic():
+            del self._response_cache[key]
+            return None
+        self._response_cache.move_to_end(key)
+        return cached[0]
+
     async def get(
         self,
         endpoint: str,
         params: Dict[str, Any] = None,
+        use_cache: bool = True,
     ):
         """Makes a GET request to the specified endpoint.
 
+        Concurrent calls with the same endpoint and params share a single
+        upstream request, and successful responses are reused for
+        `response_cache_ttl` seconds. Every caller gets its own decoded copy.
+
         Args:
             endpoint: The API endpoint to send the request to.
             params: Query parameters as a dictionary.
+            use_cache: Whether a recently cached response may be returned.
 
         Returns:
             The response as a JSON object, or None if an error occurred.
         """
-        headers = await self._get_headers()
+        key = self._request_key(endpoint, params)
+        data = None
+        if use_cache:
+            data = self._cached_response(key)
+        if data is None:
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(
+                    self._request("GET", endpoint, params=params, decode=False)
+                )
+                self._inflight[key] = task
+                generation = self._cache_generation
+                task.add_done_callback(
+                    lambda t: self._on_get_done(key, generation, t)
+                )
+            # Shield the shared request so that one cancelled caller does not
+            # cancel it for the others.
+            data = await asyncio.shield(task)
+            if data is None:
+                return None
         try:
-            async with self._get_session().get(
-                self.base_url + endpoint, params=params, headers=headers
-            ) as response:
-                response.raise_for_status()  # Raise an exception for 4xx/5xx responses
-                return await response.json()
-        except aiohttp.ClientResponseError as e:
-            logger.debug("HTTP error occurred: %s", e)
+            return self.decoder(data)
         except Exception as e:
             logger.debug("An error occurred: %s", e)
-        return None
+            return None
+
+    async def paginate(
+        self,
+        endpoint: str,
+        params: Dict[str, Any] = None,
+        page_token: Optional[str] = None,
+        page_size: Optional[int] = None,
+        items_key: Optional[str] = None,
+        odata: bool = False,
+    ) -> AsyncIterator[Page]:
+        """Walks a paginated listing one page at a time.
+
+        By default pages are requested with `pageToken`/`pageSize` and followed
+        through the `nextPageToken` of each response. With `odata`, pages are
+        requested with `$top`/`$skip` instead, and the page tokens are the
+        `$skip` offsets.
+
+        Args:
+            endpoint: The API endpoint to send the requests to.
+            params: Query parameters sent with every page request.
+            page_token: The token of the first page to fetch.
+            page_size: The number of items to request per page.
+            items_key: The response key holding the items. If not given, the
+                only list-valued key of the response is used.
+            odata: Whether to page with `$top`/`$skip`.
+
+        Yields:
+            The fetched pages, in order.
+
+        Raises:
+            RuntimeError: If a page could not be fetched.
+        """
+        while True:
+            page_params = dict(params or {})
+            if odata:
+                skip = int(page_token or 0)
+                page_params["$skip"] = skip
+                if page_size:
+                    page_params["$top"] = page_size
+            else:
+                if page_token:
+                    page_params["pageToken"] = page_token
+                if page_size:
+                    page_params["pageSize"] = page_size
+            response = await self.get(endpoint, params=page_params or None)
+            if response is None:
+                raise RuntimeError(f"Failed to fetch a page of {endpoint}")
+            key, items = _page_items(response, items_key)
+            if odata:
+                # A short page is the last one.
+                next_page_token = (
+                    str(skip + len(items))
+                    if page_size and len(items) >= page_size
+                    else None
+                )
+            elif isinstance(response, dict):
+                next_page_token = response.get("nextPageToken") or None
+            else:
+                next_page_token = None
+            fields = (
+                {
+                    name: value
+                    for name, value in response.items()
+                    if name not in (key, "nextPageToken")
+                }
+                if isinstance(response, dict)
+                else {}
+            )
+            yield Page(items, key, page_token, next_page_token, fields)
+            if next_page_token is None:
+                return
+            page_token = next_page_token
 
     async def post(
         self,
@@ -84,20 +413,10 @@ class HttpClient:
         Returns:
             The response as a JSON object, or None if an error occurred.
         """
-        headers = await self._get_headers()
-        try:
-            async with self._get_session().post(
-                self.base_url + endpoint, json=req, params=params, headers=headers
-            ) as response:
-                response.raise_for_status()
-                data = await response.content.read()
-                decoded_data = data.decode("utf-8")
-                return json.loads(decoded_data)
-        except aiohttp.ClientResponseError as e:
-            logger.debug("HTTP error occurred: %s", e)
-        except Exception as e:
-            logger.debug("An error occurred: %s", e)
-        return None
+        # Lookups sent as POSTs leave cached GET responses valid.
+        if endpoint in consts.READ_ONLY_POST_ENDPOINTS:
+            return await self._request("POST", endpoint, req=req, params=params)
+        return await self._write("POST", endpoint, req, params)
 
     async def patch(
         self,
@@ -115,18 +434,7 @@ class HttpClient:
         Returns:
             The response as a JSON object, or None if an error occurred.
         """
-        headers = await self._get_headers()
-        try:
-            async with self._get_session().patch(
-                self.base_url + endpoint, json=req, params=params, headers=headers
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
-        except aiohttp.ClientResponseError as e:
-            logger.debug("HTTP error occurred: %s", e)
-        except Exception as e:
-            logger.debug("An error occurred: %s", e)
-        return None
+        return await self._write("PATCH", endpoint, req, params)
 
     async def close(self):
         await self._get_session().close()
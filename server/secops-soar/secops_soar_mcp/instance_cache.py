@@ -0,0 +1,117 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""TTL cache for SOAR integration instance identifiers."""
+
+import asyncio
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from logger_utils import get_logger
+from secops_soar_mcp.http_client import HttpClient
+from secops_soar_mcp.utils.consts import Endpoints
+
+logger = get_logger(__name__)
+
+
+class InstanceCache:
+    """Caches the integration instance identifier used to execute actions.
+
+    Every marketplace action needs the identifier of an integration instance,
+    which rarely changes. Identifiers are kept for `ttl` seconds and refreshed
+    in the background for every integration the cache has seen.
+    """
+
+    def __init__(self, http_client: HttpClient, ttl: float):
+        self.http_client = http_client
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[str, float]] = {}
+        self._integrations = set()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def _fetch(self, integration: str) -> Optional[str]:
+        response = await self.http_client.get(
+            Endpoints.LIST_INTEGRATION_INSTANCES.format(INTEGRATION_NAME=integration)
+        )
+        if response is None:
+            raise RuntimeError(f"Failed to list instances of {integration}")
+        instances = response.get("integration_instances", [])
+        if not instances:
+            return None
+        return instances[0].get("identifier")
+
+    async def get(self, integration: str) -> Optional[str]:
+        """Returns the instance identifier of an integration.
+
+        Args:
+            integration: The SOAR integration name (e.g. "Alexa").
+
+        Returns:
+            The identifier of the first instance, or None if the integration has
+            no instance. Missing instances are not cached.
+
+        Raises:
+            RuntimeError: If the instances could not be listed.
+        """
+        self._integrations.add(integration)
+        entry = self._entries.get(integration)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+        return await self._load(integration)
+
+    async def _load(self, integration: str) -> Optional[str]:
+        identifier = await self._fetch(integration)
+        if identifier:
+            self._entries[integration] = (identifier, time.monotonic() + self.ttl)
+        else:
+            self._entries.pop(integration, None)
+        return identifier
+
+    def invalidate(self, integration: str):
+        """Drops the cached identifier so the next lookup fetches it again."""
+        if self._entries.pop(integration, None) is not None:
+            logger.debug("Invalidated instance identifier of %s", integration)
+
+    async def refresh(self, integrations: Iterable[str] = ()):
+        """Fetches the identifiers of the given and all known integrations."""
+        self._integrations.update(integrations)
+        integrations = list(self._integrations)
+        results = await asyncio.gather(
+            *(self._load(integration) for integration in integrations),
+            return_exceptions=True,
+        )
+        for integration, result in zip(integrations, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "Failed to refresh instance of %s: %s", integration, result
+                )
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.ttl / 2)
+            await self.refresh()
+
+    def start(self):
+        """Starts refreshing the cached identifiers in the background."""
+        if self._refresh_task is None and self.ttl > 0:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def close(self):
+        """Stops the background refresh."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
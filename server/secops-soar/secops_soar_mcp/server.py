@@ -16,8 +16,7 @@
 import asyncio
 import importlib
 from pathlib import Path
-from secops_soar_mcp import bindings
-from mcp.server.fastmcp import FastMCP
+from secops_soar_mcp import action_manifest, bindings, bulk_actions, case_mirror
 from logger_utils import get_logger, setup_logging
 from secops_soar_mcp.case_management import (
     register_tools as register_tools_case_management,
@@ -26,7 +25,7 @@ from secops_soar_mcp.utils.utils import normalize_integration_name
 import argparse
 
 logger = get_logger(__name__)
-mcp = FastMCP("SecOps SOAR")
+mcp = action_manifest.ManifestServer("SecOps SOAR")
 
 register_tools_case_management(mcp)
 
@@ -70,90 +69,121 @@ def get_enabled_integrations_set(integrations_arg: str) -> set:
 def register_tools(integrations_arg: str):
     """Register tools for the MCP server.
 
+    Integrations found in the marketplace manifest are registered through the
+    generic action executor. Any other enabled integration is looked up as a
+    module in the marketplace directory.
+
     Args:
-        args: Parsed command line arguments."""
+        args: Parsed command line arguments.
+
+    Returns:
+        The SOAR names of the integrations registered from the manifest."""
     enabled_integrations_set = get_enabled_integrations_set(integrations_arg)
+    manifest_integrations = set()
+    if not enabled_integrations_set:
+        return manifest_integrations
 
     logger.info("Starting dynamic tool registration...")
     try:
-        script_dir = Path(__file__).parent.resolve()
+        manifest_actions = action_manifest.load_manifest(enabled_integrations_set)
+        actions = {}
+        for module_stem, rows in manifest_actions.items():
+            logger.info(
+                "    Registering %d actions for %s from the manifest.",
+                len(rows),
+                module_stem,
+            )
+            actions.update(action_manifest.register_tools(mcp, rows))
+            manifest_integrations.update(row["integration"] for row in rows)
+        if actions:
+            bulk_actions.register_tools(mcp, actions)
+        register_module_tools(enabled_integrations_set - manifest_actions.keys())
+    except Exception as e:
+        logger.error(
+            "An unexpected error occurred during tool registration setup: %s",
+            e,
+            exc_info=True,
+        )
+    return manifest_integrations
+
+
+def register_module_tools(module_stems: set):
+    """Register tools from integration modules in the marketplace directory.
 
-        marketplace_dir = script_dir / "marketplace"
+    Args:
+        module_stems: Names of the modules to import (e.g., "csv")."""
+    if not module_stems:
+        return
+
+    script_dir = Path(__file__).parent.resolve()
 
-        if marketplace_dir.is_dir():
-            logger.debug("Scanning for tools in: %s", marketplace_dir)
+    marketplace_dir = script_dir / "marketplace"
+
+    if not marketplace_dir.is_dir():
+        logger.warning(
+            "Marketplace directory not found at %s. No tools dynamically registered.",
+            marketplace_dir,
+        )
+        return
 
-            init_file = marketplace_dir / "__init__.py"
-            if not init_file.exists():
+    logger.debug("Scanning for tools in: %s", marketplace_dir)
+
+    init_file = marketplace_dir / "__init__.py"
+    if not init_file.exists():
+        logger.warning(
+            "Marketplace directory '%s' is missing __init__.py. Tool registration might fail.",
+            marketplace_dir,
+        )
+
+    for module_stem in sorted(module_stems):
+        py_file = marketplace_dir / f"{module_stem}.py"
+        if not py_file.is_file():
+            logger.warning(
+                "  Integration %s was not found in the manifest or the marketplace directory.",
+                module_stem,
+            )
+            continue
+        module_import_path = f"marketplace.{module_stem}"  # The import path (e.g., "marketplace.csv")
+
+        try:
+            logger.debug("  Attempting to import module: %s", module_import_path)
+            module = importlib.import_module(module_import_path)
+
+            if hasattr(module, "register_tools") and callable(
+                getattr(module, "register_tools")
+            ):
+                logger.info(
+                    "    Found register_tools in %s. Registering...",
+                    module_stem,
+                )
+                register_function = getattr(module, "register_tools")
+                register_function(mcp)
+                logger.debug(
+                    "    Successfully called register_tools for %s.",
+                    module_stem,
+                )
+            else:
                 logger.warning(
-                    "Marketplace directory '%s' is missing __init__.py. Tool registration might fail.",
-                    marketplace_dir,
+                    "    Module %s found, but it has no callable 'register_tools' function.",
+                    module_stem,
                 )
 
-            for py_file in marketplace_dir.glob("*.py"):
-                if py_file.name == "__init__.py" or not py_file.is_file():
-                    continue
-
-                module_stem = (
-                    py_file.stem
-                )  # The filename without .py (e.g., "csv")
-                if module_stem not in enabled_integrations_set:
-                    continue
-                module_import_path = f"marketplace.{module_stem}"  # The import path (e.g., "marketplace.csv")
-
-                try:
-                    logger.debug(
-                        "  Attempting to import module: %s", module_import_path
-                    )
-                    module = importlib.import_module(module_import_path)
-
-                    if hasattr(module, "register_tools") and callable(
-                        getattr(module, "register_tools")
-                    ):
-                        logger.info(
-                            "    Found register_tools in %s. Registering...",
-                            module_stem,
-                        )
-                        register_function = getattr(module, "register_tools")
-                        register_function(mcp)
-                        logger.debug(
-                            "    Successfully called register_tools for %s.",
-                            module_stem,
-                        )
-                    else:
-                        logger.warning(
-                            "    Module %s found, but it has no callable 'register_tools' function.",
-                            module_stem,
-                        )
-
-                except ImportError as e:
-                    logger.error(
-                        "  * Failed to import module %s. Error: %s",
-                        module_import_path,
-                        e,
-                        exc_info=True,
-                    )
-                except Exception as e:
-                    logger.error(
-                        "  * Failed during registration call for module %s. Error: %s",
-                        module_import_path,
-                        e,
-                        exc_info=True,
-                    )
-
-            logger.info("Finished scanning marketplace directory.")
-        else:
-            logger.warning(
-                "Marketplace directory not found at %s. No tools dynamically registered.",
-                marketplace_dir,
+        except ImportError as e:
+            logger.error(
+                "  * Failed to import module %s. Error: %s",
+                module_import_path,
+                e,
+                exc_info=True,
+            )
+        except Exception as e:
+            logger.error(
+                "  * Failed during registration call for module %s. Error: %s",
+                module_import_path,
+                e,
+                exc_info=True,
             )
 
-    except Exception as e:
-        logger.error(
-            "An unexpected error occurred during tool registration setup: %s",
-            e,
-            exc_info=True,
-        )
+    logger.info("Finished scanning marketplace directory.")
 
 
 async def main():
@@ -163,7 +193,12 @@ async def main():
     logger.info("Starting SecOps SOAR MCP server")
     try:
         await bindings.bind()
-        register_tools(args.integrations)
+        integrations = register_tools(args.integrations)
+        await bindings.instance_cache.refresh(integrations)
+        bindings.instance_cache.start()
+        if bindings.case_mirror is not None:
+            case_mirror.register_tools(mcp, bindings.case_mirror)
+            bindings.case_mirror.start()
         await mcp.run_stdio_async()
     except Exception as e:
         logger.error("Error: %s", e)
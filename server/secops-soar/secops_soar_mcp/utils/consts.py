@@ -15,6 +15,27 @@
 
 ENV_SOAR_URL = "SOAR_URL"
 ENV_SOAR_APP_KEY = "SOAR_APP_KEY"
+ENV_SOAR_INSTANCE_CACHE_TTL = "SOAR_INSTANCE_CACHE_TTL"
+
+ENV_SOAR_CASE_MIRROR_PATH = "SOAR_CASE_MIRROR_PATH"
+ENV_SOAR_CASE_MIRROR_POLL_INTERVAL = "SOAR_CASE_MIRROR_POLL_INTERVAL"
+
+DEFAULT_INSTANCE_CACHE_TTL = 300
+DEFAULT_CASE_MIRROR_POLL_INTERVAL = 60
+
+# Environment variables overriding the HttpClient transport settings, keyed by
+# the TransportConfig field they set.
+ENV_SOAR_HTTP_SETTINGS = {
+    "pool_size": "SOAR_HTTP_POOL_SIZE",
+    "pool_size_per_host": "SOAR_HTTP_POOL_SIZE_PER_HOST",
+    "connect_timeout": "SOAR_HTTP_CONNECT_TIMEOUT",
+    "read_timeout": "SOAR_HTTP_READ_TIMEOUT",
+    "dns_cache_ttl": "SOAR_HTTP_DNS_CACHE_TTL",
+    "keepalive_timeout": "SOAR_HTTP_KEEPALIVE_TIMEOUT",
+    "max_retries": "SOAR_HTTP_MAX_RETRIES",
+    "response_cache_ttl": "SOAR_HTTP_RESPONSE_CACHE_TTL",
+    "response_cache_size": "SOAR_HTTP_RESPONSE_CACHE_SIZE",
+}
 
 
 class Endpoints:
@@ -40,3 +61,14 @@ class Endpoints:
     LIST_INVOLVED_EVENTS_BY_ALERT = (
         "/api/1p/external/v1.0/cases/{CASE_ID}/alerts/{ALERT_ID}/involvedEvents"
     )
+
+
+# POST endpoints that only read data; calling them does not invalidate cached
+# GET responses.
+READ_ONLY_POST_ENDPOINTS = frozenset(
+    {
+        Endpoints.FETCH_FULL_UNIQUE_ENTITY,
+        Endpoints.SEARCH_ENTITY,
+        Endpoints.GET_ALERT_GROUP_IDENTIFIERS_ENTITIES,
+    }
+)
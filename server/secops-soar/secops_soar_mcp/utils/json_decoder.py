@@ -0,0 +1,34 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""JSON decoding helpers for SOAR API responses."""
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency
+    orjson = None
+
+JsonDecoder = Callable[[bytes], Any]
+
+
+def default_decoder() -> JsonDecoder:
+    """Returns orjson.loads if orjson is installed, json.loads otherwise.
+
+    Both decode UTF-8 bytes directly, without an intermediate str copy.
+    """
+    if orjson is not None:
+        return orjson.loads
+    return json.loads
@@ -0,0 +1,292 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Builds the marketplace action manifest from generated integration modules.
+
+The marketplace code generator emits one Python module per integration, with
+one `@mcp.tool()` closure per action. All of those closures share the same
+body and only differ in the integration name, the action name and the script
+parameters, so this script extracts those differences into one JSON row per
+action. Each row also carries the precomputed JSON schema of its action
+parameters, so the server can list tools without building their argument
+models. The server registers tools from the resulting manifest instead of
+importing the modules.
+
+The manifest is the source of truth for the actions it lists: each row keeps
+the parameter names, types, descriptions and script keys its schema is built
+from. `--refresh` rebuilds the descriptions and schemas from those rows (e.g. after a pydantic
+upgrade changes schema generation) and `--check` reports rows whose stored
+description or schema differs from the rebuilt one. Generated modules are only needed to add
+or regenerate integrations; the modules the current manifest was built from
+can be restored from the git history of `marketplace/`.
+
+Usage:
+    python -m secops_soar_mcp.utils.manifest_builder <modules_dir> [--output PATH]
+    python -m secops_soar_mcp.utils.manifest_builder --refresh [--output PATH]
+    python -m secops_soar_mcp.utils.manifest_builder --check [--output PATH]
+"""
+
+import argparse
+import ast
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from mcp.server.fastmcp.tools import Tool
+
+from secops_soar_mcp.action_manifest import build_tool
+
+# Parameters every generated action takes; they are handled by the executor
+# and therefore not stored per row.
+COMMON_PARAMETERS = ("case_id", "alert_group_identifiers", "target_entities", "scope")
+SUPPORTED_TYPES = {"str", "bool", "List[str]", "Union[str, dict]", "EmailContent"}
+# "Returns:" at any indentation, after a blank line or at the very start.
+RETURNS_SECTION = re.compile(r"(?:\A|\n[ \t]*\n)[ \t]*Returns:")
+DEFAULT_MANIFEST_PATH = (
+    Path(__file__).resolve().parent.parent / "marketplace" / "manifest.jsonl"
+)
+
+
+class ManifestBuildError(Exception):
+    """Raised when a generated action does not follow the expected template."""
+
+
+def _parse_parameter(arg: ast.arg) -> Dict[str, Any]:
+    annotation = arg.annotation
+    if not (
+        isinstance(annotation, ast.Subscript)
+        and ast.unparse(annotation.value) == "Annotated"
+    ):
+        raise ManifestBuildError(f"Parameter '{arg.arg}' is not Annotated")
+    type_node, field_node = annotation.slice.elts
+    type_name = ast.unparse(type_node)
+    if type_name not in SUPPORTED_TYPES:
+        raise ManifestBuildError(
+            f"Parameter '{arg.arg}' has unsupported type '{type_name}'"
+        )
+    keywords = {k.arg: k.value for k in field_node.keywords}
+    required = bool(field_node.args) and ast.unparse(field_node.args[0]) == "..."
+    if not required and ast.unparse(keywords.get("default", ast.Constant(None))) != "None":
+        raise ManifestBuildError(f"Parameter '{arg.arg}' has a non-None default")
+    description = keywords.get("description")
+    return {
+        "name": arg.arg,
+        "type": type_name,
+        "required": required,
+        "description": description.value if description is not None else "",
+    }
+
+
+def _find_keyword(node: ast.AST, name: str) -> Optional[str]:
+    for child in ast.walk(node):
+        if isinstance(child, ast.keyword) and child.arg == name:
+            if isinstance(child.value, ast.Constant):
+                return child.value.value
+    return None
+
+
+def _find_dict_value(node: ast.AST, key: str) -> Optional[str]:
+    for child in ast.walk(node):
+        if isinstance(child, ast.Dict):
+            for k, v in zip(child.keys, child.values):
+                if isinstance(k, ast.Constant) and k.value == key:
+                    if isinstance(v, ast.Constant):
+                        return v.value
+    return None
+
+
+def _script_param_keys(func: ast.AsyncFunctionDef) -> Dict[str, str]:
+    """Maps each action parameter to the script parameter key it is sent as."""
+    keys = {}
+    for child in ast.walk(func):
+        if not isinstance(child, ast.Assign) or len(child.targets) != 1:
+            continue
+        target = child.targets[0]
+        if (
+            isinstance(target, ast.Subscript)
+            and isinstance(target.value, ast.Name)
+            and target.value.id == "script_params"
+            and isinstance(target.slice, ast.Constant)
+            and isinstance(child.value, ast.Name)
+        ):
+            keys[child.value.id] = target.slice.value
+    return keys
+
+
+def _description(docstring: str) -> str:
+    """Strips the Returns section the server appends to every description.
+
+    Some generated docstrings start on the first line and keep the
+    indentation of their Returns section, so it cannot be matched at the
+    start of a line.
+    """
+    return RETURNS_SECTION.split(docstring, maxsplit=1)[0].strip()
+
+
+def _parse_action(func: ast.AsyncFunctionDef) -> Dict[str, Any]:
+    names = [a.arg for a in func.args.args]
+    if tuple(names[:2] + names[-2:]) != COMMON_PARAMETERS:
+        raise ManifestBuildError(f"Unexpected parameter layout: {names}")
+
+    integration = _find_keyword(func, "INTEGRATION_NAME")
+    action_name = _find_keyword(func, "actionName")
+    script_name = _find_dict_value(func, "ScriptName")
+    provider = _find_keyword(func, "actionProvider")
+    if not integration or not action_name:
+        raise ManifestBuildError("Could not find integration or action name")
+    if script_name != action_name or provider != "Scripts":
+        raise ManifestBuildError(
+            f"Unsupported action '{action_name}' (script '{script_name}', provider '{provider}')"
+        )
+
+    keys = _script_param_keys(func)
+    parameters = []
+    for arg in func.args.args[2:-2]:
+        parameter = _parse_parameter(arg)
+        if arg.arg not in keys:
+            raise ManifestBuildError(f"Parameter '{arg.arg}' is never sent")
+        parameter["key"] = keys[arg.arg]
+        parameters.append(parameter)
+
+    description = _description(ast.get_docstring(func) or "")
+    return {
+        "integration": integration,
+        "name": func.name,
+        "action": action_name,
+        "description": description,
+        "parameters": parameters,
+    }
+
+
+def _action_schema(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Computes the JSON schema of the action-specific parameters of a row."""
+    schema = Tool.from_function(build_tool(row)).parameters
+    names = [p["name"] for p in row["parameters"]]
+    action_schema = {}
+    if "$defs" in schema:
+        action_schema["$defs"] = schema["$defs"]
+    action_schema["properties"] = {n: schema["properties"][n] for n in names}
+    action_schema["required"] = [n for n in schema.get("required", []) if n in names]
+    return action_schema
+
+
+def iter_actions(modules_dir: Path) -> Iterator[Dict[str, Any]]:
+    """Yields one manifest row per generated action found in `modules_dir`."""
+    for py_file in sorted(modules_dir.glob("*.py")):
+        if py_file.name == "__init__.py":
+            continue
+        tree = ast.parse(py_file.read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.AsyncFunctionDef):
+                continue
+            try:
+                row = _parse_action(node)
+            except ManifestBuildError as e:
+                raise ManifestBuildError(f"{py_file.name}:{node.name}: {e}") from e
+            # The module name is what `--integrations` is matched against; it
+            # does not always equal the normalized SOAR integration name.
+            row = {"module": py_file.stem, **row}
+            row["schema"] = _action_schema(row)
+            yield row
+
+
+def read_manifest(path: Path) -> List[Dict[str, Any]]:
+    """Returns the rows of a manifest."""
+    with path.open("r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def write_manifest(rows: Iterable[Dict[str, Any]], output: Path) -> int:
+    """Writes rows as JSON lines and returns the number of actions."""
+    count = 0
+    with output.open("w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def build_manifest(modules_dir: Path, output: Path) -> int:
+    """Writes the manifest of `modules_dir` and returns the number of actions."""
+    return write_manifest(iter_actions(modules_dir), output)
+
+
+def refresh_manifest(path: Path) -> int:
+    """Rebuilds the description and schema of every row of a manifest."""
+    rows = read_manifest(path)
+    for row in rows:
+        row["description"] = _description(row["description"])
+        row["schema"] = _action_schema(row)
+    return write_manifest(rows, path)
+
+
+def check_manifest(path: Path) -> List[str]:
+    """Returns the names of rows whose description or schema is out of date."""
+    return [
+        row["name"]
+        for row in read_manifest(path)
+        if row["description"] != _description(row["description"])
+        or row["schema"] != _action_schema(row)
+    ]
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Build the SOAR marketplace action manifest"
+    )
+    parser.add_argument(
+        "modules_dir",
+        type=Path,
+        nargs="?",
+        help="Directory of generated integration modules",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=DEFAULT_MANIFEST_PATH,
+        help="Where to write the manifest (default: marketplace/manifest.jsonl)",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Rebuild the descriptions and schemas of the manifest at --output",
+    )
+    mode.add_argument(
+        "--check",
+        action="store_true",
+        help="Check the descriptions and schemas of the manifest at --output",
+    )
+    args = parser.parse_args(argv)
+    if args.check:
+        mismatches = check_manifest(args.output)
+        for name in mismatches:
+            print(f"Row {name} is out of date")
+        if mismatches:
+            sys.exit(1)
+        print(f"All rows in {args.output} are up to date")
+    elif args.refresh:
+        count = refresh_manifest(args.output)
+        print(f"Rebuilt {count} actions in {args.output}")
+    elif args.modules_dir is None:
+        parser.error("modules_dir is required unless --refresh or --check is given")
+    else:
+        count = build_manifest(args.modules_dir, args.output)
+        print(f"Wrote {count} actions to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cursor-based paging of SOAR listings for MCP tools."""
+
+import base64
+import json
+from typing import Any, Dict, Optional, Tuple
+
+from logger_utils import get_logger
+from secops_soar_mcp.http_client import HttpClient
+
+logger = get_logger(__name__)
+
+MAX_PAGE_SIZE = 1000
+# Cursors pointing into the middle of an upstream page carry this prefix;
+# cursors at a page boundary are the upstream page token itself.
+_CURSOR_PREFIX = "mcp1."
+
+
+def encode_cursor(page_token: Optional[str], offset: int) -> Optional[str]:
+    """Encodes a position in a listing as an opaque page token.
+
+    Args:
+        page_token: The upstream token of the page the position is in.
+        offset: The index of the next item within that page.
+    """
+    if offset == 0:
+        return page_token
+    data = json.dumps({"t": page_token, "o": offset}, separators=(",", ":"))
+    return _CURSOR_PREFIX + base64.urlsafe_b64encode(data.encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Tuple[Optional[str], int]:
+    """Decodes a page token into an upstream page token and an offset."""
+    if not cursor or not cursor.startswith(_CURSOR_PREFIX):
+        return cursor or None, 0
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor[len(_CURSOR_PREFIX) :]))
+        return data["t"], int(data["o"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid page token: {cursor}") from e
+
+
+async def fetch_page(
+    http_client: HttpClient,
+    endpoint: str,
+    page_token: Optional[str] = None,
+    page_size: Optional[int] = None,
+    params: Dict[str, Any] = None,
+) -> Optional[Dict[str, Any]]:
+    """Fetches one page of `page_size` items of a listing.
+
+    Upstream pages are walked until `page_size` items are collected, so a page
+    can start and end in the middle of an upstream page. Only the requested
+    items and the upstream page being read are held in memory. Top-level
+    values of the response besides the items are passed through from the last
+    upstream page read.
+
+    Args:
+        http_client: The client to fetch the upstream pages with.
+        endpoint: The listing endpoint.
+        page_token: The `nextPageToken` of the previous call, if any.
+        page_size: The number of items to return. If not given, the upstream
+            page is returned as is.
+        params: Query parameters sent with every upstream request.
+
+    Returns:
+        The items under their upstream key, plus a `nextPageToken` if more
+        items are available, or None if the first page could not be fetched.
+
+    Raises:
+        ValueError: If the page token is malformed.
+    """
+    upstream_token, offset = decode_cursor(page_token)
+    if not page_size and not offset:
+        page_params = dict(params or {})
+        if upstream_token:
+            page_params["pageToken"] = upstream_token
+        return await http_client.get(endpoint, params=page_params or None)
+
+    page_size = min(page_size or MAX_PAGE_SIZE, MAX_PAGE_SIZE)
+    items = []
+    items_key = None
+    fields = {}
+    next_cursor = upstream_token if offset == 0 else page_token
+    try:
+        async for page in http_client.paginate(
+            endpoint, params=params, page_token=upstream_token, page_size=page_size
+        ):
+            items_key = page.items_key or items_key
+            fields = page.fields
+            remaining = page_size - len(items)
+            items.extend(page.items[offset : offset + remaining])
+            end = offset + remaining
+            offset = 0
+            if end < len(page.items):
+                next_cursor = encode_cursor(page.page_token, end)
+                break
+            next_cursor = page.next_page_token
+            if len(items) >= page_size:
+                break
+    except RuntimeError as e:
+        if not items:
+            logger.debug("Failed to fetch page of %s: %s", endpoint, e)
+            return None
+        # Return what was collected; the cursor resumes at the failed page.
+        logger.debug("Returning a partial page of %s: %s", endpoint, e)
+    result = {**fields, items_key or "items": items}
+    if next_cursor:
+        result["nextPageToken"] = next_cursor
+    return result
@@ -63,9 +63,15 @@ def update_env_vars(soar_config: Dict[str, str]):
 
 
 @pytest_asyncio.fixture(loop_scope="session", autouse=True)
-async def setup_bindings(soar_config: Dict[str, str]):
-    """Ensures bindings are done once before tests in this module run."""
-    update_env_vars(soar_config)
+async def setup_bindings(request: pytest.FixtureRequest):
+    """Ensures bindings are done once before tests in this module run.
+
+    Unit tests (`test_*_unit.py`) run without a SOAR instance and are skipped.
+    """
+    if request.module.__name__.endswith("_unit"):
+        yield
+        return
+    update_env_vars(request.getfixturevalue("soar_config"))
     await bindings.bind()
     yield
     await bindings.http_client.close()
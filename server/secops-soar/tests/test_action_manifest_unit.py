@@ -0,0 +1,149 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for manifest-driven marketplace actions.
+
+`fixtures/marketplace/googlechat.py` is a module as emitted by the marketplace
+code generator; its tools are the reference for the manifest tools.
+"""
+
+import importlib.util
+import inspect
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from secops_soar_mcp import action_manifest
+from secops_soar_mcp.utils import manifest_builder
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "marketplace"
+
+CALLS = [
+    ("google_chat_ping", {}),
+    (
+        "google_chat_send_advanced_message",
+        {"space_name": "AAAA", "message_json_payload": {"text": "hi"}},
+    ),
+    ("google_chat_list_spaces", {"filter_key": ["name"], "include_user_memberships": True}),
+    ("google_chat_list_spaces", {}),
+    (
+        "google_chat_send_message",
+        {
+            "space_name": "AAAA",
+            "message_text": "hi",
+            "target_entities": [{"Identifier": "10.0.0.1", "EntityType": "ADDRESS"}],
+        },
+    ),
+]
+
+
+def generated_server() -> FastMCP:
+    spec = importlib.util.spec_from_file_location(
+        "googlechat", FIXTURES_DIR / "googlechat.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    mcp = FastMCP("generated")
+    module.register_tools(mcp)
+    return mcp
+
+
+def manifest_server() -> action_manifest.ManifestServer:
+    mcp = action_manifest.ManifestServer("manifest")
+    rows = action_manifest.load_manifest({"googlechat"})["googlechat"]
+    registered = action_manifest.register_tools(mcp, rows)
+    assert set(registered) == set(mcp.actions)
+    return mcp
+
+
+@pytest.fixture
+def soar():
+    http_client = MagicMock()
+    http_client.get = AsyncMock(
+        return_value={"integration_instances": [{"identifier": "instance-1"}]}
+    )
+    http_client.post = AsyncMock(return_value={"Status": "Done"})
+    instance_cache = MagicMock()
+    instance_cache.get = AsyncMock(return_value="instance-1")
+    with patch("secops_soar_mcp.bindings.http_client", http_client), patch(
+        "secops_soar_mcp.bindings.instance_cache", instance_cache
+    ), patch("secops_soar_mcp.bindings.valid_scopes", {"All entities"}):
+        yield http_client
+
+
+def test_builder_rows_match_manifest():
+    """Building the fixture module gives the rows stored in the manifest."""
+    rows = list(manifest_builder.iter_actions(FIXTURES_DIR))
+    assert rows == action_manifest.load_manifest({"googlechat"})["googlechat"]
+
+
+@pytest.mark.asyncio
+async def test_schemas_match_generated_tools():
+    """Manifest tools list the schemas and docstrings of generated ones."""
+    generated = {tool.name: tool for tool in await generated_server().list_tools()}
+    listed = await manifest_server().list_tools()
+    manifest = {tool.name: tool for tool in listed if tool.name in generated}
+
+    assert manifest.keys() == generated.keys()
+    for name, tool in generated.items():
+        assert manifest[name].inputSchema == tool.inputSchema, name
+        assert manifest[name].description == inspect.cleandoc(tool.description), name
+
+
+@pytest.mark.asyncio
+async def test_payload_matches_generated_tools(soar):
+    """Manifest tools send the same ExecuteManualAction request."""
+    generated = generated_server()
+    manifest = manifest_server()
+    for name, params in CALLS:
+        arguments = {"case_id": "42", "alert_group_identifiers": ["g1"], **params}
+        await generated.call_tool(name, arguments)
+        expected = soar.post.call_args
+        await manifest.call_tool(name, arguments)
+        assert soar.post.call_args == expected, name
+    assert soar.post.call_count == 2 * len(CALLS)
+
+
+@pytest.mark.asyncio
+async def test_invalid_arguments_are_rejected(soar):
+    """Arguments are validated by the lazily built model."""
+    manifest = manifest_server()
+    with pytest.raises(Exception, match="message_text"):
+        await manifest.call_tool(
+            "google_chat_send_message",
+            {"case_id": "42", "alert_group_identifiers": [], "space_name": "AAAA"},
+        )
+    soar.post.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "docstring",
+    [
+        "Ping\n\nReturns:\n    dict: The result.",
+        "Set a password\nNote - use SSL\n\n        Returns:\n            dict: The result.",
+        "Returns:\n    dict: The result.",
+    ],
+)
+def test_builder_strips_returns_sections(docstring):
+    """The Returns section is stripped whatever its indentation."""
+    assert "Returns:" not in manifest_builder._description(docstring)
+
+
+def test_manifest_descriptions_have_one_returns_section():
+    """Tool descriptions end with exactly one Returns section."""
+    for row in manifest_builder.read_manifest(action_manifest.MANIFEST_PATH):
+        doc = action_manifest._tool_function(row).__doc__
+        assert doc.count("Returns:") == 1, row["name"]
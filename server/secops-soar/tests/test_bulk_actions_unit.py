@@ -0,0 +1,144 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the bulk marketplace action executor."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from secops_soar_mcp import action_manifest, bulk_actions
+from secops_soar_mcp.instance_cache import InstanceCache
+
+
+class FakeSoar:
+    """Executes actions, failing the cases in `failing_cases`."""
+
+    def __init__(self, failing_cases=()):
+        self.failing_cases = set(failing_cases)
+        self.instances = iter(f"instance-{i}" for i in range(1, 100))
+        self.executed = []
+        self.active = 0
+        self.max_active = 0
+        self.http_client = MagicMock()
+        self.http_client.get = AsyncMock(side_effect=self.get)
+        self.http_client.post = AsyncMock(side_effect=self.post)
+
+    async def get(self, endpoint, params=None):
+        return {"integration_instances": [{"identifier": next(self.instances)}]}
+
+    async def post(self, endpoint, req=None):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            instance = req["properties"]["IntegrationInstance"]
+            self.executed.append((req["caseId"], instance))
+            if str(req["caseId"]) in self.failing_cases:
+                return None
+            return {"Status": "Done"}
+        finally:
+            self.active -= 1
+
+
+def bulk_server(soar):
+    mcp = action_manifest.ManifestServer("test")
+    rows = action_manifest.load_manifest({"googlechat"})["googlechat"]
+    bulk_actions.register_tools(mcp, action_manifest.register_tools(mcp, rows))
+    instance_cache = InstanceCache(soar.http_client, ttl=300)
+    return mcp, [
+        patch("secops_soar_mcp.bindings.http_client", soar.http_client),
+        patch("secops_soar_mcp.bindings.instance_cache", instance_cache),
+        patch("secops_soar_mcp.bindings.valid_scopes", {"All entities"}),
+    ]
+
+
+async def run_bulk(soar, **arguments):
+    mcp, patches = bulk_server(soar)
+    for p in patches:
+        p.start()
+    try:
+        content = await mcp.call_tool("execute_bulk_action", arguments)
+    finally:
+        for p in patches:
+            p.stop()
+    return json.loads(content[0].text)
+
+
+@pytest.mark.asyncio
+async def test_partial_failure_is_reported_per_target():
+    """Failed targets are reported without failing the others."""
+    soar = FakeSoar(failing_cases={"2", "4"})
+    result = await run_bulk(
+        soar,
+        action_tool="google_chat_send_message",
+        targets=[{"case_id": str(i)} for i in range(1, 6)],
+        action_parameters={"space_name": "AAAA", "message_text": "contained"},
+        max_concurrency=1,
+    )
+
+    assert (result["total"], result["succeeded"], result["failed"]) == (5, 3, 2)
+    assert [r["status"] for r in result["results"]] == [
+        "Succeeded",
+        "Failed",
+        "Succeeded",
+        "Failed",
+        "Succeeded",
+    ]
+    # Each failure invalidates the instance, so the next target looks it up
+    # again instead of reusing the identifier that just failed.
+    assert soar.executed == [
+        (1, "instance-1"),
+        (2, "instance-1"),
+        (3, "instance-2"),
+        (4, "instance-2"),
+        (5, "instance-3"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_limited():
+    """At most max_concurrency actions run at the same time."""
+    soar = FakeSoar()
+    result = await run_bulk(
+        soar,
+        action_tool="google_chat_ping",
+        targets=[{"case_id": str(i)} for i in range(20)],
+        max_concurrency=4,
+    )
+
+    assert result["succeeded"] == 20
+    assert soar.max_active == 4
+    assert soar.http_client.get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_invalid_requests_run_nothing():
+    """Unknown tools and invalid parameters fail before any action runs."""
+    soar = FakeSoar()
+    unknown = await run_bulk(
+        soar, action_tool="list_cases", targets=[{"case_id": "1"}]
+    )
+    invalid = await run_bulk(
+        soar,
+        action_tool="google_chat_send_message",
+        targets=[{"case_id": "1"}],
+        action_parameters={"space_name": "AAAA"},
+    )
+
+    assert "not an enabled marketplace action tool" in unknown["Message"]
+    assert "Invalid action parameters" in invalid["Message"]
+    soar.http_client.post.assert_not_called()
@@ -0,0 +1,254 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the SQLite case mirror."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from mcp.server.fastmcp import FastMCP
+
+from secops_soar_mcp import case_management, case_mirror
+from secops_soar_mcp.case_mirror import CaseMirror
+from secops_soar_mcp.http_client import Page
+from secops_soar_mcp.utils.consts import Endpoints
+
+
+def make_case(case_id, modified, **fields):
+    return {"id": case_id, "updateTime": modified, **fields}
+
+
+CASES = [
+    make_case(1, "2025-01-01T00:00:01", status="Opened", priority="PriorityHigh",
+              title="Phishing on host-a", assignee={"name": "alice"}, isImportant=True,
+              tags=["mail"]),
+    make_case(2, "2025-01-01T00:00:02", status="Closed", priority="PriorityLow",
+              title="Malware on host-b", assignee={"name": "bob"}, isImportant=False,
+              score=2.5),
+    make_case(3, "2025-01-01T00:00:03", status="Opened", priority="PriorityLow",
+              title="Login from new country", assignee=None, isImportant=False),
+]
+
+
+class FakeSoar:
+    """Lists cases, applying the `updateTime ge` filter of delta syncs.
+
+    Alerts and comments of a case are tagged with its modification time.
+    """
+
+    def __init__(self, cases):
+        self.cases = list(cases)
+        self.filters = []
+        self.gets = []
+        self.posts = []
+
+    async def get(self, endpoint, params=None):
+        self.gets.append(endpoint)
+        case_id = endpoint.split("/cases/")[1].split("/")[0] if "/cases/" in endpoint else None
+        case = next((c for c in self.cases if str(c["id"]) == case_id), None)
+        if case is None:
+            return None
+        if endpoint == Endpoints.BASE_SPECIFIC_CASE_URL.format(CASE_ID=case_id):
+            return case
+        kind = "alerts" if endpoint == Endpoints.BASE_ALERT_URL.format(CASE_ID=case_id) else "comments"
+        return {kind: [case["updateTime"]]}
+
+    async def post(self, endpoint, req=None, params=None):
+        self.posts.append(endpoint)
+        return {}
+
+    async def paginate(self, endpoint, params=None, **kwargs):
+        self.filters.append(params.get("$filter"))
+        cases = self.cases
+        if params.get("$filter"):
+            watermark = params["$filter"].split(" ge ")[1]
+            cases = [c for c in cases if c["updateTime"] >= watermark]
+        cases = sorted(cases, key=lambda c: c["updateTime"])
+        for start in range(0, len(cases), 2):
+            yield Page(cases[start : start + 2], "cases", None, None)
+
+
+@pytest_asyncio.fixture
+async def mirror():
+    soar = FakeSoar(CASES)
+    mirror = CaseMirror(soar, ":memory:")
+    await mirror.sync(full=True)
+    yield mirror
+    await mirror.close()
+
+
+async def ids(mirror, **kwargs):
+    return [case["id"] for case in await mirror.query_cases(**kwargs)]
+
+
+@pytest.mark.asyncio
+async def test_delta_sync_skips_unchanged_watermark_cases(mirror):
+    """Cases at the watermark are listed again but only changes are counted."""
+    soar = mirror.http_client
+    assert await mirror.sync() == 0
+    assert soar.filters[-1] == "updateTime ge 2025-01-01T00:00:03"
+
+    soar.cases[0] = make_case(1, "2025-01-01T00:00:05", status="Closed")
+    soar.cases.append(make_case(4, "2025-01-01T00:00:04", status="Opened"))
+    assert await mirror.sync() == 2
+    assert await ids(mirror) == [1, 4, 3, 2]
+    assert await mirror.sync() == 0
+    assert soar.filters[-1] == "updateTime ge 2025-01-01T00:00:05"
+
+    del soar.cases[1]
+    assert await mirror.sync(full=True) == 0
+    assert await ids(mirror) == [1, 4, 3]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "filters, expected",
+    [
+        ({"status": "Opened"}, [3, 1]),
+        ({"status": "Opened", "priority": "PriorityLow"}, [3]),
+        ({"id": "2"}, [2]),
+        ({"id": 2}, [2]),
+        ({"score": 2.5}, [2]),
+        ({"isImportant": True}, [1]),
+        ({"isImportant": False}, [3, 2]),
+        ({"assignee.name": "bob"}, [2]),
+        ({"assignee": None}, [3]),
+        ({"status": "Missing"}, []),
+    ],
+)
+async def test_filters(mirror, filters, expected):
+    """Scalar filter values match by their text, whatever their JSON type."""
+    assert await ids(mirror, filters=filters) == expected
+
+
+@pytest.mark.asyncio
+async def test_text_and_order_by(mirror):
+    """Text search is case-insensitive; order_by sorts by any case field."""
+    assert await ids(mirror, text="HOST-") == [2, 1]
+    assert await ids(mirror, text="mail") == [1]
+    assert await ids(mirror, order_by="title", descending=False) == [3, 2, 1]
+    assert await ids(mirror, order_by="assignee.name", descending=True) == [2, 1, 3]
+    assert await ids(mirror, limit=1, offset=1) == [2]
+
+
+@pytest.mark.asyncio
+async def test_invalid_queries_fail_the_tool(mirror):
+    """Invalid field names and non-scalar values are reported by the tool."""
+    with pytest.raises(ValueError):
+        await mirror.query_cases(filters={"tags": ["mail"]})
+    with pytest.raises(ValueError):
+        await mirror.query_cases(order_by="data) --")
+
+    mcp = FastMCP("test")
+    case_mirror.register_tools(mcp, mirror)
+    content = await mcp.call_tool("query_cases", {"filters": {"assignee": {"name": "bob"}}})
+    result = json.loads(content[0].text)
+    assert result["Status"] == "Failed"
+    assert "string, number, boolean or null" in result["Message"]
+
+
+@pytest.mark.asyncio
+async def test_list_page(mirror):
+    """Mirror tokens page through the cases; API tokens are not served."""
+    first = await mirror.list_page(None, 2)
+    second = await mirror.list_page(first["nextPageToken"], 2)
+
+    assert [c["id"] for c in first["cases"] + second["cases"]] == [3, 2, 1]
+    assert "nextPageToken" not in second
+    assert await mirror.list_page("api-token", 2) is None
+    with pytest.raises(ValueError, match="Invalid page token"):
+        await mirror.list_page("mirror.abc", 2)
+
+
+@pytest.mark.asyncio
+async def test_list_page_waits_for_the_first_sync():
+    """An unsynced mirror leaves list_cases to the API."""
+    mirror = CaseMirror(MagicMock(), ":memory:")
+    assert await mirror.list_page(None, 10) is None
+    await mirror.close()
+
+
+@pytest.mark.asyncio
+async def test_alerts_and_comments_are_mirrored_for_changed_cases(mirror):
+    """Only changed cases have their alerts and comments fetched again."""
+    soar = mirror.http_client
+    assert await mirror.get_related(1, "2025-01-01T00:00:01") == (
+        {"alerts": ["2025-01-01T00:00:01"]},
+        {"comments": ["2025-01-01T00:00:01"]},
+    )
+
+    soar.gets.clear()
+    soar.cases[0] = make_case(1, "2025-01-01T00:00:05", status="Closed")
+    await mirror.sync()
+    assert sorted(soar.gets) == sorted(
+        [
+            Endpoints.BASE_ALERT_URL.format(CASE_ID="1"),
+            Endpoints.BASE_CASE_COMMENTS_URL.format(CASE_ID="1"),
+        ]
+    )
+    # Mirrored at an older modification time: the caller must use the API.
+    assert await mirror.get_related(1, "2025-01-01T00:00:06") is None
+    assert (await mirror.get_related(1, "2025-01-01T00:00:05"))[0] == {
+        "alerts": ["2025-01-01T00:00:05"]
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_case_full_details_uses_the_mirror_when_current(mirror):
+    """Alerts and comments come from the mirror unless the case changed since."""
+    soar = mirror.http_client
+    mcp = FastMCP("test")
+    case_management.register_tools(mcp)
+
+    async def details():
+        content = await mcp.call_tool("get_case_full_details", {"case_id": "2"})
+        return json.loads(content[0].text)
+
+    with patch("secops_soar_mcp.bindings.case_mirror", mirror), patch(
+        "secops_soar_mcp.bindings.http_client", soar
+    ):
+        soar.gets.clear()
+        result = await details()
+        assert soar.gets == [Endpoints.BASE_SPECIFIC_CASE_URL.format(CASE_ID="2")]
+        assert result["case_alerts"] == {"alerts": ["2025-01-01T00:00:02"]}
+
+        soar.cases[1] = make_case(2, "2025-01-01T00:00:09", status="Opened")
+        soar.gets.clear()
+        result = await details()
+        assert Endpoints.BASE_ALERT_URL.format(CASE_ID="2") in soar.gets
+        # The case fetched to check the mirror is not fetched again.
+        assert soar.gets.count(Endpoints.BASE_SPECIFIC_CASE_URL.format(CASE_ID="2")) == 1
+        assert result["case_comments"] == {"comments": ["2025-01-01T00:00:09"]}
+
+
+@pytest.mark.asyncio
+async def test_posting_a_comment_drops_the_mirrored_comments(mirror):
+    """A posted comment shows up even if the case's modification time is unchanged."""
+    soar = mirror.http_client
+    mcp = FastMCP("test")
+    case_management.register_tools(mcp)
+
+    with patch("secops_soar_mcp.bindings.case_mirror", mirror), patch(
+        "secops_soar_mcp.bindings.http_client", soar
+    ):
+        await mcp.call_tool("post_case_comment", {"case_id": "2", "comment": "hi"})
+        assert soar.posts == [Endpoints.BASE_CASE_COMMENTS_URL.format(CASE_ID="2")]
+        assert await mirror.get_related(2, "2025-01-01T00:00:02") is None
+        assert await mirror.get_related(1, "2025-01-01T00:00:01") is not None
+
+        soar.gets.clear()
+        await mcp.call_tool("get_case_full_details", {"case_id": "2"})
+        assert Endpoints.BASE_CASE_COMMENTS_URL.format(CASE_ID="2") in soar.gets
@@ -0,0 +1,160 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for deep case snapshots."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from secops_soar_mcp.case_snapshot import CaseSnapshot
+from secops_soar_mcp.utils.consts import Endpoints
+
+
+def soar_client(alerts, entities_per_group, fail=(), slow=()):
+    """A client whose responses are built from the case layout.
+
+    Requests whose URL or identifier is in `fail` raise, and those in `slow`
+    never finish.
+    """
+    client = MagicMock()
+    client.active = 0
+    client.max_active = 0
+
+    async def respond(key, response):
+        client.active += 1
+        client.max_active = max(client.max_active, client.active)
+        try:
+            await asyncio.sleep(0.01)
+            if key in slow:
+                await asyncio.sleep(3600)
+            if key in fail:
+                raise RuntimeError(f"{key} failed")
+            return response
+        finally:
+            client.active -= 1
+
+    async def get(endpoint, params=None):
+        if endpoint == Endpoints.BASE_SPECIFIC_CASE_URL.format(CASE_ID="1"):
+            return await respond(endpoint, {"id": 1, "environment": "Default"})
+        if endpoint == Endpoints.BASE_ALERT_URL.format(CASE_ID="1"):
+            return await respond(endpoint, {"caseAlerts": alerts})
+        if endpoint == Endpoints.BASE_CASE_COMMENTS_URL.format(CASE_ID="1"):
+            return await respond(endpoint, {"comments": []})
+        return await respond(endpoint, {"involvedEvents": [{"endpoint": endpoint}]})
+
+    async def post(endpoint, req=None):
+        if endpoint == Endpoints.GET_ALERT_GROUP_IDENTIFIERS_ENTITIES:
+            group = req["alertGroupIdentifiers"][0]
+            entities = [
+                {"identifier": f"{group}-host-{i}", "entityType": "HOSTNAME"}
+                for i in range(entities_per_group)
+            ]
+            return await respond(group, {"entities": entities})
+        identifier = req["EntityIdentifier"]
+        return await respond(identifier, {"identifier": identifier})
+
+    client.get = AsyncMock(side_effect=get)
+    client.post = AsyncMock(side_effect=post)
+    return client
+
+
+ALERTS = [
+    {"id": 10, "alertGroupIdentifier": "g1"},
+    {"id": 11, "alertGroupIdentifier": "g1"},
+    {"id": 12, "alertGroupIdentifier": "g2"},
+]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_fans_out_within_the_concurrency_limit():
+    """Every alert, group and distinct entity is fetched, a few at a time."""
+    client = soar_client(ALERTS, entities_per_group=2)
+    snapshot = await CaseSnapshot(client, "1", concurrency=3).build()
+
+    assert [e["alert_id"] for e in snapshot["alert_events"]] == ["10", "11", "12"]
+    assert set(snapshot["alert_group_entities"]) == {"g1", "g2"}
+    assert [e["identifier"] for e in snapshot["entities"]] == [
+        "g1-host-0",
+        "g1-host-1",
+        "g2-host-0",
+        "g2-host-1",
+    ]
+    assert snapshot["entities"][0]["environment"] == "Default"
+    assert snapshot["entities_truncated"] is False
+    assert snapshot["errors"] == []
+    assert client.max_active == 3
+
+
+@pytest.mark.asyncio
+async def test_entities_are_truncated_at_max_entities():
+    """Only the first MAX_ENTITIES distinct entities get their details."""
+    client = soar_client(ALERTS, entities_per_group=4)
+    with patch("secops_soar_mcp.case_snapshot.MAX_ENTITIES", 5):
+        snapshot = await CaseSnapshot(client, "1").build()
+
+    assert snapshot["entities_truncated"] is True
+    assert len(snapshot["entities"]) == 5
+    detail_requests = [
+        call
+        for call in client.post.call_args_list
+        if call.args[0] == Endpoints.FETCH_FULL_UNIQUE_ENTITY
+    ]
+    assert len(detail_requests) == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_branches_leave_the_rest_of_the_snapshot():
+    """Failed and timed out branches are reported; the others still complete."""
+    events_11 = Endpoints.LIST_INVOLVED_EVENTS_BY_ALERT.format(CASE_ID="1", ALERT_ID="11")
+    client = soar_client(
+        ALERTS, entities_per_group=1, fail={events_11, "g1-host-0"}, slow={"g2"}
+    )
+    snapshot = await CaseSnapshot(client, "1", branch_timeout=0.2).build()
+
+    events = {e["alert_id"]: e["events"] for e in snapshot["alert_events"]}
+    assert events["11"] is None
+    assert events["10"] is not None and events["12"] is not None
+    assert snapshot["alert_group_entities"]["g2"] is None
+    assert snapshot["entities"] == [
+        {
+            "identifier": "g1-host-0",
+            "type": "HOSTNAME",
+            "environment": "Default",
+            "details": None,
+        }
+    ]
+    assert sorted(error["branch"] for error in snapshot["errors"]) == [
+        "entities:g2",
+        "entity:g1-host-0",
+        "events:11",
+    ]
+    assert next(e for e in snapshot["errors"] if e["branch"] == "entities:g2")[
+        "error"
+    ] == "Timed out"
+
+
+@pytest.mark.asyncio
+async def test_failed_alert_listing_still_returns_the_case():
+    """Without alerts there is nothing to fan out to, but the case is kept."""
+    client = soar_client(
+        ALERTS, entities_per_group=1, fail={Endpoints.BASE_ALERT_URL.format(CASE_ID="1")}
+    )
+    snapshot = await CaseSnapshot(client, "1").build()
+
+    assert snapshot["case_details:"] == {"id": 1, "environment": "Default"}
+    assert snapshot["case_alerts"] is None
+    assert snapshot["alert_events"] == [] and snapshot["entities"] == []
+    assert [error["branch"] for error in snapshot["errors"]] == ["alerts"]
@@ -0,0 +1,239 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the retries and GET response cache of the SOAR HTTP client."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from secops_soar_mcp.http_client import HttpClient, TransportConfig, _retry_after
+from secops_soar_mcp.utils.consts import Endpoints
+
+CASE = Endpoints.BASE_SPECIFIC_CASE_URL.format(CASE_ID="1")
+
+
+@pytest.fixture
+def client():
+    client = HttpClient("https://soar", "key")
+
+    async def request(method, endpoint, req=None, params=None, decode=True):
+        await asyncio.sleep(0)
+        data = json.dumps({"method": method, "endpoint": endpoint}).encode()
+        return client.decoder(data) if decode else data
+
+    client._request = AsyncMock(side_effect=request)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_get_shares_requests_and_returns_copies(client):
+    """Concurrent and cached GETs share a request but not the decoded object."""
+    first, second = await asyncio.gather(client.get(CASE), client.get(CASE))
+    first["method"] = "changed"
+    third = await client.get(CASE)
+
+    assert second == third == {"method": "GET", "endpoint": CASE}
+    assert client._request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_only_mutating_requests_invalidate_the_cache(client):
+    """Read-only POSTs keep cached GETs; other POSTs and PATCHes drop them."""
+    await client.get(CASE)
+    await client.post(Endpoints.FETCH_FULL_UNIQUE_ENTITY, req={})
+    await client.post(Endpoints.GET_ALERT_GROUP_IDENTIFIERS_ENTITIES, req={})
+    await client.get(CASE)
+    assert client._request.call_count == 3
+
+    await client.post(Endpoints.BASE_CASE_COMMENTS_URL.format(CASE_ID="1"), req={})
+    await client.get(CASE)
+    assert client._request.call_count == 5
+
+    await client.patch(CASE, req={})
+    await client.get(CASE)
+    assert client._request.call_count == 7
+
+
+def test_transport_config_from_env_uses_declared_types(monkeypatch):
+    """Float settings accept fractional values; int settings stay ints."""
+    monkeypatch.setenv("SOAR_HTTP_READ_TIMEOUT", "2.5")
+    monkeypatch.setenv("SOAR_HTTP_RESPONSE_CACHE_TTL", "0.5")
+    monkeypatch.setenv("SOAR_HTTP_MAX_RETRIES", "5")
+
+    config = TransportConfig.from_env()
+
+    assert config.read_timeout == 2.5
+    assert config.response_cache_ttl == 0.5
+    assert config.max_retries == 5 and isinstance(config.max_retries, int)
+
+
+@pytest.mark.asyncio
+async def test_response_cache_drops_expired_and_least_recent_entries(client):
+    """The cache holds at most response_cache_size live responses."""
+    client.config.response_cache_size = 2
+    cases = [Endpoints.BASE_SPECIFIC_CASE_URL.format(CASE_ID=i) for i in range(3)]
+    for case in cases:
+        await client.get(case)
+    assert list(client._response_cache) == [
+        client._request_key(case, None) for case in cases[1:]
+    ]
+
+    for key, (body, _) in client._response_cache.items():
+        client._response_cache[key] = (body, 0.0)  # Expired.
+    await client.get(cases[0])
+    assert list(client._response_cache) == [client._request_key(cases[0], None)]
+
+
+@pytest.mark.asyncio
+async def test_reads_after_a_write_never_see_pre_write_data():
+    """GETs sent before or during a write are neither cached nor shared after it."""
+    client = HttpClient("https://soar", "key")
+    state = {"version": 0}
+    write_sent = asyncio.Event()
+    finish_write = asyncio.Event()
+    finish_reads = asyncio.Event()
+
+    async def request(method, endpoint, req=None, params=None, decode=True):
+        if method == "GET":
+            version = state["version"]
+            if version == 0:
+                await finish_reads.wait()
+            return json.dumps({"version": version}).encode()
+        write_sent.set()
+        await finish_write.wait()
+        state["version"] += 1
+        return client.decoder(b"{}")
+
+    client._request = AsyncMock(side_effect=request)
+    before = asyncio.ensure_future(client.get(CASE))
+    await asyncio.sleep(0)
+    write = asyncio.ensure_future(
+        client.post(Endpoints.BASE_CASE_COMMENTS_URL.format(CASE_ID="1"), req={})
+    )
+    await write_sent.wait()
+    during = asyncio.ensure_future(client.get(CASE))
+    await asyncio.sleep(0)
+    finish_write.set()
+    await write
+
+    after = await asyncio.wait_for(client.get(CASE), timeout=1)
+    finish_reads.set()
+    assert after == {"version": 1}
+    assert await before == await during == {"version": 0}
+    assert await client.get(CASE) == {"version": 1}
+
+
+class FakeResponse:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+def test_retry_after_seconds_and_http_date():
+    """Retry-After is read as seconds or as an HTTP-date; junk is ignored."""
+    assert _retry_after(FakeResponse({"Retry-After": "7"})) == 7.0
+    assert _retry_after(FakeResponse({"Retry-After": "-3"})) == 0.0
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    delay = _retry_after(
+        FakeResponse({"Retry-After": format_datetime(retry_at, usegmt=True)})
+    )
+    assert 28 <= delay <= 30
+    past = format_datetime(datetime(2000, 1, 1, tzinfo=timezone.utc), usegmt=True)
+    assert _retry_after(FakeResponse({"Retry-After": past})) == 0.0
+    assert _retry_after(FakeResponse({"Retry-After": "soon"})) is None
+    assert _retry_after(FakeResponse({})) is None
+
+
+@pytest_asyncio.fixture
+async def soar():
+    """A local SOAR stand-in answering with queued statuses, then 200."""
+    statuses = []
+    requests = []
+
+    async def handler(request):
+        requests.append(request.method)
+        status, headers = statuses.pop(0) if statuses else (200, {})
+        return web.json_response({"status": status}, status=status, headers=headers)
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    client = HttpClient(
+        str(server.make_url("")).rstrip("/"), "key", TransportConfig(max_retries=2)
+    )
+    delays = []
+
+    def backoff(attempt, retry_after):
+        delays.append(retry_after)
+        return 0
+
+    client._backoff = backoff
+    yield client, statuses, requests, delays
+    await client.close()
+    await server.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+async def test_get_retries_until_max_retries(soar, status):
+    """Throttled and failed GETs are retried up to max_retries times."""
+    client, statuses, requests, _ = soar
+    statuses.extend([(status, {})] * 2)
+    assert await client.get(CASE, use_cache=False) == {"status": 200}
+    assert len(requests) == 3
+
+    requests.clear()
+    statuses.extend([(status, {})] * 3)
+    assert await client.get(CASE, use_cache=False) is None
+    assert len(requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_retries_wait_for_retry_after(soar):
+    """The Retry-After of a throttled response is passed to the backoff."""
+    client, statuses, _, delays = soar
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+    statuses.extend(
+        [
+            (429, {"Retry-After": "2"}),
+            (503, {"Retry-After": format_datetime(retry_at, usegmt=True)}),
+        ]
+    )
+    assert await client.get(CASE, use_cache=False) == {"status": 200}
+    assert delays[0] == 2.0
+    assert 58 <= delays[1] <= 60
+
+
+@pytest.mark.asyncio
+async def test_posts_are_only_retried_when_rejected(soar):
+    """POSTs are retried on 429 and 503, which mean they were not processed."""
+    client, statuses, requests, _ = soar
+    statuses.extend([(429, {}), (503, {})])
+    assert await client.post(Endpoints.EXECUTE_MANUAL_ACTION, req={}) == {
+        "status": 200
+    }
+    assert requests == ["POST"] * 3
+
+    requests.clear()
+    statuses.append((500, {}))
+    assert await client.post(Endpoints.EXECUTE_MANUAL_ACTION, req={}) is None
+    assert requests == ["POST"]
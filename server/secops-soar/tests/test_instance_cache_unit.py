@@ -0,0 +1,138 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the integration instance identifier cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from secops_soar_mcp import action_manifest
+from secops_soar_mcp.instance_cache import InstanceCache
+
+
+class FakeSoar:
+    """Lists a new instance identifier of an integration on every request."""
+
+    def __init__(self):
+        self.counts = {}
+        self.listed = asyncio.Event()
+        self.http_client = MagicMock()
+        self.http_client.get = AsyncMock(side_effect=self.get)
+
+    async def get(self, endpoint, params=None):
+        integration = endpoint.split("/integrations/")[1].split("/")[0]
+        self.counts[integration] = self.counts.get(integration, 0) + 1
+        self.listed.set()
+        if integration == "Empty":
+            return {"integration_instances": []}
+        identifier = f"{integration}-{self.counts[integration]}"
+        return {"integration_instances": [{"identifier": identifier}]}
+
+
+@pytest.mark.asyncio
+async def test_identifiers_expire_after_the_ttl():
+    """Identifiers are reused until the TTL passes; missing ones are not cached."""
+    soar = FakeSoar()
+    cache = InstanceCache(soar.http_client, ttl=60)
+    with patch("secops_soar_mcp.instance_cache.time.monotonic", return_value=1000):
+        assert await cache.get("Alexa") == "Alexa-1"
+        assert await cache.get("Alexa") == "Alexa-1"
+        assert await cache.get("Empty") is None
+        assert await cache.get("Empty") is None
+    with patch("secops_soar_mcp.instance_cache.time.monotonic", return_value=1061):
+        assert await cache.get("Alexa") == "Alexa-2"
+    assert soar.counts == {"Alexa": 2, "Empty": 2}
+
+
+@pytest.mark.asyncio
+async def test_refresh_fetches_given_and_known_integrations():
+    """refresh reloads every integration seen and survives failed listings."""
+    soar = FakeSoar()
+    cache = InstanceCache(soar.http_client, ttl=60)
+    await cache.get("Alexa")
+
+    get = soar.http_client.get.side_effect
+
+    async def failing_get(endpoint, params=None):
+        if "/Jira/" in endpoint:
+            return None
+        return await get(endpoint, params)
+
+    soar.http_client.get.side_effect = failing_get
+    await cache.refresh(["Slack", "Jira"])
+
+    assert await cache.get("Alexa") == "Alexa-2"
+    assert await cache.get("Slack") == "Slack-1"
+    assert soar.counts == {"Alexa": 2, "Slack": 1}
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_runs_every_half_ttl():
+    """The refresh loop reloads known identifiers before they expire."""
+    soar = FakeSoar()
+    cache = InstanceCache(soar.http_client, ttl=0.1)
+    await cache.get("Alexa")
+    soar.listed.clear()
+    sleeps = []
+    sleep = asyncio.sleep
+
+    async def record_sleep(delay):
+        sleeps.append(delay)
+        await sleep(0)
+
+    with patch("secops_soar_mcp.instance_cache.asyncio.sleep", record_sleep):
+        cache.start()
+        await asyncio.wait_for(soar.listed.wait(), timeout=1)
+        await cache.close()
+
+    assert sleeps[0] == 0.05
+    assert soar.counts["Alexa"] >= 2
+    assert cache._refresh_task is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("execute", [RuntimeError("connection reset"), None])
+async def test_failed_executions_invalidate_the_identifier(execute):
+    """An execution that raises or returns None drops the cached identifier."""
+    soar = FakeSoar()
+    cache = InstanceCache(soar.http_client, ttl=60)
+    if isinstance(execute, Exception):
+        soar.http_client.post = AsyncMock(side_effect=execute)
+    else:
+        soar.http_client.post = AsyncMock(return_value=execute)
+
+    async def run():
+        return await action_manifest.execute_action(
+            "Alexa", "Alexa_Ping", {}, "1", [], [], "All entities"
+        )
+
+    with patch("secops_soar_mcp.bindings.http_client", soar.http_client), patch(
+        "secops_soar_mcp.bindings.instance_cache", cache
+    ), patch("secops_soar_mcp.bindings.valid_scopes", {"All entities"}), patch(
+        "secops_soar_mcp.bindings.case_mirror", None
+    ):
+        await run()
+        await run()
+        soar.http_client.post = AsyncMock(return_value={"Status": "Done"})
+        assert await run() == {"Status": "Done"}
+        await run()
+
+    instances = [
+        call.kwargs["req"]["properties"]["IntegrationInstance"]
+        for call in soar.http_client.post.call_args_list
+    ]
+    assert instances == ["Alexa-3", "Alexa-3"]
+    assert soar.counts == {"Alexa": 3}
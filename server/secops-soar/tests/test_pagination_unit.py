@@ -0,0 +1,111 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for cursor paging of SOAR listings."""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from secops_soar_mcp.case_management import register_tools
+from secops_soar_mcp.http_client import HttpClient
+from secops_soar_mcp.utils.pagination import fetch_page
+
+ALERTS = [{"id": i} for i in range(7)]
+UPSTREAM_PAGE_SIZE = 3
+
+
+@pytest.fixture
+def http_client():
+    """A client over a listing of 7 alerts in upstream pages of 3."""
+    client = HttpClient("https://soar", "key")
+
+    async def get(endpoint, params=None, use_cache=True):
+        start = int((params or {}).get("pageToken") or 0)
+        end = start + UPSTREAM_PAGE_SIZE
+        response = {"caseAlerts": ALERTS[start:end], "totalCount": len(ALERTS)}
+        if end < len(ALERTS):
+            response["nextPageToken"] = str(end)
+        return json.loads(json.dumps(response))
+
+    client.get = AsyncMock(side_effect=get)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_pages_cross_upstream_pages_and_keep_other_fields(http_client):
+    """Pages of any size resume mid-page and keep top-level values."""
+    seen = []
+    token = None
+    while True:
+        page = await fetch_page(http_client, "/alerts", page_token=token, page_size=2)
+        assert page["totalCount"] == len(ALERTS)
+        seen.extend(page["caseAlerts"])
+        token = page.get("nextPageToken")
+        if token is None:
+            break
+    assert seen == ALERTS
+
+
+@pytest.mark.asyncio
+async def test_malformed_page_token_fails_the_tool(http_client):
+    """A malformed cursor is reported in the tool's failure shape."""
+    with pytest.raises(ValueError):
+        await fetch_page(http_client, "/alerts", page_token="mcp1.not-a-cursor")
+
+    mcp = FastMCP("test")
+    register_tools(mcp)
+    with patch("secops_soar_mcp.bindings.http_client", http_client):
+        content = await mcp.call_tool(
+            "list_alerts_by_case",
+            {"case_id": "1", "next_page_token": "mcp1.not-a-cursor", "page_size": 2},
+        )
+    result = json.loads(content[0].text)
+    assert result["Status"] == "Failed"
+    assert "Invalid page token" in result["Message"]
+    http_client.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "page_size, expected_skips, expected_pages",
+    [
+        (3, [0, 3, 6], [[0, 1, 2], [3, 4, 5], [6]]),
+        (None, [0], [list(range(7))]),
+    ],
+)
+async def test_odata_pages_stop_at_a_short_page(
+    page_size, expected_skips, expected_pages
+):
+    """$top/$skip paging follows full pages and stops after a short one."""
+    client = HttpClient("https://soar", "key")
+
+    async def get(endpoint, params=None, use_cache=True):
+        skip = params["$skip"]
+        top = params.get("$top", len(ALERTS))
+        return {"caseAlerts": ALERTS[skip : skip + top]}
+
+    client.get = AsyncMock(side_effect=get)
+    pages = [
+        page async for page in client.paginate("/alerts", page_size=page_size, odata=True)
+    ]
+
+    assert [[alert["id"] for alert in page.items] for page in pages] == expected_pages
+    assert [call.kwargs["params"]["$skip"] for call in client.get.call_args_list] == expected_skips
+    assert pages[-1].next_page_token is None
+    assert [page.next_page_token for page in pages[:-1]] == [
+        str(skip) for skip in expected_skips[1:]
+    ]
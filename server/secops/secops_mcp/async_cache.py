@@ -0,0 +1,140 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""LRU cache with a TTL whose concurrent misses share a single fetch.
+
+Tools that cache slow lookups (entity summaries, query translations) build on
+`AsyncTTLCache` and only add their key scheme and, where needed, persistence.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+# The TTL setting value that keeps entries until they are evicted.
+NEVER_EXPIRE = 'never'
+
+
+def ttl_from_env(name: str, default: float) -> Optional[float]:
+    """Reads a cache TTL setting: seconds, 0 to disable, or 'never'."""
+    value = os.environ.get(name, '').strip()
+    if not value:
+        return default
+    if value.lower() == NEVER_EXPIRE:
+        return None
+    return float(value)
+
+
+class AsyncTTLCache:
+    """LRU cache with a TTL; concurrent misses for a key share one fetch.
+
+    Entries are stored as (value, created_at), created_at being a reading of
+    `clock`. Pass `time.time` as the clock for entries that outlive the
+    process.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: Optional[float],
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initializes the cache.
+
+        Args:
+            max_entries: The maximum number of cached values.
+            ttl: Seconds a value stays valid; 0 disables the cache and None
+                keeps values until they are evicted.
+            clock: Returns the current time in seconds.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl is None or self.ttl > 0
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl is not None and self.clock() - created_at > self.ttl
+
+    def _cacheable(self, value: Any) -> bool:
+        """Whether a fetched value is stored; None never is."""
+        return value is not None
+
+    def _evict(self):
+        """Drops the least recently used entries beyond max_entries."""
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._expired(entry[1]):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (value, self.clock())
+            self._entries.move_to_end(key)
+            self._evict()
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        bypass: bool = False,
+    ) -> Tuple[Any, bool]:
+        """Returns (value, cached), fetching and caching the value on a miss.
+
+        Concurrent misses for the same key share one fetch. A fetch that
+        raises is not cached.
+
+        Args:
+            key: The cache key.
+            fetch: Fetches the value.
+            bypass: Whether to ignore the cached value. The fetched value
+                still replaces it.
+        """
+        if not bypass:
+            cached = self.get(key)
+            if cached is not None:
+                return cached, True
+            pending = self._pending.get(key)
+            if pending is not None:
+                return await asyncio.shield(pending), False
+        future = asyncio.ensure_future(fetch())
+        if not bypass:
+            self._pending[key] = future
+        try:
+            value = await asyncio.shield(future)
+        finally:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+        if self._cacheable(value):
+            self.put(key, value)
+        return value, False
@@ -0,0 +1,140 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Process-wide pool of Chronicle clients.
+
+Creating a Chronicle client resolves credentials and sets up a new
+authorized session, which dominates the latency of cheap API calls. The pool
+creates one client per (project, customer, region, credential source) and
+refreshes their access tokens in the background before they expire.
+"""
+
+import datetime
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger('secops-mcp')
+
+# Refresh tokens expiring within this many seconds.
+REFRESH_MARGIN_SECONDS = 300
+REFRESH_INTERVAL_SECONDS = 60
+
+ClientKey = Tuple[str, str, str, str]
+
+
+def _token_expiring(credentials: Any, margin: float) -> bool:
+    expiry = getattr(credentials, 'expiry', None)
+    if not getattr(credentials, 'token', None) or expiry is None:
+        return True
+    # google-auth stores expiry as a naive UTC datetime.
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    return (expiry - now).total_seconds() < margin
+
+
+class ChronicleClientPool:
+    """Caches Chronicle clients and keeps their access tokens fresh."""
+
+    def __init__(
+        self,
+        factory: Callable[[str, str, str, Optional[str]], Any],
+        refresh_interval: float = REFRESH_INTERVAL_SECONDS,
+        refresh_margin: float = REFRESH_MARGIN_SECONDS,
+    ):
+        """Initializes the pool.
+
+        Args:
+            factory: Creates a Chronicle client from a project ID, customer ID,
+                region and service account path (None for default credentials).
+            refresh_interval: Seconds between background token checks.
+            refresh_margin: Tokens expiring within this many seconds are
+                refreshed.
+        """
+        self._factory = factory
+        self._refresh_interval = refresh_interval
+        self._refresh_margin = refresh_margin
+        self._clients: Dict[ClientKey, Any] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    def get(
+        self,
+        project_id: str,
+        customer_id: str,
+        region: str,
+        service_account_path: Optional[str] = None,
+    ) -> Any:
+        """Returns the pooled client for the given instance and credentials."""
+        key = (project_id, customer_id, region, service_account_path or 'adc')
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._factory(
+                    project_id, customer_id, region, service_account_path
+                )
+                self._clients[key] = client
+                self._start_refresh()
+        return client
+
+    def _start_refresh(self):
+        if self._refresh_thread is None and self._refresh_interval > 0:
+            self._stop.clear()
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_loop,
+                name='chronicle-token-refresh',
+                daemon=True,
+            )
+            self._refresh_thread.start()
+
+    def refresh_tokens(self):
+        """Refreshes the access tokens that are about to expire."""
+        # Imported lazily so the pool can be used without google-auth.
+        from google.auth.transport.requests import Request
+
+        with self._lock:
+            clients = list(self._clients.items())
+        refreshed = set()
+        for key, client in clients:
+            credentials = getattr(client.session, 'credentials', None)
+            if credentials is None or id(credentials) in refreshed:
+                continue
+            refreshed.add(id(credentials))
+            if not _token_expiring(credentials, self._refresh_margin):
+                continue
+            try:
+                credentials.refresh(Request())
+            except Exception as e:
+                logger.warning('Failed to refresh token for %s: %s', key[:3], e)
+
+    def _refresh_loop(self):
+        while not self._stop.wait(self._refresh_interval):
+            self.refresh_tokens()
+
+    def close(self):
+        """Stops the background refresh and closes every pooled session."""
+        self._stop.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout=5)
+            self._refresh_thread = None
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            try:
+                client.session.close()
+            except Exception as e:
+                logger.debug('Failed to close session: %s', e)
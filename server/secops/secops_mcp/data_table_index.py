@@ -0,0 +1,264 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Indexed local copies of data tables.
+
+Finding one row by listing a large table is slow. A cached copy of the table
+answers lookups from per-column indexes instead, built when a column is
+first queried:
+
+- exact: a hash index of values (case-folded; exact case is checked on the
+  matches),
+- prefix: a sorted list of values, searched with bisect,
+- cidr: rows whose network (or address) contains the query address or
+  network, from one hash index per prefix length,
+- in_cidr: rows whose address falls inside the query network, from a sorted
+  list of addresses.
+
+The copy is reused while the table's update time is unchanged and it is
+younger than a maximum age.
+"""
+
+import asyncio
+import bisect
+import ipaddress
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger('secops-mcp')
+
+DEFAULT_MAX_TABLES = 8
+DEFAULT_MAX_AGE_SECONDS = 300
+MATCH_TYPES = ('exact', 'prefix', 'cidr', 'in_cidr')
+
+_Network = Any  # ipaddress.IPv4Network or IPv6Network
+
+
+def _network(value: str) -> Optional[_Network]:
+    try:
+        return ipaddress.ip_network(value.strip(), strict=False)
+    except ValueError:
+        return None
+
+
+class DataTableIndex:
+    """Rows of a data table with lazily built per-column indexes."""
+
+    def __init__(
+        self,
+        columns: List[str],
+        rows: List[Dict[str, Any]],
+        version: Optional[str] = None,
+    ):
+        self.columns = columns
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.row_ids = [row.get('name', '').split('/')[-1] for row in rows]
+        self.values = [list(row.get('values', [])) for row in rows]
+        self._exact: Dict[int, Dict[str, List[int]]] = {}
+        self._sorted: Dict[int, List[Tuple[str, int]]] = {}
+        self._networks: Dict[int, Dict[Tuple[int, int], Dict[int, List[int]]]] = {}
+        self._addresses: Dict[int, Dict[int, List[Tuple[int, int]]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def row_count(self) -> int:
+        return len(self.values)
+
+    def _column(self, column: str) -> int:
+        try:
+            return self.columns.index(column)
+        except ValueError:
+            raise KeyError(f"Unknown column '{column}'; columns are {self.columns}") from None
+
+    def _cells(self, index: int):
+        for position, values in enumerate(self.values):
+            if index < len(values):
+                yield position, values[index]
+
+    def _exact_index(self, index: int) -> Dict[str, List[int]]:
+        with self._lock:
+            if index not in self._exact:
+                built: Dict[str, List[int]] = {}
+                for position, value in self._cells(index):
+                    built.setdefault(value.casefold(), []).append(position)
+                self._exact[index] = built
+            return self._exact[index]
+
+    def _sorted_index(self, index: int) -> List[Tuple[str, int]]:
+        with self._lock:
+            if index not in self._sorted:
+                self._sorted[index] = sorted(
+                    (value.casefold(), position) for position, value in self._cells(index)
+                )
+            return self._sorted[index]
+
+    def _network_index(self, index: int) -> Dict[Tuple[int, int], Dict[int, List[int]]]:
+        """Maps (IP version, prefix length) to {network address: positions}."""
+        with self._lock:
+            if index not in self._networks:
+                built: Dict[Tuple[int, int], Dict[int, List[int]]] = {}
+                for position, value in self._cells(index):
+                    network = _network(value)
+                    if network is not None:
+                        by_address = built.setdefault((network.version, network.prefixlen), {})
+                        by_address.setdefault(int(network.network_address), []).append(position)
+                self._networks[index] = built
+            return self._networks[index]
+
+    def _address_index(self, index: int) -> Dict[int, List[Tuple[int, int]]]:
+        """Maps IP version to a sorted list of (address, position)."""
+        with self._lock:
+            if index not in self._addresses:
+                built: Dict[int, List[Tuple[int, int]]] = {4: [], 6: []}
+                for position, value in self._cells(index):
+                    network = _network(value)
+                    if network is not None and network.num_addresses == 1:
+                        built[network.version].append((int(network.network_address), position))
+                for addresses in built.values():
+                    addresses.sort()
+                self._addresses[index] = built
+            return self._addresses[index]
+
+    def lookup(
+        self,
+        column: str,
+        value: str,
+        match: str = 'exact',
+        case_insensitive: bool = False,
+    ) -> List[int]:
+        """Returns positions of rows whose `column` matches `value`, in row order.
+
+        Raises:
+            KeyError: If the column does not exist.
+            ValueError: If the match type or a cidr query value is invalid.
+        """
+        index = self._column(column)
+        if match == 'exact':
+            positions = self._exact_index(index).get(value.casefold(), [])
+            if not case_insensitive:
+                positions = [p for p in positions if self.values[p][index] == value]
+            return list(positions)
+        if match == 'prefix':
+            entries = self._sorted_index(index)
+            key = value.casefold()
+            start = bisect.bisect_left(entries, (key,))
+            positions = []
+            for folded, position in entries[start:]:
+                if not folded.startswith(key):
+                    break
+                if case_insensitive or self.values[position][index].startswith(value):
+                    positions.append(position)
+            return sorted(positions)
+        if match in ('cidr', 'in_cidr'):
+            query = _network(value)
+            if query is None:
+                raise ValueError(f"'{value}' is not an IP address or network")
+            if match == 'cidr':
+                positions = []
+                for (version, prefixlen), by_address in self._network_index(index).items():
+                    if version != query.version or prefixlen > query.prefixlen:
+                        continue
+                    masked = query.supernet(new_prefix=prefixlen) if prefixlen < query.prefixlen else query
+                    positions.extend(by_address.get(int(masked.network_address), []))
+                return sorted(positions)
+            addresses = self._address_index(index)[query.version]
+            low = bisect.bisect_left(addresses, (int(query.network_address), -1))
+            high = bisect.bisect_right(addresses, (int(query.broadcast_address), len(self.values)))
+            return sorted(position for _, position in addresses[low:high])
+        raise ValueError(f"Unknown match type '{match}'; use one of {list(MATCH_TYPES)}")
+
+    def row(self, position: int) -> Dict[str, Any]:
+        """Returns a row as {'row_id': ..., 'values': {column: value}}."""
+        return {
+            'row_id': self.row_ids[position],
+            'values': dict(zip(self.columns, self.values[position])),
+        }
+
+
+class DataTableCache:
+    """LRU cache of DataTableIndex copies, refreshed when the table changes."""
+
+    def __init__(
+        self,
+        max_tables: int = DEFAULT_MAX_TABLES,
+        max_age: float = DEFAULT_MAX_AGE_SECONDS,
+    ):
+        self.max_tables = max_tables
+        self.max_age = max_age
+        self._tables: 'OrderedDict[Tuple, DataTableIndex]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple, asyncio.Future] = {}
+
+    def invalidate(self, key: Tuple):
+        with self._lock:
+            self._tables.pop(key, None)
+
+    def _fresh(self, key: Tuple, version: Optional[str]) -> Optional[DataTableIndex]:
+        with self._lock:
+            table = self._tables.get(key)
+            if table is None:
+                return None
+            if table.version != version or time.monotonic() - table.loaded_at > self.max_age:
+                del self._tables[key]
+                return None
+            self._tables.move_to_end(key)
+            return table
+
+    async def get(
+        self,
+        key: Tuple,
+        version: Optional[str],
+        load: Callable[[], Awaitable[DataTableIndex]],
+        refresh: bool = False,
+    ) -> Tuple[DataTableIndex, bool]:
+        """Returns (index, cached), loading the table unless a fresh copy exists.
+
+        Args:
+            key: Identifies the table, e.g. (instance, table name).
+            version: The table's current version (its update time); a cached
+                copy of another version is reloaded.
+            load: Loads the table's rows into a DataTableIndex.
+            refresh: Reload even if the cached copy is fresh.
+        """
+        if not refresh:
+            table = self._fresh(key, version)
+            if table is not None:
+                return table, True
+            pending = self._pending.get(key)
+            if pending is not None:
+                return await asyncio.shield(pending), False
+        future = asyncio.ensure_future(load())
+        self._pending[key] = future
+        try:
+            table = await asyncio.shield(future)
+        finally:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+        if self.max_age > 0:
+            with self._lock:
+                self._tables[key] = table
+                self._tables.move_to_end(key)
+                while len(self._tables) > self.max_tables:
+                    self._tables.popitem(last=False)
+        return table, False
+
+
+data_table_cache = DataTableCache(
+    max_tables=int(os.environ.get('SECOPS_DATA_TABLE_CACHE_TABLES', DEFAULT_MAX_TABLES)),
+    max_age=float(os.environ.get('SECOPS_DATA_TABLE_CACHE_MAX_AGE', DEFAULT_MAX_AGE_SECONDS)),
+)
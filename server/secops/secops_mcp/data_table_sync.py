@@ -0,0 +1,237 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Incremental sync of a data table from a local CSV or NDJSON file.
+
+Rows are compared by a hash of their values. The file is read twice, as a
+stream: once to count the hashes of its rows, and once to collect the rows
+the table is missing. Only those rows are inserted and then only table rows
+the file no longer has are deleted, so syncing a large table that changed a
+little sends little. Duplicate rows are kept as many times as the file has
+them.
+"""
+
+import asyncio
+import csv
+import hashlib
+import json
+import logging
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List
+
+logger = logging.getLogger('secops-mcp')
+
+# bulkCreate accepts up to 1000 rows and about 4 MB per request; stay under it.
+MAX_INSERT_ROWS = 1000
+MAX_INSERT_BYTES = 2 * 1024 * 1024
+DELETE_CHUNK_ROWS = 100
+DEFAULT_CONCURRENCY = 4
+MAX_REPORTED_ERRORS = 20
+
+
+def row_hash(values: List[str]) -> bytes:
+    """Returns a digest identifying a row by its values."""
+    return hashlib.sha1(json.dumps(values, ensure_ascii=False).encode('utf-8')).digest()
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value).strip()
+
+
+def table_columns(data_table: Dict[str, Any]) -> List[str]:
+    """Returns a data table's column names in column order."""
+    columns = sorted(data_table.get('columnInfo', []), key=lambda c: c.get('columnIndex', 0))
+    return [column.get('originalColumn', '') for column in columns]
+
+
+def iter_file_rows(path: str, columns: List[str], file_format: str = 'csv') -> Iterator[List[str]]:
+    """Yields the rows of a CSV or NDJSON file as values in `columns` order.
+
+    CSV files need a header row naming the columns. NDJSON lines are objects
+    keyed by column name, or arrays already in column order. Blank lines are
+    skipped.
+
+    Raises:
+        ValueError: If the file's columns do not match `columns`.
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if file_format == 'csv':
+            reader = csv.reader(f)
+            header = [name.strip() for name in next(reader, [])]
+            if sorted(header) != sorted(columns):
+                raise ValueError(f'CSV header {header} does not match table columns {columns}')
+            order = [header.index(column) for column in columns]
+            for values in reader:
+                if values:
+                    yield [_cell(values[i]) if i < len(values) else '' for i in order]
+        elif file_format == 'ndjson':
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                if isinstance(item, dict):
+                    unknown = set(item) - set(columns)
+                    if unknown:
+                        raise ValueError(f'Line {number} has unknown columns {sorted(unknown)}')
+                    yield [_cell(item.get(column)) for column in columns]
+                elif isinstance(item, list) and len(item) == len(columns):
+                    yield [_cell(value) for value in item]
+                else:
+                    raise ValueError(f'Line {number} is not an object or a row of {len(columns)} values')
+        else:
+            raise ValueError(f"Unknown file format '{file_format}'; use 'csv' or 'ndjson'")
+
+
+def _row_size(values: List[str]) -> int:
+    # JSON of {"values": [...]} with quotes, commas and some escaping.
+    return 30 + sum(len(value) + 3 + len(value) // 10 for value in values)
+
+
+def insert_chunks(
+    rows: Iterable[List[str]],
+    max_rows: int = MAX_INSERT_ROWS,
+    max_bytes: int = MAX_INSERT_BYTES,
+) -> Iterator[List[List[str]]]:
+    """Groups rows into bulkCreate requests of at most max_rows and max_bytes."""
+    chunk: List[List[str]] = []
+    size = 0
+    for values in rows:
+        row_size = _row_size(values)
+        if chunk and (len(chunk) >= max_rows or size + row_size > max_bytes):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(values)
+        size += row_size
+    if chunk:
+        yield chunk
+
+
+def _chunks(items: List[Any], size: int) -> Iterator[List[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+async def _submit_chunks(
+    chunks: Iterable[List[Any]],
+    send: Callable[[List[Any]], Awaitable[Any]],
+    concurrency: int,
+    errors: List[str],
+    action: str,
+) -> int:
+    """Sends chunks, `concurrency` at a time; returns the number of items sent.
+
+    Chunks are read from `chunks` only as slots free up, in a worker thread,
+    since producing them may read and hash the file.
+    """
+    done = 0
+
+    async def run(chunk: List[Any]):
+        nonlocal done
+        try:
+            await send(chunk)
+            done += len(chunk)
+        except Exception as e:
+            logger.warning(f'Failed to {action} {len(chunk)} data table rows: {e}')
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append(f'Failed to {action} {len(chunk)} rows: {e}')
+
+    pending = set()
+    chunk_iter = iter(chunks)
+    while True:
+        chunk = await asyncio.to_thread(next, chunk_iter, None)
+        if chunk is None:
+            break
+        if len(pending) >= max(1, concurrency):
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        pending.add(asyncio.ensure_future(run(chunk)))
+    if pending:
+        await asyncio.gather(*pending)
+    return done
+
+
+async def sync_table_rows(
+    existing_rows: List[Dict[str, Any]],
+    read_rows: Callable[[], Iterable[List[str]]],
+    insert: Callable[[List[List[str]]], Awaitable[Any]],
+    delete: Callable[[List[str]], Awaitable[Any]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """Makes a table's rows match a file's rows.
+
+    Args:
+        existing_rows: The table's rows, as returned by list_data_table_rows.
+        read_rows: Returns a fresh iterator over the file's rows; called twice.
+        insert: Creates a chunk of rows (lists of values).
+        delete: Deletes a chunk of rows by row ID.
+        concurrency: Chunks sent at once, for inserts and for deletes.
+        dry_run: Only compute the diff.
+
+    Returns:
+        Counts of file rows, table rows, unchanged rows, rows to insert and
+        delete, rows inserted and deleted, and any errors.
+    """
+    table_index: Dict[bytes, List[str]] = {}
+    for row in existing_rows:
+        values = [_cell(value) for value in row.get('values', [])]
+        row_id = row.get('name', '').split('/')[-1]
+        table_index.setdefault(row_hash(values), []).append(row_id)
+
+    # Hashing a large file would hold up the event loop.
+    wanted = await asyncio.to_thread(lambda: Counter(row_hash(values) for values in read_rows()))
+
+    missing: Dict[bytes, int] = {}
+    to_delete: List[str] = []
+    for digest, count in wanted.items():
+        have = len(table_index.get(digest, ()))
+        if count > have:
+            missing[digest] = count - have
+    for digest, row_ids in table_index.items():
+        surplus = len(row_ids) - wanted.get(digest, 0)
+        if surplus > 0:
+            # Keep the first copies; rows are listed oldest first.
+            to_delete.extend(row_ids[-surplus:])
+
+    result: Dict[str, Any] = {
+        'file_rows': sum(wanted.values()),
+        'table_rows': len(existing_rows),
+        'unchanged': len(existing_rows) - len(to_delete),
+        'to_insert': sum(missing.values()),
+        'to_delete': len(to_delete),
+        'inserted': 0,
+        'deleted': 0,
+        'errors': [],
+    }
+    if dry_run:
+        return result
+
+    def rows_to_insert() -> Iterator[List[str]]:
+        for values in read_rows():
+            digest = row_hash(values)
+            if missing.get(digest, 0) > 0:
+                missing[digest] -= 1
+                yield values
+
+    # Insert before deleting, so an interrupted sync leaves extra rows behind
+    # rather than missing ones; the next sync removes them.
+    result['inserted'] = await _submit_chunks(
+        insert_chunks(rows_to_insert()), insert, concurrency, result['errors'], 'insert'
+    )
+    result['deleted'] = await _submit_chunks(
+        _chunks(to_delete, DELETE_CHUNK_ROWS), delete, concurrency, result['errors'], 'delete'
+    )
+    return result
@@ -0,0 +1,104 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Indicator normalization and a TTL cache of entity summaries.
+
+IOC triage lists repeat indicators, in different spellings (defanged,
+upper case, with brackets), across lists and across turns. Indicators are
+normalized before lookup, and entity summaries are cached for a short time.
+"""
+
+import ipaddress
+import logging
+import os
+import re
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from secops_mcp.async_cache import AsyncTTLCache, ttl_from_env
+
+logger = logging.getLogger('secops-mcp')
+
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_TTL_SECONDS = 600
+
+_HASH_LENGTHS = {32: 'md5', 40: 'sha1', 64: 'sha256'}
+_HEX = re.compile(r'^[0-9a-fA-F]+$')
+_EMAIL = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+_DOMAIN = re.compile(r'^(?=.{1,253}$)([a-zA-Z0-9_-]{1,63}\.)+[a-zA-Z]{2,63}\.?$')
+_DEFANG = (
+    ('[.]', '.'), ('(.)', '.'), ('{.}', '.'), ('[dot]', '.'),
+    ('[@]', '@'), ('[at]', '@'), ('[:]', ':'),
+)
+
+
+def normalize_indicator(value: str) -> Tuple[str, str]:
+    """Normalizes an indicator and detects its kind.
+
+    Surrounding whitespace, quotes and brackets are removed and common
+    defanging (`1.2.3[.]4`, `hxxp://`) is undone. IPs, domains, hashes and
+    email addresses are lowercased; other values (e.g. user names) keep their
+    case.
+
+    Returns:
+        (normalized value, kind), kind being one of 'ip', 'md5', 'sha1',
+        'sha256', 'email', 'url', 'domain' or 'other'.
+    """
+    value = value.strip().strip('\'"`<>[](){}').strip()
+    for defanged, fanged in _DEFANG:
+        value = value.replace(defanged, fanged)
+    lowered = value.lower()
+    if lowered.startswith(('hxxp://', 'hxxps://')):
+        value = 'http' + value[4:]
+        lowered = value.lower()
+    try:
+        return str(ipaddress.ip_address(value)), 'ip'
+    except ValueError:
+        pass
+    if len(value) in _HASH_LENGTHS and _HEX.match(value):
+        return lowered, _HASH_LENGTHS[len(value)]
+    if _EMAIL.match(value):
+        return lowered, 'email'
+    if '://' in value:
+        return value, 'url'
+    if _DOMAIN.match(value):
+        return lowered.rstrip('.'), 'domain'
+    return value, 'other'
+
+
+class EntitySummaryCache(AsyncTTLCache):
+    """LRU cache of entity summaries with a TTL; 0 disables caching."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = DEFAULT_TTL_SECONDS,
+    ):
+        super().__init__(max_entries, ttl)
+
+    async def lookup(
+        self,
+        key: Tuple,
+        fetch: Callable[[], Awaitable[Any]],
+        bypass: bool = False,
+    ) -> Tuple[Any, bool]:
+        """Returns (summary, cached), fetching and caching it on a miss.
+
+        Failed lookups are not cached.
+        """
+        return await self.get_or_fetch(key, fetch, bypass)
+
+
+entity_summary_cache = EntitySummaryCache(
+    max_entries=int(os.environ.get('SECOPS_ENTITY_CACHE_SIZE', DEFAULT_MAX_ENTRIES)),
+    ttl=ttl_from_env('SECOPS_ENTITY_CACHE_TTL', DEFAULT_TTL_SECONDS),
+)
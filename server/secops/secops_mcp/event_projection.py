@@ -0,0 +1,143 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Field projection and tabular encoding of UDM search events.
+
+Full UDM events are large and mostly unused by the caller. Search tools can
+return only selected field paths (e.g. `principal.ip`), and optionally encode
+the events as one header row plus value rows instead of repeating every key
+in every event.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from secops_mcp.result_store import flatten_event, snake_case
+
+
+def _build_tree(fields: List[str]) -> Dict[str, Any]:
+    """Builds a nested dict of snake_case path parts; None marks a leaf."""
+    tree: Dict[str, Any] = {}
+    for field in fields:
+        parts = field.split('.')
+        if parts[0] == 'udm':
+            parts = parts[1:]
+        node = tree
+        for part in parts[:-1]:
+            child = node.get(part)
+            if child is None:
+                if part in node:
+                    break  # A parent path is selected already.
+                child = node[part] = {}
+            node = child
+        else:
+            node[parts[-1]] = None
+    return tree
+
+
+def _project(value: Any, tree: Dict[str, Any]) -> Any:
+    if isinstance(value, list):
+        projected = [_project(item, tree) for item in value]
+        return [item for item in projected if item not in (None, {})] or None
+    if not isinstance(value, dict):
+        return None
+    result = {}
+    for key, item in value.items():
+        snake = snake_case(key)
+        if snake not in tree:
+            continue
+        subtree = tree[snake]
+        if subtree is None:
+            result[key] = item
+        else:
+            projected = _project(item, subtree)
+            if projected not in (None, {}):
+                result[key] = projected
+    return result
+
+
+class EventProjection:
+    """Projects UDM search events onto a set of field paths."""
+
+    def __init__(self, fields: List[str]):
+        self.fields = [field[4:] if field.startswith('udm.') else field for field in fields]
+        self._tree = _build_tree(self.fields)
+
+    def project(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns the event with only the selected UDM fields and its name."""
+        projected = {}
+        if 'name' in event:
+            projected['name'] = event['name']
+        projected['udm'] = _project(event.get('udm', {}), self._tree) or {}
+        return projected
+
+
+def project_events(
+    events: List[Dict[str, Any]], fields: Optional[List[str]]
+) -> List[Dict[str, Any]]:
+    """Projects events onto `fields`; returns them unchanged if fields is empty."""
+    if not fields:
+        return events
+    projection = EventProjection(fields)
+    return [projection.project(event) for event in events]
+
+
+def to_table(
+    events: List[Dict[str, Any]], fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Encodes events as {'columns': [...], 'rows': [[...], ...]}.
+
+    Columns are `fields` (after 'name') or, without fields, every field path
+    present in the events in first-seen order. A field selecting a whole
+    message (e.g. `principal`) expands to the paths found under it. Repeated
+    fields are lists and missing fields are None.
+    """
+    flattened = [flatten_event(event) for event in events]
+    present = list(dict.fromkeys(key for row in flattened for key in row))
+    if fields:
+        columns = ['name']
+        for field in fields:
+            field = field[4:] if field.startswith('udm.') else field
+            nested = [key for key in present if key.startswith(field + '.')]
+            columns.extend(nested if nested and field not in present else [field])
+        columns = list(dict.fromkeys(columns))
+    else:
+        columns = present
+
+    def cell(value: Any) -> Any:
+        return list(value) if isinstance(value, tuple) else value
+
+    return {
+        'columns': columns,
+        'rows': [[cell(row.get(column)) for column in columns] for row in flattened],
+    }
+
+
+def shape_events(
+    result: Dict[str, Any],
+    fields: Optional[List[str]],
+    compact: bool,
+) -> Dict[str, Any]:
+    """Applies projection and compact encoding to a search_udm style result.
+
+    With `compact`, the 'events' list is replaced by 'columns' and 'rows'.
+    """
+    events = result.get('events')
+    if not isinstance(events, list) or not (fields or compact):
+        return result
+    shaped = dict(result)
+    if compact:
+        del shaped['events']
+        shaped.update(to_table(project_events(events, fields), fields))
+    else:
+        shaped['events'] = project_events(events, fields)
+    return shaped
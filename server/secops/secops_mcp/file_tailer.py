@@ -0,0 +1,443 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tails local log files into Chronicle, resuming from a checkpoint.
+
+Files are tracked by identity (device and inode), not by name, so a file
+that is rotated (renamed) while partly read is finished under its new name,
+and the new file at the old name is read from the start. A file that shrank
+(copy-truncate rotation) or whose first bytes changed (inode reuse) is read
+from the start again.
+
+Lines are read in chunks, packed into batches and submitted by the ingestion
+engine, so memory stays bounded however large the files are. A file's
+checkpoint advances only past batches that were ingested, in order, and is
+saved every few seconds and at the end of each pass, so a restart resumes
+after the last saved line. A batch rejected permanently (see
+ingestion_engine.is_retryable) is skipped, like an invalid line. After any
+other failed batch the file is not read again until the next run, which sends
+the lines after the failed batch again.
+"""
+
+import asyncio
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from secops_mcp.ingestion_engine import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RETRY_DELAY,
+    MAX_BATCH_BYTES,
+    MAX_BATCH_ENTRIES,
+    IngestionReport,
+    encoded_size,
+    entry_overhead,
+    submit_batches,
+)
+
+logger = logging.getLogger('secops-mcp')
+
+DEFAULT_CHECKPOINT_PATH = os.path.join(
+    os.path.expanduser('~'), '.secops-mcp', 'tail_checkpoints.json'
+)
+DEFAULT_POLL_INTERVAL = 1.0
+# Seconds between checkpoint saves while batches are being ingested.
+DEFAULT_SAVE_INTERVAL = 5.0
+READ_CHUNK_BYTES = 1024 * 1024
+HEAD_BYTES = 1024
+# Rotated files are often compressed; they are never read.
+SKIPPED_SUFFIXES = ('.gz', '.bz2', '.xz', '.zip', '.zst')
+
+
+def file_identity(stat: os.stat_result) -> str:
+    return f'{stat.st_dev}:{stat.st_ino}'
+
+
+def _head_digest(handle, length: int) -> str:
+    handle.seek(0)
+    return hashlib.sha256(handle.read(length)).hexdigest()
+
+
+class TailCheckpoint:
+    """Byte offsets of tailed files by file identity, persisted as JSON.
+
+    Entries change on the event loop and in the batch reading thread, and are
+    saved from yet another thread, so changes and snapshots hold a lock.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f'Ignoring unreadable tail checkpoint {path}: {e}')
+
+    def get(self, identity: str) -> Optional[Dict[str, Any]]:
+        return self.entries.get(identity)
+
+    def set(self, identity: str, path: str, offset: int, head: str, head_length: int):
+        with self._lock:
+            self.entries[identity] = {
+                'path': path,
+                'offset': offset,
+                'head': head,
+                'head_length': head_length,
+                'updated': time.time(),
+            }
+            self._dirty = True
+
+    def prune(self, seen: Set[str], directories: List[str]):
+        """Drops entries for files in `directories` that were not seen."""
+        with self._lock:
+            for identity, entry in list(self.entries.items()):
+                if identity not in seen and os.path.dirname(entry['path']) in directories:
+                    del self.entries[identity]
+                    self._dirty = True
+
+    def save(self):
+        """Writes the entries if they changed since the last save."""
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                entries = dict(self.entries)
+                self._dirty = False
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            partial = self.path + '.part'
+            with open(partial, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.replace(partial, self.path)
+
+
+@dataclass
+class TailFile:
+    """A file to read, from `offset`, as found by discover_files."""
+
+    path: str
+    identity: str
+    offset: int
+    size: int
+    head: str
+    head_length: int
+    # Rotated away from its tailed name: nothing more will be appended, so a
+    # last line without a newline is read too.
+    rotated: bool = False
+
+
+def _candidates(path: str, pattern: str) -> List[Tuple[str, bool]]:
+    """Returns (file path, rotated) pairs for a tailed file or directory."""
+    if os.path.isdir(path):
+        return [
+            (os.path.join(path, name), False)
+            for name in sorted(os.listdir(path))
+            if fnmatch.fnmatch(name, pattern)
+        ]
+    directory, base = os.path.split(path)
+    rotated = [
+        (os.path.join(directory, name), True)
+        for name in sorted(os.listdir(directory or '.'))
+        if name != base and name.startswith(base)
+    ]
+    return [(path, False)] + rotated
+
+
+def discover_files(
+    paths: List[str], checkpoint: TailCheckpoint, pattern: str = '*'
+) -> List[TailFile]:
+    """Lists files with unread data, oldest first, with their start offsets.
+
+    For a directory, files matching `pattern` are tailed. For a file, rotated
+    copies next to it (e.g. `app.log.1` for `app.log`) are included if they
+    were being tailed under the original name and are not fully read.
+    """
+    found: Dict[str, Tuple[float, TailFile]] = {}
+    directories = []
+    for path in paths:
+        path = os.path.abspath(path)
+        directories.append(path if os.path.isdir(path) else os.path.dirname(path))
+        for candidate, rotated in _candidates(path, pattern):
+            if candidate.endswith(SKIPPED_SUFFIXES) or candidate.endswith('.part'):
+                continue
+            try:
+                stat = os.stat(candidate)
+            except OSError:
+                continue
+            identity = file_identity(stat)
+            if identity in found or not os.path.isfile(candidate):
+                continue
+            entry = checkpoint.get(identity)
+            if rotated and entry is None:
+                continue  # Rotated before it was first tailed.
+            rotated = rotated or (entry is not None and entry['path'] != candidate)
+            with open(candidate, 'rb') as handle:
+                offset = 0
+                if entry is not None:
+                    if (
+                        entry['offset'] <= stat.st_size
+                        and entry['head_length'] <= stat.st_size
+                        and _head_digest(handle, entry['head_length']) == entry['head']
+                    ):
+                        offset = entry['offset']
+                    else:
+                        logger.info(f'{candidate} was truncated or replaced; reading it from the start')
+                head_length = min(stat.st_size, HEAD_BYTES)
+                head = _head_digest(handle, head_length)
+            found[identity] = (
+                stat.st_mtime,
+                TailFile(candidate, identity, offset, stat.st_size, head, head_length, rotated),
+            )
+    checkpoint.prune(set(found), directories)
+    # Rotated files first: they hold older lines than the live file.
+    files = sorted(found.values(), key=lambda item: (not item[1].rotated, item[0]))
+    return [tail for _, tail in files if tail.offset < tail.size]
+
+
+def read_lines(tail: TailFile) -> Iterator[Tuple[str, int]]:
+    """Yields (line, offset after the line) for complete lines from tail.offset.
+
+    A last line without a newline is only read from a rotated file. Lines are
+    decoded as UTF-8, replacing undecodable bytes.
+    """
+    try:
+        handle = open(tail.path, 'rb')
+    except OSError as e:
+        logger.warning(f'Cannot open {tail.path}: {e}')
+        return
+    with handle:
+        if file_identity(os.fstat(handle.fileno())) != tail.identity:
+            return  # Rotated again since discovery; picked up next pass.
+        handle.seek(tail.offset)
+        offset = tail.offset
+        pending = b''
+        while True:
+            chunk = handle.read(READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            pending += chunk
+            lines = pending.split(b'\n')
+            pending = lines.pop()
+            for line in lines:
+                offset += len(line) + 1
+                yield line.rstrip(b'\r').decode('utf-8', errors='replace'), offset
+        if pending and tail.rotated:
+            yield pending.rstrip(b'\r').decode('utf-8', errors='replace'), offset + len(pending)
+
+
+class _OffsetTracker:
+    """Advances each file's checkpoint past batches ingested in order.
+
+    Permanently rejected batches are skipped. A file is blocked at its first
+    batch that failed otherwise; `blocked` holds the identities of blocked
+    files and may be shared between passes.
+
+    Batches are read in a worker thread and completed on the event loop, so
+    every method holds a lock.
+    """
+
+    def __init__(
+        self,
+        checkpoint: TailCheckpoint,
+        report: IngestionReport,
+        blocked: Optional[Set[str]] = None,
+    ):
+        self.checkpoint = checkpoint
+        self.report = report
+        self._files: Dict[str, TailFile] = {}
+        # Per file: [end offset, done, ok] for each batch, in read order.
+        self._pending: Dict[str, List[List[Any]]] = {}
+        self._blocked = blocked if blocked is not None else set()
+        self._lock = threading.Lock()
+
+    def add(self, tail: TailFile, end: int) -> Tuple[str, List[Any]]:
+        with self._lock:
+            self._files[tail.identity] = tail
+            mark = [end, False, False]
+            self._pending.setdefault(tail.identity, []).append(mark)
+            return tail.identity, mark
+
+    def done(self, key: Tuple[str, List[Any]], ok: bool, retryable: bool = True):
+        identity, mark = key
+        with self._lock:
+            tail = self._files[identity]
+            if not ok and not retryable:
+                self.report.add_error(
+                    f'{tail.path}: skipped the rejected batch ending at byte {mark[0]}'
+                )
+                ok = True
+            mark[1], mark[2] = True, ok
+            pending = self._pending[identity]
+            committed = None
+            while pending and pending[0][1] and identity not in self._blocked:
+                end, _, ok = pending.pop(0)
+                if not ok:
+                    self._blocked.add(identity)
+                    self.report.add_error(
+                        f'{tail.path}: stopped reading after the failed batch '
+                        f'ending at byte {end}; it is read again on the next run'
+                    )
+                    break
+                committed = end
+            if committed is not None:
+                self.checkpoint.set(identity, tail.path, committed, tail.head, tail.head_length)
+
+
+def _is_json_object(line: str) -> bool:
+    try:
+        return isinstance(json.loads(line), dict)
+    except ValueError:
+        return False
+
+
+def _file_batches(
+    files: List[TailFile],
+    tracker: _OffsetTracker,
+    marks: Dict[int, Tuple[str, List[Any]]],
+    report: IngestionReport,
+    udm: bool,
+    max_bytes: int,
+    max_entries: int,
+    overhead: int,
+) -> Iterator[List[str]]:
+    """Yields batches of lines, one file at a time, recording their end offsets."""
+    index = 0
+    for tail in files:
+        batch: List[str] = []
+        size = 0
+        end = tail.offset
+        for line, line_end in read_lines(tail):
+            entry_size = encoded_size(line, overhead)
+            if not line.strip():
+                pass
+            elif entry_size > max_bytes:
+                report.rejected_entries += 1
+                report.add_error(f'{tail.path}: line ending at byte {line_end} exceeds the batch size limit')
+            elif udm and not _is_json_object(line):
+                report.rejected_entries += 1
+                report.add_error(f'{tail.path}: line ending at byte {line_end} is not a JSON object')
+            else:
+                if batch and (size + entry_size > max_bytes or len(batch) >= max_entries):
+                    marks[index] = tracker.add(tail, end)
+                    index += 1
+                    yield batch
+                    batch, size = [], 0
+                batch.append(line)
+                size += entry_size
+            end = line_end
+        if batch:
+            marks[index] = tracker.add(tail, end)
+            index += 1
+            yield batch
+        elif end > tail.offset:
+            # Only blank or rejected lines are left; skip past them.
+            tracker.done(tracker.add(tail, end), True)
+
+
+async def _save_periodically(
+    checkpoint: TailCheckpoint, interval: float, stop: asyncio.Event
+):
+    """Saves the checkpoint in a thread every `interval` seconds until stopped."""
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), interval)
+        except asyncio.TimeoutError:
+            await asyncio.to_thread(checkpoint.save)
+
+
+async def tail_files(
+    submit: Callable[[List[str]], Awaitable[Any]],
+    paths: List[str],
+    checkpoint: TailCheckpoint,
+    pattern: str = '*',
+    udm: bool = False,
+    follow_seconds: float = 0,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    labels: Optional[Dict[str, str]] = None,
+    max_bytes: int = MAX_BATCH_BYTES,
+    max_entries: int = MAX_BATCH_ENTRIES,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    retry_delay: float = DEFAULT_RETRY_DELAY,
+    save_interval: float = DEFAULT_SAVE_INTERVAL,
+) -> Dict[str, Any]:
+    """Ingests new lines of the given files and directories.
+
+    Args:
+        submit: Sends one batch of lines (raw logs, or UDM event JSON if `udm`).
+        paths: Files or directories to tail.
+        checkpoint: Where offsets are read from and saved to.
+        pattern: Glob for file names in tailed directories.
+        udm: Lines are UDM events as JSON; other lines are rejected.
+        follow_seconds: Keep polling for new data this long; 0 reads once.
+        poll_interval: Seconds between polls when following.
+        labels: Labels sent with each entry, for batch size estimates.
+        max_bytes, max_entries, concurrency, max_retries, retry_delay: See
+            ingestion_engine.submit_batches and iter_batches.
+        save_interval: Seconds between checkpoint saves while ingesting. The
+            checkpoint is always saved once a pass ends.
+
+    Returns:
+        The ingestion report as a dict, plus 'files' read.
+    """
+    report = IngestionReport()
+    overhead = entry_overhead(labels)
+    deadline = time.monotonic() + follow_seconds
+    files_read = set()
+    # Files blocked by a failed batch are not polled again during this call,
+    # so the batches after it are not sent once per poll.
+    blocked: Set[str] = set()
+    while True:
+        files = await asyncio.to_thread(discover_files, paths, checkpoint, pattern)
+        files = [tail for tail in files if tail.identity not in blocked]
+        files_read.update(tail.path for tail in files)
+        tracker = _OffsetTracker(checkpoint, report, blocked)
+        marks: Dict[int, Tuple[str, List[Any]]] = {}
+        stop = asyncio.Event()
+        saver = asyncio.create_task(_save_periodically(checkpoint, save_interval, stop))
+        try:
+            await submit_batches(
+                submit,
+                _file_batches(files, tracker, marks, report, udm, max_bytes, max_entries, overhead),
+                overhead=overhead,
+                concurrency=concurrency,
+                max_retries=max_retries,
+                retry_delay=retry_delay,
+                report=report,
+                on_done=lambda index, ok, retryable: tracker.done(
+                    marks.pop(index), ok, retryable
+                ),
+            )
+        finally:
+            stop.set()
+            await saver
+            await asyncio.to_thread(checkpoint.save)
+        if time.monotonic() + poll_interval > deadline:
+            break
+        await asyncio.sleep(poll_interval)
+    result = report.to_dict()
+    result['files'] = sorted(files_read)
+    return result
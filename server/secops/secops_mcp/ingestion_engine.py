@@ -0,0 +1,309 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Batched, concurrent raw log ingestion.
+
+A logs:import request carries every entry base64 encoded with its
+timestamps and labels, and is limited in size. Entries are packed into
+batches by encoded size and count, batches are submitted a few at a time
+with a bounded queue between the entry source and the submitters (so a
+generator source is only read as fast as batches are sent), and a failed
+batch is retried on its own.
+"""
+
+import asyncio
+import base64
+import binascii
+import gzip
+import io
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from secops.exceptions import APIError
+
+logger = logging.getLogger('secops-mcp')
+
+# logs:import requests are limited to a few MB; stay well under the limit.
+MAX_BATCH_BYTES = 3 * 1024 * 1024
+MAX_BATCH_ENTRIES = 1000
+DEFAULT_CONCURRENCY = 4
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_DELAY = 1.0
+MAX_REPORTED_ITEMS = 20
+# Compressed log data may not decompress to more than this.
+MAX_DECOMPRESSED_BYTES = 256 * 1024 * 1024
+# Statuses of failed requests that may succeed if sent again.
+RETRYABLE_STATUSES = {408, 429, 500, 502, 503, 504}
+# The SDK only reports the HTTP status in the APIError message.
+_API_ERROR_STATUS = re.compile(r'\bstatus(?:_code)?=(\d{3})\b')
+
+# JSON keys, timestamps and punctuation around each entry's data.
+_ENTRY_OVERHEAD = 128
+
+
+def entry_overhead(labels: Optional[Dict[str, str]] = None) -> int:
+    """Returns the request bytes each entry adds besides its encoded data."""
+    if not labels:
+        return _ENTRY_OVERHEAD
+    encoded = {key: {'value': value} for key, value in labels.items()}
+    return _ENTRY_OVERHEAD + len(json.dumps(encoded))
+
+
+def encoded_size(entry: str, overhead: int = _ENTRY_OVERHEAD) -> int:
+    """Returns the request bytes an entry takes once base64 encoded."""
+    return 4 * ((len(entry.encode('utf-8')) + 2) // 3) + overhead
+
+
+def iter_batches(
+    entries: Iterable[str],
+    max_bytes: int = MAX_BATCH_BYTES,
+    max_entries: int = MAX_BATCH_ENTRIES,
+    overhead: int = _ENTRY_OVERHEAD,
+    oversized: Optional[Callable[[str], None]] = None,
+) -> Iterator[List[str]]:
+    """Groups entries into batches of at most max_bytes and max_entries.
+
+    Empty entries are skipped. An entry that alone exceeds max_bytes is
+    passed to `oversized` (if given) instead of being batched.
+    """
+    batch: List[str] = []
+    size = 0
+    for entry in entries:
+        if not entry:
+            continue
+        entry_size = encoded_size(entry, overhead)
+        if entry_size > max_bytes:
+            if oversized is not None:
+                oversized(entry)
+            continue
+        if batch and (size + entry_size > max_bytes or len(batch) >= max_entries):
+            yield batch
+            batch, size = [], 0
+        batch.append(entry)
+        size += entry_size
+    if batch:
+        yield batch
+
+
+def decompress_entries(data: str, max_bytes: int = MAX_DECOMPRESSED_BYTES) -> List[str]:
+    """Decodes base64 gzip-compressed, newline-delimited log entries.
+
+    Raises:
+        ValueError: If the data is not base64 encoded gzip, or decompresses
+            to more than `max_bytes`.
+    """
+    try:
+        compressed = base64.b64decode(data, validate=True)
+        with gzip.GzipFile(fileobj=io.BytesIO(compressed)) as f:
+            # Read one byte past the limit to tell whether it was exceeded.
+            raw = f.read(max_bytes + 1)
+    except (binascii.Error, OSError, EOFError) as e:
+        raise ValueError(f'Compressed log data is not base64 encoded gzip: {e}') from e
+    if len(raw) > max_bytes:
+        raise ValueError(f'Compressed log data decompresses to more than {max_bytes} bytes')
+    return [line for line in raw.decode('utf-8').splitlines() if line.strip()]
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether a failed submission may succeed if sent again.
+
+    ValueErrors (bad log type or timestamps) are permanent, as are APIErrors
+    for statuses other than RETRYABLE_STATUSES, e.g. 400, 403 or 404.
+    APIErrors without a status (network errors) are retried.
+    """
+    if isinstance(error, ValueError):
+        return False
+    if isinstance(error, APIError):
+        match = _API_ERROR_STATUS.search(str(error))
+        return match is None or int(match.group(1)) in RETRYABLE_STATUSES
+    return True
+
+
+@dataclass
+class IngestionReport:
+    """Counts and throughput of an ingestion run."""
+
+    entries: int = 0
+    bytes: int = 0
+    batches: int = 0
+    retries: int = 0
+    failed_batches: int = 0
+    failed_entries: int = 0
+    rejected_entries: int = 0
+    operations: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def add_error(self, message: str):
+        if len(self.errors) < MAX_REPORTED_ITEMS:
+            self.errors.append(message)
+
+    def to_dict(self) -> Dict[str, Any]:
+        seconds = max(self.seconds, 1e-6)
+        return {
+            'entries': self.entries,
+            'bytes': self.bytes,
+            'batches': self.batches,
+            'retries': self.retries,
+            'failed_batches': self.failed_batches,
+            'failed_entries': self.failed_entries,
+            'rejected_entries': self.rejected_entries,
+            'seconds': round(self.seconds, 3),
+            'entries_per_second': round(self.entries / seconds, 1),
+            'bytes_per_second': round(self.bytes / seconds, 1),
+            'operations': self.operations,
+            'errors': self.errors,
+        }
+
+
+async def submit_batches(
+    submit: Callable[[List[str]], Awaitable[Any]],
+    batches: Iterable[List[str]],
+    overhead: int = _ENTRY_OVERHEAD,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    retry_delay: float = DEFAULT_RETRY_DELAY,
+    report: Optional[IngestionReport] = None,
+    on_done: Optional[Callable[[int, bool, bool], None]] = None,
+) -> IngestionReport:
+    """Submits batches, `concurrency` batches at a time.
+
+    Args:
+        submit: Sends one batch, e.g. a wrapper around `chronicle.ingest_log`.
+            Its result's 'operation' (if any) is recorded.
+        batches: Batches of entries; any iterable, read lazily in a worker
+            thread so that reading files does not block the event loop.
+        overhead: Encoded bytes per entry besides its data; see entry_overhead.
+        concurrency: Batches in flight at once. At most twice as many batches
+            are buffered ahead of the submitters.
+        max_retries: Times a failed batch is retried, with exponential
+            backoff. Permanent failures are not retried; see is_retryable.
+        retry_delay: Delay before the first retry, in seconds.
+        report: A report to add to; a new one by default.
+        on_done: Called with the batch's index in `batches`, whether it was
+            ingested and, for a failed batch, whether it may succeed if sent
+            again, once it succeeds or finally fails.
+
+    Returns:
+        The IngestionReport. `entries` and `bytes` count ingested entries only.
+    """
+    report = report if report is not None else IngestionReport()
+    concurrency = max(1, concurrency)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=2 * concurrency)
+
+    async def send(batch: List[str]) -> Tuple[bool, bool]:
+        """Returns (ingested, retryable)."""
+        attempt = 0
+        while True:
+            try:
+                result = await submit(batch)
+                break
+            except Exception as e:
+                retryable = is_retryable(e)
+                if not retryable or attempt >= max_retries:
+                    report.failed_batches += 1
+                    report.failed_entries += len(batch)
+                    report.add_error(f'Batch of {len(batch)} entries failed: {e}')
+                    logger.warning(f'Log batch failed after {attempt + 1} attempt(s): {e}')
+                    return False, retryable
+                await asyncio.sleep(retry_delay * 2 ** attempt)
+                attempt += 1
+                report.retries += 1
+        report.entries += len(batch)
+        report.bytes += sum(encoded_size(entry, overhead) for entry in batch)
+        operation = result.get('operation') if isinstance(result, dict) else None
+        if operation and len(report.operations) < MAX_REPORTED_ITEMS:
+            report.operations.append(operation)
+        return True, False
+
+    async def worker():
+        while True:
+            item = await queue.get()
+            try:
+                if item is None:
+                    return
+                index, batch = item
+                ok, retryable = await send(batch)
+                if on_done is not None:
+                    # A worker killed by its callback would leave the producer
+                    # blocked on a full queue once no workers are left.
+                    try:
+                        on_done(index, ok, retryable)
+                    except Exception as e:
+                        report.add_error(f'Completion callback of batch {index} failed: {e}')
+                        logger.warning(f'Completion callback of batch {index} failed: {e}', exc_info=True)
+            finally:
+                queue.task_done()
+
+    started = time.monotonic()
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        batch_iter = iter(batches)
+        index = 0
+        while True:
+            batch = await asyncio.to_thread(next, batch_iter, None)
+            if batch is None:
+                break
+            report.batches += 1
+            await queue.put((index, batch))
+            index += 1
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+    report.seconds += time.monotonic() - started
+    logger.info(
+        f'Ingested {report.entries} entries in {report.batches} batches '
+        f'({report.failed_batches} failed) in {report.seconds:.1f}s'
+    )
+    return report
+
+
+async def ingest_batches(
+    submit: Callable[[List[str]], Awaitable[Any]],
+    entries: Iterable[str],
+    max_bytes: int = MAX_BATCH_BYTES,
+    max_entries: int = MAX_BATCH_ENTRIES,
+    overhead: int = _ENTRY_OVERHEAD,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    retry_delay: float = DEFAULT_RETRY_DELAY,
+) -> IngestionReport:
+    """Packs entries into batches (see iter_batches) and submits them.
+
+    Entries may be any iterable and are read lazily. Entries too large for a
+    batch are counted as rejected. See submit_batches for the other arguments.
+    """
+    report = IngestionReport()
+
+    def reject(entry: str):
+        report.rejected_entries += 1
+        report.add_error(
+            f'Entry of {len(entry.encode("utf-8"))} bytes exceeds the batch size limit'
+        )
+
+    return await submit_batches(
+        submit,
+        iter_batches(entries, max_bytes, max_entries, overhead, reject),
+        overhead=overhead,
+        concurrency=concurrency,
+        max_retries=max_retries,
+        retry_delay=retry_delay,
+        report=report,
+    )
@@ -0,0 +1,108 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Set differences for reference list entry updates.
+
+Adding or removing a few entries should not require the caller to send the
+whole list. The current entries are fetched once and the change is computed
+here, keeping the order of existing entries.
+"""
+
+import ipaddress
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List
+
+from secops.chronicle import ReferenceListSyntaxType
+
+
+def entry_key(entry: str, syntax_type: str = '') -> str:
+    """Returns the value entries are compared by.
+
+    Whitespace is ignored; CIDR entries compare by network, so `10.0.0.1`
+    and `10.0.0.1/32` are the same entry.
+    """
+    entry = entry.strip()
+    if syntax_type == ReferenceListSyntaxType.CIDR.value:
+        try:
+            return str(ipaddress.ip_network(entry, strict=False))
+        except ValueError:
+            pass
+    return entry
+
+
+def current_entries(reference_list: Dict[str, Any]) -> List[str]:
+    """Returns the entry values of a reference list from get_reference_list."""
+    return [
+        entry.get('value', '') if isinstance(entry, dict) else str(entry)
+        for entry in reference_list.get('entries', [])
+    ]
+
+
+@dataclass
+class EntryDiff:
+    """The entries after an update and what changed."""
+
+    entries: List[str]
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    already_present: int = 0
+    not_found: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+def diff_entries(
+    current: List[str],
+    add: Iterable[str] = (),
+    remove: Iterable[str] = (),
+    syntax_type: str = '',
+) -> EntryDiff:
+    """Applies additions and removals to `current`.
+
+    Removed entries are dropped wherever they occur; new entries are appended
+    in the given order, once each. An entry both added and removed is removed.
+    """
+    remove_keys = {entry_key(entry, syntax_type) for entry in remove if entry.strip()}
+    present = {entry_key(entry, syntax_type) for entry in current}
+
+    kept = []
+    removed = []
+    for entry in current:
+        if entry_key(entry, syntax_type) in remove_keys:
+            removed.append(entry)
+        else:
+            kept.append(entry)
+    kept_keys = present - remove_keys
+
+    added = []
+    added_keys = set()
+    already_present = 0
+    for entry in add:
+        key = entry_key(entry, syntax_type)
+        if not key or key in remove_keys or key in added_keys:
+            continue
+        if key in kept_keys:
+            already_present += 1
+            continue
+        added_keys.add(key)
+        added.append(entry.strip())
+
+    return EntryDiff(
+        entries=kept + added,
+        added=added,
+        removed=removed,
+        already_present=already_present,
+        not_found=len(remove_keys - present),
+    )
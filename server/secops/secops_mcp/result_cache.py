@@ -0,0 +1,407 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cache of UDM search results by aligned time bucket.
+
+Windows built from `hours_back` slide by a few seconds between agent turns,
+so caching whole responses never hits. Instead, results are cached per
+fixed-size time bucket (e.g. 10:00-10:15). A request is served from the
+cached buckets it fully covers, and only the gaps between them are searched.
+Buckets are cached only once they are older than a settle delay, so that
+late-arriving events are not missed, and only if the search that covered
+them returned every matching event.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from secops_mcp.sdk_executor import run_sdk
+from secops_mcp.sharded_search import (
+    DEFAULT_SHARD_MAX_EVENTS,
+    event_id,
+    event_timestamp,
+    sharded_search_udm,
+)
+
+logger = logging.getLogger('secops-mcp')
+
+DEFAULT_BUCKET_SECONDS = 15 * 60
+DEFAULT_TTL_SECONDS = 15 * 60
+DEFAULT_SETTLE_SECONDS = 15 * 60
+DEFAULT_MAX_ITEMS = 50000
+
+_EPOCH = datetime(1970, 1, 1)
+_QUOTED = re.compile(r'("(?:[^"\\]|\\.)*")')
+_WHITESPACE = re.compile(r'\s+')
+
+# Fetches [start, end] and returns (items, complete, raw_result), where
+# complete tells whether every matching item was returned.
+FetchRange = Callable[[datetime, datetime], Awaitable[Tuple[List[Any], bool, Any]]]
+
+
+def normalize_udm_query(query: str) -> str:
+    """Collapses whitespace outside the quoted strings of a UDM query."""
+    parts = _QUOTED.split(query.strip())
+    return ''.join(
+        part if i % 2 else _WHITESPACE.sub(' ', part)
+        for i, part in enumerate(parts)
+    )
+
+
+def epoch_seconds(value: datetime) -> Optional[float]:
+    """Converts a datetime (naive values are UTC) to Unix seconds.
+
+    Returns None for datetime.min, which marks an unknown timestamp.
+    """
+    if value == datetime.min:
+        return None
+    if value.tzinfo is None:
+        return (value - _EPOCH).total_seconds()
+    return value.timestamp()
+
+
+@dataclass
+class Segment:
+    """Items of one part of a request window, in chronological order."""
+
+    start: datetime
+    end: datetime
+    items: List[Any]
+    complete: bool
+    cached: bool
+    raw: Any = None
+
+
+class UdmResultCache:
+    """Caches search results per aligned time bucket."""
+
+    def __init__(
+        self,
+        bucket_seconds: int = DEFAULT_BUCKET_SECONDS,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        settle: float = DEFAULT_SETTLE_SECONDS,
+        max_items: int = DEFAULT_MAX_ITEMS,
+    ):
+        """Initializes the cache.
+
+        Args:
+            bucket_seconds: Size of the time buckets.
+            ttl: Seconds a cached bucket stays valid; 0 disables the cache.
+            settle: Buckets ending less than this many seconds ago are never
+                cached, since events for them may still be ingested.
+            max_items: Maximum number of events or rows cached in total.
+        """
+        self.bucket_seconds = bucket_seconds
+        self.ttl = ttl
+        self.settle = settle
+        self.max_items = max_items
+        # Values are (items, created_at), created_at from time.monotonic().
+        self._buckets: 'OrderedDict[Tuple, Tuple[List[Any], float]]' = OrderedDict()
+        self._item_count = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Optional[List[Any]]:
+        """Returns the cached items of a key, or None."""
+        with self._lock:
+            entry = self._buckets.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[1] > self.ttl:
+                self._pop(key)
+                return None
+            self._buckets.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Tuple, items: List[Any]):
+        """Caches the items of a key, evicting least recently used keys."""
+        if len(items) > self.max_items:
+            return
+        with self._lock:
+            if key in self._buckets:
+                self._pop(key)
+            self._buckets[key] = (items, time.monotonic())
+            self._item_count += len(items)
+            while self._item_count > self.max_items:
+                self._pop(next(iter(self._buckets)))
+
+    def _pop(self, key: Tuple):
+        items, _ = self._buckets.pop(key)
+        self._item_count -= len(items)
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+            self._item_count = 0
+
+    async def fetch(
+        self,
+        scope: Tuple,
+        start: datetime,
+        end: datetime,
+        fetch_range: FetchRange,
+        timestamp_of: Callable[[Any], Optional[float]],
+        bypass: bool = False,
+    ) -> List[Segment]:
+        """Returns the items of [start, end] from cached buckets and searches.
+
+        Args:
+            scope: Identifies the search: instance, kind, normalized query and
+                any parameters that change the items.
+            start: Start of the request window.
+            end: End of the request window.
+            fetch_range: Searches a sub-window.
+            timestamp_of: Returns the Unix time of an item, or None if unknown.
+            bypass: Whether to ignore cached buckets. Search results still
+                refresh the cache.
+
+        Returns:
+            Segments covering the window in chronological order. With no
+            cached bucket in range, a single searched segment covering the
+            whole window.
+        """
+        size = self.bucket_seconds
+        start_ts, end_ts = start.timestamp(), end.timestamp()
+        # Only buckets lying entirely inside the window are ever used.
+        first = -(-start_ts // size) * size
+        hits: List[Tuple[float, List[Any]]] = []
+        if self.ttl > 0 and not bypass:
+            bucket = first
+            while bucket + size <= end_ts:
+                items = self.get(scope + (size, bucket))
+                if items is not None:
+                    hits.append((bucket, items))
+                bucket += size
+
+        # Search the gaps between cached buckets.
+        gaps = []
+        cursor = start_ts
+        for bucket, _ in hits:
+            if bucket > cursor:
+                gaps.append((cursor, bucket))
+            cursor = bucket + size
+        if cursor < end_ts or not gaps and not hits:
+            gaps.append((cursor, end_ts))
+
+        def to_datetime(ts: float) -> datetime:
+            if ts == start_ts:
+                return start
+            if ts == end_ts:
+                return end
+            return datetime.fromtimestamp(ts, tz=timezone.utc)
+
+        results = await asyncio.gather(
+            *(fetch_range(to_datetime(s), to_datetime(e)) for s, e in gaps)
+        )
+
+        segments = [
+            Segment(
+                to_datetime(bucket), to_datetime(bucket + size), items, True, True
+            )
+            for bucket, items in hits
+        ]
+        hit_starts = {bucket for bucket, _ in hits}
+
+        def outside_hits(item: Any) -> bool:
+            ts = timestamp_of(item)
+            return ts is None or (ts // size) * size not in hit_starts
+
+        settled = time.time() - self.settle
+        for (gap_start, gap_end), (items, complete, raw) in zip(gaps, results):
+            if self.ttl > 0 and complete:
+                self._store(
+                    scope, gap_start, min(gap_end, settled), items, timestamp_of
+                )
+            if hits:
+                # Drop boundary items that belong to a cached bucket.
+                items = [item for item in items if outside_hits(item)]
+            segments.append(
+                Segment(
+                    to_datetime(gap_start),
+                    to_datetime(gap_end),
+                    items,
+                    complete,
+                    False,
+                    raw,
+                )
+            )
+        segments.sort(key=lambda segment: segment.start)
+        if hits:
+            logger.info(
+                f'Served {len(hits)} time buckets from the UDM result cache, '
+                f'searched {len(gaps)} gaps'
+            )
+        return segments
+
+    def _store(
+        self,
+        scope: Tuple,
+        start_ts: float,
+        end_ts: float,
+        items: List[Any],
+        timestamp_of: Callable[[Any], Optional[float]],
+    ):
+        """Caches the buckets lying entirely inside a fully searched range."""
+        size = self.bucket_seconds
+        first = -(-start_ts // size) * size
+        if first + size > end_ts:
+            return
+        buckets: Dict[float, List[Any]] = {}
+        for item in items:
+            ts = timestamp_of(item)
+            if ts is None:
+                return
+            bucket = (ts // size) * size
+            if first <= bucket and bucket + size <= end_ts:
+                buckets.setdefault(bucket, []).append(item)
+        bucket = first
+        while bucket + size <= end_ts:
+            self.put(scope + (size, bucket), buckets.get(bucket, []))
+            bucket += size
+
+
+def event_time(event: Dict[str, Any]) -> Optional[float]:
+    """Returns the Unix time of a UDM search event, or None if unknown."""
+    return epoch_seconds(event_timestamp(event))
+
+
+def merge_event_segments(
+    segments: List[Segment], max_events: Optional[int]
+) -> Dict[str, Any]:
+    """Merges event segments into a search_udm style result, newest first."""
+    if len(segments) == 1 and not segments[0].cached:
+        return segments[0].raw
+    merged: Dict[str, Dict[str, Any]] = {}
+    errors: List[str] = []
+    for segment in segments:
+        for event in segment.items:
+            merged.setdefault(event_id(event), event)
+        if isinstance(segment.raw, dict):
+            errors.extend(segment.raw.get('errors', []))
+    events = sorted(merged.values(), key=event_timestamp, reverse=True)
+    limit = max_events or len(events)
+    result = {
+        'events': events[:limit],
+        'total_events': len(events[:limit]),
+        'more_data_available': (
+            len(events) > limit
+            or any(not segment.complete for segment in segments)
+        ),
+        'cached_buckets': sum(1 for segment in segments if segment.cached),
+    }
+    if errors:
+        result['errors'] = errors
+    return result
+
+
+def search_events_fetcher(
+    search: Callable[[datetime, datetime], Awaitable[Any]], limit: int
+) -> FetchRange:
+    """Adapts a search_udm style call to a FetchRange.
+
+    Args:
+        search: Runs the search over a sub-window.
+        limit: The max_events limit of `search`, used to detect truncation.
+    """
+
+    async def fetch_range(start: datetime, end: datetime):
+        result = await search(start, end)
+        if isinstance(result, dict):
+            events = result.get('events', [])
+            complete = not (
+                result.get('more_data_available')
+                or len(events) >= limit
+                or result.get('errors')
+            )
+        else:
+            events = result if isinstance(result, list) else []
+            complete = len(events) < limit
+        return events, complete, result
+
+    return fetch_range
+
+
+async def cached_search_udm(
+    chronicle: Any,
+    query: str,
+    start_time: datetime,
+    end_time: datetime,
+    max_events: Optional[int] = None,
+    shards: Optional[int] = None,
+    bypass_cache: bool = False,
+) -> Dict[str, Any]:
+    """Runs a UDM search through the result cache.
+
+    Args:
+        chronicle: The Chronicle client.
+        query: The UDM query.
+        start_time: Start of the search window.
+        end_time: End of the search window.
+        max_events: Maximum number of events to return.
+        shards: If more than 1, gaps are searched with `sharded_search_udm`.
+        bypass_cache: Whether to search the whole window, ignoring cached
+            buckets.
+
+    Returns:
+        The search_udm result. When cached buckets were used, events are
+        merged newest first and 'cached_buckets' counts the buckets served
+        from the cache.
+    """
+
+    async def search(start: datetime, end: datetime):
+        if shards and shards > 1:
+            return await sharded_search_udm(
+                chronicle, query, start, end, max_events=max_events, shards=shards
+            )
+        return await run_sdk(
+            chronicle.search_udm,
+            query=query,
+            start_time=start,
+            end_time=end,
+            max_events=max_events,
+        )
+
+    segments = await udm_result_cache.fetch(
+        (str(chronicle.instance_id), 'search', normalize_udm_query(query)),
+        start_time,
+        end_time,
+        search_events_fetcher(search, max_events or DEFAULT_SHARD_MAX_EVENTS),
+        event_time,
+        bypass=bypass_cache,
+    )
+    return merge_event_segments(segments, max_events)
+
+
+def _from_env() -> UdmResultCache:
+    return UdmResultCache(
+        bucket_seconds=int(
+            os.environ.get('SECOPS_UDM_CACHE_BUCKET', DEFAULT_BUCKET_SECONDS)
+        ),
+        ttl=float(os.environ.get('SECOPS_UDM_CACHE_TTL', DEFAULT_TTL_SECONDS)),
+        settle=float(
+            os.environ.get('SECOPS_UDM_CACHE_SETTLE', DEFAULT_SETTLE_SECONDS)
+        ),
+        max_items=int(
+            os.environ.get('SECOPS_UDM_CACHE_MAX_ITEMS', DEFAULT_MAX_ITEMS)
+        ),
+    )
+
+
+udm_result_cache = _from_env()
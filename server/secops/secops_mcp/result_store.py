@@ -0,0 +1,281 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""In-process columnar store of search results.
+
+Search tools can store their events here and return a handle, so follow-up
+questions (filter, group by, top values, distinct values) are answered
+locally instead of re-running the Chronicle search. Events are flattened
+into one column per UDM field path, e.g. `principal.ip`; repeated fields
+hold a tuple of values per row.
+"""
+
+import itertools
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger('secops-mcp')
+
+DEFAULT_MAX_TABLES = 32
+DEFAULT_TTL_SECONDS = 3600
+
+_CAMEL = re.compile(r'(?<=[a-z0-9])(?=[A-Z])')
+
+FILTER_OPS = (
+    'eq', 'ne', 'in', 'contains', 'prefix', 'regex',
+    'gt', 'gte', 'lt', 'lte', 'exists',
+)
+
+
+def snake_case(key: str) -> str:
+    """Converts an API field name such as eventTimestamp to event_timestamp."""
+    return _CAMEL.sub('_', key).lower()
+
+
+def _flatten(value: Any, prefix: str, row: Dict[str, Any], repeated: bool = False):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            path = f'{prefix}.{snake_case(key)}' if prefix else snake_case(key)
+            _flatten(item, path, row, repeated)
+    elif isinstance(value, list):
+        for item in value:
+            _flatten(item, prefix, row, True)
+    elif repeated or prefix in row:
+        existing = row.get(prefix)
+        if existing is None:
+            row[prefix] = [value]
+        elif isinstance(existing, list):
+            existing.append(value)
+        else:
+            row[prefix] = [existing, value]
+    else:
+        row[prefix] = value
+
+
+def flatten_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Flattens a UDM search event into {field path: value or tuple}."""
+    row: Dict[str, Any] = {}
+    if 'name' in event:
+        row['name'] = event['name']
+    _flatten(event.get('udm', event), '', row)
+    return {
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in row.items()
+    }
+
+
+def _values(cell: Any) -> Tuple[Any, ...]:
+    if cell is None:
+        return ()
+    return cell if isinstance(cell, tuple) else (cell,)
+
+
+def _ordered(a: Any, b: Any) -> int:
+    """Compares two values numerically if both are numbers, else as text."""
+    try:
+        x, y = float(a), float(b)
+    except (TypeError, ValueError):
+        x, y = str(a), str(b)
+    return (x > y) - (x < y)
+
+
+def _matcher(op: str, value: Any):
+    if op == 'eq':
+        return lambda v: str(v) == str(value)
+    if op == 'in':
+        choices = {str(choice) for choice in value}
+        return lambda v: str(v) in choices
+    if op == 'contains':
+        needle = str(value).lower()
+        return lambda v: needle in str(v).lower()
+    if op == 'prefix':
+        return lambda v: str(v).startswith(str(value))
+    if op == 'regex':
+        pattern = re.compile(str(value))
+        return lambda v: pattern.search(str(v)) is not None
+    if op in ('gt', 'gte', 'lt', 'lte'):
+        accept = {
+            'gt': (1,), 'gte': (0, 1), 'lt': (-1,), 'lte': (-1, 0),
+        }[op]
+        return lambda v: _ordered(v, value) in accept
+    raise ValueError(
+        f'Unknown filter operator {op!r}; expected one of {", ".join(FILTER_OPS)}'
+    )
+
+
+class ResultTable:
+    """A table of flattened events stored column by column."""
+
+    def __init__(self, columns: Dict[str, List[Any]], row_count: int, source: str = ''):
+        self.columns = columns
+        self.row_count = row_count
+        self.source = source
+        self.last_used = time.monotonic()
+
+    @classmethod
+    def from_events(cls, events: Iterable[Dict[str, Any]], source: str = '') -> 'ResultTable':
+        columns: Dict[str, List[Any]] = {}
+        count = 0
+        for count, event in enumerate(events, 1):
+            for key, value in flatten_event(event).items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [None] * (count - 1)
+                column.append(value)
+            for column in columns.values():
+                if len(column) < count:
+                    column.append(None)
+        return cls(columns, count, source)
+
+    def column(self, field: str) -> List[Any]:
+        """Returns a column; unknown fields read as all missing."""
+        column = self.columns.get(field)
+        if column is None:
+            column = self.columns.get(field.replace('udm.', '', 1))
+        return column if column is not None else [None] * self.row_count
+
+    def filter_rows(self, filters: Optional[List[Dict[str, Any]]]) -> List[int]:
+        """Returns the indexes of the rows matching every filter.
+
+        Each filter is {'field', 'op', 'value'}. On repeated fields a row
+        matches if any value matches ('ne': if no value equals).
+        """
+        rows = range(self.row_count)
+        for spec in filters or []:
+            field, op = spec.get('field'), spec.get('op', 'eq')
+            if not field:
+                raise ValueError(f'Filter {spec} has no field')
+            column = self.column(field)
+            if op == 'exists':
+                wanted = spec.get('value', True) not in (False, 'false', 'False')
+                rows = [i for i in rows if bool(_values(column[i])) == wanted]
+            elif op == 'ne':
+                target = str(spec.get('value'))
+                rows = [
+                    i for i in rows
+                    if all(str(v) != target for v in _values(column[i]))
+                ]
+            else:
+                match = _matcher(op, spec.get('value'))
+                rows = [i for i in rows if any(match(v) for v in _values(column[i]))]
+        return list(rows)
+
+    def take(self, rows: List[int], source: str = '') -> 'ResultTable':
+        """Returns a new table of the given rows."""
+        columns = {}
+        for key, column in self.columns.items():
+            values = [column[i] for i in rows]
+            if any(value is not None for value in values):
+                columns[key] = values
+        return ResultTable(columns, len(rows), source)
+
+    def records(
+        self, rows: Iterable[int], fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Returns rows as {field: value} dicts without missing fields."""
+        keys = fields or list(self.columns)
+        columns = [(key, self.column(key)) for key in keys]
+        records = []
+        for i in rows:
+            record = {}
+            for key, column in columns:
+                if column[i] is not None:
+                    value = column[i]
+                    record[key] = list(value) if isinstance(value, tuple) else value
+            records.append(record)
+        return records
+
+    def group_counts(
+        self, fields: List[str], rows: Optional[List[int]] = None
+    ) -> Counter:
+        """Counts rows per combination of field values.
+
+        Rows with several values in a repeated field count once for each.
+        A missing field groups as None.
+        """
+        columns = [self.column(field) for field in fields]
+        counts: Counter = Counter()
+        for i in range(self.row_count) if rows is None else rows:
+            cells = [_values(column[i]) or (None,) for column in columns]
+            if len(cells) == 1:
+                counts.update(cells[0])
+            else:
+                counts.update(itertools.product(*cells))
+        return counts
+
+
+class ResultStore:
+    """LRU store of result tables addressed by handle."""
+
+    def __init__(
+        self,
+        max_tables: int = DEFAULT_MAX_TABLES,
+        ttl: float = DEFAULT_TTL_SECONDS,
+    ):
+        self.max_tables = max_tables
+        self.ttl = ttl
+        self._tables: 'OrderedDict[str, ResultTable]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, table: ResultTable) -> str:
+        """Stores a table and returns its handle."""
+        handle = f'res_{uuid.uuid4().hex[:12]}'
+        with self._lock:
+            self._tables[handle] = table
+            while len(self._tables) > self.max_tables:
+                evicted, _ = self._tables.popitem(last=False)
+                logger.debug(f'Evicted result table {evicted}')
+        return handle
+
+    def get(self, handle: str) -> ResultTable:
+        """Returns a stored table.
+
+        Raises:
+            KeyError: If the handle is unknown or expired.
+        """
+        with self._lock:
+            table = self._tables.get(handle)
+            if table is not None and time.monotonic() - table.last_used > self.ttl:
+                del self._tables[handle]
+                table = None
+            if table is None:
+                raise KeyError(
+                    f'Unknown or expired result handle {handle!r}; run the search '
+                    'again with store_results=True'
+                )
+            table.last_used = time.monotonic()
+            self._tables.move_to_end(handle)
+            return table
+
+    def store_events(self, events: List[Dict[str, Any]], source: str = '') -> Dict[str, Any]:
+        """Stores events and returns the handle fields added to search results."""
+        table = ResultTable.from_events(events, source)
+        handle = self.put(table)
+        logger.info(f'Stored {table.row_count} events as {handle}')
+        return {
+            'result_handle': handle,
+            'stored_rows': table.row_count,
+            'stored_columns': len(table.columns),
+        }
+
+
+result_store = ResultStore(
+    max_tables=int(os.environ.get('SECOPS_RESULT_STORE_MAX_TABLES', DEFAULT_MAX_TABLES)),
+    ttl=float(os.environ.get('SECOPS_RESULT_STORE_TTL', DEFAULT_TTL_SECONDS)),
+)
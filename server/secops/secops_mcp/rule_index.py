@@ -0,0 +1,221 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A local, searchable copy of an instance's detection rules.
+
+`chronicle.search_rules` downloads every rule's text for each search. The
+corpus here keeps rule text and metadata with an inverted index of tokens
+(identifiers, dotted UDM paths and their parts, IPs, MITRE IDs), and is
+refreshed by listing only revision IDs and fetching the rules whose revision
+changed.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger('secops-mcp')
+
+DEFAULT_REFRESH_SECONDS = 60
+# Above this many changed rules, one full listing beats fetching each rule.
+MAX_INDIVIDUAL_FETCHES = 20
+SEARCH_MODES = ('tokens', 'regex')
+
+_TOKEN = re.compile(r'[a-z0-9_]+(?:[.\-:/][a-z0-9_]+)*')
+_PART = re.compile(r'[.\-:/]')
+
+
+def tokenize(text: str) -> Set[str]:
+    """Returns the lowercased tokens of text, plus the parts of compound tokens.
+
+    `metadata.log_type = "WORKSPACE_ACTIVITY"` gives `metadata.log_type`,
+    `metadata`, `log_type` and `workspace_activity`; `T1059.001` gives
+    `t1059.001`, `t1059` and `001`.
+    """
+    tokens = set()
+    for token in _TOKEN.findall(text.lower()):
+        tokens.add(token)
+        if _PART.search(token):
+            tokens.update(part for part in _PART.split(token) if part)
+    return tokens
+
+
+@dataclass
+class RuleDoc:
+    """The indexed fields of a rule."""
+
+    rule_id: str
+    revision_id: str
+    display_name: str
+    text: str
+    rule: Dict[str, Any]
+    tokens: Set[str] = field(default_factory=set)
+
+
+def rule_id_of(rule: Dict[str, Any]) -> str:
+    return rule.get('name', '').split('/')[-1]
+
+
+class RuleCorpus:
+    """Rules of one instance with an inverted token index."""
+
+    def __init__(self):
+        self.rules: Dict[str, RuleDoc] = {}
+        self._index: Dict[str, Set[str]] = {}
+        self.refreshed_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _remove(self, rule_id: str):
+        doc = self.rules.pop(rule_id, None)
+        if doc is None:
+            return
+        for token in doc.tokens:
+            postings = self._index.get(token)
+            if postings is not None:
+                postings.discard(rule_id)
+                if not postings:
+                    del self._index[token]
+
+    def put(self, rule: Dict[str, Any]):
+        """Adds or replaces a rule (as returned by get_rule or a FULL listing)."""
+        rule_id = rule_id_of(rule)
+        text = rule.get('text', '')
+        display_name = rule.get('displayName', '')
+        doc = RuleDoc(
+            rule_id=rule_id,
+            revision_id=rule.get('revisionId', ''),
+            display_name=display_name,
+            text=text,
+            rule=rule,
+            tokens=tokenize(f'{display_name}\n{text}') | {rule_id.lower()},
+        )
+        with self._lock:
+            self._remove(rule_id)
+            self.rules[rule_id] = doc
+            for token in doc.tokens:
+                self._index.setdefault(token, set()).add(rule_id)
+
+    def stale(self, revisions: Dict[str, str]) -> List[str]:
+        """Drops rules not in `revisions` ({rule ID: revision ID}).
+
+        Returns the IDs of rules that are new or have a different revision.
+        """
+        with self._lock:
+            for rule_id in set(self.rules) - set(revisions):
+                self._remove(rule_id)
+        return [
+            rule_id for rule_id, revision in revisions.items()
+            if rule_id not in self.rules or self.rules[rule_id].revision_id != revision
+        ]
+
+    def search_tokens(self, query: str) -> List[RuleDoc]:
+        """Returns rules containing every token of the query."""
+        tokens = _TOKEN.findall(query.lower())
+        if not tokens:
+            return []
+        with self._lock:
+            postings = sorted((self._index.get(token, set()) for token in tokens), key=len)
+            matches = set(postings[0]).intersection(*postings[1:])
+            return [self.rules[rule_id] for rule_id in sorted(matches)]
+
+    def search_regex(self, pattern: str, case_insensitive: bool = False) -> List[RuleDoc]:
+        """Returns rules whose text matches the regular expression.
+
+        Raises:
+            re.error: If the pattern is invalid.
+        """
+        regex = re.compile(pattern, re.IGNORECASE if case_insensitive else 0)
+        with self._lock:
+            docs = list(self.rules.values())
+        return sorted((doc for doc in docs if regex.search(doc.text)), key=lambda doc: doc.rule_id)
+
+
+async def refresh_corpus(
+    corpus: RuleCorpus,
+    list_revisions: Callable[[], Awaitable[List[Dict[str, Any]]]],
+    list_full: Callable[[], Awaitable[List[Dict[str, Any]]]],
+    get_rule: Callable[[str], Awaitable[Dict[str, Any]]],
+) -> Dict[str, int]:
+    """Brings the corpus up to date with the instance's rules.
+
+    Lists revision IDs only, then fetches the new or changed rules one by one,
+    or with one full listing if more than MAX_INDIVIDUAL_FETCHES changed.
+
+    Returns:
+        Counts of 'rules' in the corpus and rules 'fetched'.
+    """
+    revisions = {rule_id_of(rule): rule.get('revisionId', '') for rule in await list_revisions()}
+    changed = corpus.stale(revisions)
+    if len(changed) > MAX_INDIVIDUAL_FETCHES:
+        for rule in await list_full():
+            if rule_id_of(rule) in revisions:
+                corpus.put(rule)
+    elif changed:
+        for rule in await asyncio.gather(*(get_rule(rule_id) for rule_id in changed)):
+            corpus.put(rule)
+    corpus.refreshed_at = time.monotonic()
+    logger.info(f'Rule corpus has {len(corpus.rules)} rules; fetched {len(changed)}')
+    return {'rules': len(corpus.rules), 'fetched': len(changed)}
+
+
+class RuleCorpusCache:
+    """Rule corpora by instance, refreshed at most every `refresh_seconds`."""
+
+    def __init__(self, refresh_seconds: float = DEFAULT_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._corpora: Dict[str, RuleCorpus] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    def corpus(self, instance: str) -> RuleCorpus:
+        return self._corpora.setdefault(instance, RuleCorpus())
+
+    def invalidate(self, instance: str):
+        """Makes the next search refresh the instance's corpus."""
+        corpus = self._corpora.get(instance)
+        if corpus is not None:
+            corpus.refreshed_at = None
+
+    async def get(
+        self,
+        instance: str,
+        refresh: Callable[[RuleCorpus], Awaitable[Dict[str, int]]],
+        force: bool = False,
+    ) -> RuleCorpus:
+        """Returns the instance's corpus, refreshing it if due or forced.
+
+        Concurrent callers share one refresh.
+        """
+        corpus = self.corpus(instance)
+        due = (
+            corpus.refreshed_at is None
+            or time.monotonic() - corpus.refreshed_at > self.refresh_seconds
+        )
+        if not (due or force):
+            return corpus
+        pending = self._pending.get(instance)
+        if pending is None:
+            pending = asyncio.ensure_future(refresh(corpus))
+            self._pending[instance] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(instance, None))
+        await asyncio.shield(pending)
+        return corpus
+
+
+rule_corpus_cache = RuleCorpusCache(
+    refresh_seconds=float(os.environ.get('SECOPS_RULE_INDEX_REFRESH', DEFAULT_REFRESH_SECONDS))
+)
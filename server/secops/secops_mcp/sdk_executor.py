@@ -0,0 +1,118 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Runs blocking SecOps SDK calls off the event loop.
+
+The secops SDK is synchronous, so calling it from an async tool blocks every
+other request until it returns. All SDK calls go through `run_sdk`, which runs
+them on a shared bounded thread pool and limits how many calls of the same
+SDK operation run at once.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger('secops-mcp')
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_CONCURRENCY = 8
+
+# Slow or quota-heavy operations get tighter limits than DEFAULT_CONCURRENCY.
+# Override or extend with SECOPS_SDK_CONCURRENCY, e.g. "search_udm=2,get_alerts=4".
+CONCURRENCY_LIMITS = {
+    'search_udm': 4,
+    'fetch_udm_search_csv': 2,
+    'translate_nl_to_udm': 4,
+    'get_alerts': 4,
+    'gemini': 4,
+    'run_rule_test': 2,
+    'ingest_log': 4,
+}
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_semaphores: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+
+
+def _concurrency_limits() -> Dict[str, int]:
+    limits = dict(CONCURRENCY_LIMITS)
+    for item in os.environ.get('SECOPS_SDK_CONCURRENCY', '').split(','):
+        name, _, value = item.partition('=')
+        if name.strip() and value.strip():
+            limits[name.strip()] = int(value)
+    return limits
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Returns the shared thread pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=int(
+                        os.environ.get('SECOPS_SDK_MAX_WORKERS', DEFAULT_MAX_WORKERS)
+                    ),
+                    thread_name_prefix='secops-sdk',
+                )
+    return _executor
+
+
+def _semaphore(operation: str) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    entry = _semaphores.get(operation)
+    if entry is None or entry[0] is not loop:
+        limit = _concurrency_limits().get(operation, DEFAULT_CONCURRENCY)
+        entry = (loop, asyncio.Semaphore(limit))
+        _semaphores[operation] = entry
+    return entry[1]
+
+
+async def run_sdk(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Calls a blocking SDK function on the shared thread pool.
+
+    If the calling task is cancelled (e.g. the MCP request was cancelled)
+    before the call starts, it is never run. A call that has already started
+    cannot be interrupted; it finishes in the background and its result is
+    discarded.
+
+    Args:
+        func: The SDK function, e.g. `chronicle.search_udm`. Its name selects
+            the concurrency limit.
+        *args: Positional arguments for `func`.
+        **kwargs: Keyword arguments for `func`.
+
+    Returns:
+        The return value of `func`.
+    """
+    operation = getattr(func, '__name__', 'sdk')
+    async with _semaphore(operation):
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args, **kwargs)
+        return await loop.run_in_executor(get_executor(), call)
+
+
+def shutdown():
+    """Shuts the thread pool down, dropping calls that have not started."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
@@ -24,6 +24,10 @@ from typing import Any, Optional
 from mcp.server.fastmcp import FastMCP
 from secops import SecOpsClient
 
+from secops_mcp import sdk_executor
+from secops_mcp.client_pool import ChronicleClientPool
+from secops_mcp.translation_cache import translation_cache
+
 # Initialize FastMCP server with a descriptive name
 server = FastMCP('Google Security Operations MCP server', log_level="ERROR")
 
@@ -47,7 +51,7 @@ def get_chronicle_client(
     customer_id: Optional[str] = None,
     region: Optional[str] = None
 ) -> Any:
-    """Initialize and return a Chronicle client.
+    """Return the pooled Chronicle client for the given instance.
 
     Args:
         project_id: Google Cloud project ID (defaults to CHRONICLE_PROJECT_ID env var)
@@ -68,16 +72,31 @@ def get_chronicle_client(
             'as parameters or through environment variables '
             '(CHRONICLE_PROJECT_ID, CHRONICLE_CUSTOMER_ID)'
         )
-    service_account_path = os.getenv("SECOPS_SA_PATH")
+    return client_pool.get(
+        project_id, customer_id, region, os.getenv("SECOPS_SA_PATH")
+    )
+
+
+def _create_chronicle_client(
+    project_id: str,
+    customer_id: str,
+    region: str,
+    service_account_path: Optional[str],
+) -> Any:
+    """Create a new Chronicle client; used by the client pool."""
     if service_account_path:
         client = SecOpsClient(service_account_path=service_account_path)
     else:
         client = SecOpsClient()
 
-    chronicle = client.chronicle(
+    return client.chronicle(
         customer_id=customer_id, project_id=project_id, region=region
     )
-    return chronicle
+
+
+# Chronicle clients are created once per instance and credential source, and
+# shared by every tool call.
+client_pool = ChronicleClientPool(_create_chronicle_client)
 
 
 # Import all tools
@@ -91,7 +110,12 @@ def main() -> None:
     tools.
     """
     # Initialize and run the server
-    server.run(transport='stdio')
+    try:
+        server.run(transport='stdio')
+    finally:
+        sdk_executor.shutdown()
+        client_pool.close()
+        translation_cache.close()
 
 
 if __name__ == '__main__':
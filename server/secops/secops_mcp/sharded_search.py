@@ -0,0 +1,176 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Time-sharded UDM search.
+
+A single UDM search over a long, busy window times out or stops at its event
+limit. `sharded_search_udm` splits the window into sub-windows, searches them
+concurrently and splits any sub-window that hits the limit again, then merges
+the results newest first with duplicate events removed.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from secops_mcp.sdk_executor import run_sdk
+
+logger = logging.getLogger('secops-mcp')
+
+DEFAULT_MAX_CONCURRENCY = 4
+# The SDK's own default limit for a single search.
+DEFAULT_SHARD_MAX_EVENTS = 10000
+MAX_SHARDS = 64
+# Sub-windows shorter than this are not split further.
+MIN_SHARD_WINDOW = timedelta(minutes=1)
+# Upper bound on the number of searches a single sharded search may issue.
+MAX_SHARD_QUERIES = 256
+
+
+def event_id(event: Dict[str, Any]) -> str:
+    """Returns a stable identifier of a UDM search result event."""
+    if event.get('name'):
+        return event['name']
+    metadata = event.get('udm', {}).get('metadata', {})
+    if metadata.get('id'):
+        return metadata['id']
+    return json.dumps(event, sort_keys=True, default=str)
+
+
+def event_timestamp(event: Dict[str, Any]) -> datetime:
+    """Returns the metadata.event_timestamp of an event, or datetime.min."""
+    metadata = event.get('udm', {}).get('metadata', {})
+    value = metadata.get('eventTimestamp') or metadata.get('event_timestamp')
+    if isinstance(value, str):
+        try:
+            timestamp = datetime.fromisoformat(value)
+        except ValueError:
+            timestamp = None
+        if timestamp is not None:
+            return timestamp.replace(tzinfo=None) - (
+                timestamp.utcoffset() or timedelta()
+            )
+    return datetime.min
+
+
+def split_window(
+    start: datetime, end: datetime, parts: int
+) -> List[Tuple[datetime, datetime]]:
+    """Splits [start, end] into `parts` contiguous sub-windows of equal length."""
+    step = (end - start) / parts
+    bounds = [start + step * i for i in range(parts)] + [end]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+async def sharded_search_udm(
+    chronicle: Any,
+    query: str,
+    start_time: datetime,
+    end_time: datetime,
+    max_events: Optional[int] = None,
+    shards: int = 8,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> Dict[str, Any]:
+    """Searches UDM events over time shards of a window concurrently.
+
+    Each sub-window is searched with the `max_events` limit. A sub-window that
+    hits it is split in half and both halves are searched, down to
+    MIN_SHARD_WINDOW, but only while fewer than `max_events` distinct events
+    have been found; once the result is full, capped sub-windows just mark it
+    as incomplete. Sub-windows that fail are reported in `errors` instead
+    of failing the whole search.
+
+    Args:
+        chronicle: The Chronicle client.
+        query: The UDM query.
+        start_time: Start of the search window.
+        end_time: End of the search window.
+        max_events: Maximum number of events to return, and the limit of
+            each sub-window search. Defaults to the SDK default.
+        shards: Number of sub-windows the window is split into initially.
+        max_concurrency: Maximum number of sub-window searches in flight.
+
+    Returns:
+        A search_udm style result: 'events' merged newest first, 'total_events'
+        (distinct events found, possibly more than returned),
+        'more_data_available', 'shards' (sub-windows searched) and 'errors'.
+    """
+    limit = max_events or DEFAULT_SHARD_MAX_EVENTS
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    merged: Dict[str, Dict[str, Any]] = {}
+    errors: List[str] = []
+    state = {'queries': 0, 'incomplete': False}
+
+    async def search_window(start: datetime, end: datetime):
+        state['queries'] += 1
+        try:
+            async with semaphore:
+                result = await run_sdk(
+                    chronicle.search_udm,
+                    query=query,
+                    start_time=start,
+                    end_time=end,
+                    max_events=limit,
+                )
+        except Exception as e:
+            logger.warning(
+                f'UDM search shard {start} to {end} failed: {str(e)}'
+            )
+            errors.append(f'{start.isoformat()} to {end.isoformat()}: {str(e)}')
+            state['incomplete'] = True
+            return
+
+        if isinstance(result, dict):
+            events = result.get('events', [])
+            capped = result.get('more_data_available') or len(events) >= limit
+        else:
+            events = result if isinstance(result, list) else []
+            capped = len(events) >= limit
+        for event in events:
+            merged.setdefault(event_id(event), event)
+
+        if not capped:
+            return
+        if (
+            len(merged) >= limit
+            or end - start < MIN_SHARD_WINDOW * 2
+            or state['queries'] + 2 > MAX_SHARD_QUERIES
+        ):
+            state['incomplete'] = True
+            return
+        logger.debug(f'UDM search shard {start} to {end} hit the limit, splitting')
+        await asyncio.gather(
+            *(search_window(s, e) for s, e in split_window(start, end, 2))
+        )
+
+    shards = max(1, min(shards, MAX_SHARDS))
+    await asyncio.gather(
+        *(search_window(s, e) for s, e in split_window(start_time, end_time, shards))
+    )
+    if errors and not merged and len(errors) == state['queries']:
+        raise RuntimeError(f'All UDM search shards failed: {errors[0]}')
+
+    events = sorted(merged.values(), key=event_timestamp, reverse=True)
+    logger.info(
+        f'Sharded UDM search ran {state["queries"]} searches and found '
+        f'{len(events)} distinct events'
+    )
+    return {
+        'events': events[:limit],
+        'total_events': len(events),
+        'more_data_available': state['incomplete'] or len(events) > limit,
+        'shards': state['queries'],
+        'errors': errors,
+    }
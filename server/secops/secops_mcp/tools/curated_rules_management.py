@@ -17,6 +17,7 @@ import logging
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+from secops_mcp.sdk_executor import run_sdk
 from secops_mcp.server import get_chronicle_client, server
 
 
@@ -93,10 +94,11 @@ async def list_curated_rules(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         if as_list:
-            rules = chronicle.list_curated_rules(as_list=True)
+            rules = await run_sdk(chronicle.list_curated_rules, as_list=True)
             return {"curatedRules": rules}
         else:
-            return chronicle.list_curated_rules(
+            return await run_sdk(
+                chronicle.list_curated_rules,
                 page_size=page_size, page_token=page_token
             )
 
@@ -159,7 +161,7 @@ async def get_curated_rule(
         logger.info(f"Retrieving curated rule: {rule_id}")
 
         chronicle = get_chronicle_client(project_id, customer_id, region)
-        rule = chronicle.get_curated_rule(rule_id)
+        rule = await run_sdk(chronicle.get_curated_rule, rule_id)
 
         logger.info(f"Successfully retrieved curated rule: {rule_id}")
         return rule
@@ -221,7 +223,7 @@ async def get_curated_rule_by_name(
         logger.info(f"Searching for curated rule by name: {display_name}")
 
         chronicle = get_chronicle_client(project_id, customer_id, region)
-        rule = chronicle.get_curated_rule_by_name(display_name)
+        rule = await run_sdk(chronicle.get_curated_rule_by_name, display_name)
 
         if rule:
             logger.info(f"Found curated rule: {display_name}")
@@ -321,7 +323,8 @@ async def search_curated_detections(
         start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
         end_dt = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
 
-        result = chronicle.search_curated_detections(
+        result = await run_sdk(
+            chronicle.search_curated_detections,
             rule_id=rule_id,
             start_time=start_dt,
             end_time=end_dt,
@@ -429,10 +432,11 @@ async def list_curated_rule_sets(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         if as_list:
-            rule_sets = chronicle.list_curated_rule_sets(as_list=True)
+            rule_sets = await run_sdk(chronicle.list_curated_rule_sets, as_list=True)
             return {"curatedRuleSets": rule_sets}
         else:
-            result = chronicle.list_curated_rule_sets(
+            result = await run_sdk(
+                chronicle.list_curated_rule_sets,
                 page_size=page_size, page_token=page_token
             )
             return result
@@ -500,7 +504,7 @@ async def get_curated_rule_set(
         logger.info(f"Retrieving curated rule set: {rule_set_id}")
 
         chronicle = get_chronicle_client(project_id, customer_id, region)
-        rule_set = chronicle.get_curated_rule_set(rule_set_id)
+        rule_set = await run_sdk(chronicle.get_curated_rule_set, rule_set_id)
 
         logger.info(f"Successfully retrieved curated rule set: {rule_set_id}")
         return rule_set
@@ -590,12 +594,14 @@ async def list_curated_rule_set_deployments(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         if as_list:
-            deployments = chronicle.list_curated_rule_set_deployments(
+            deployments = await run_sdk(
+                chronicle.list_curated_rule_set_deployments,
                 as_list=True
             )
             return {"curatedRuleSetDeployments": deployments}
         else:
-            result = chronicle.list_curated_rule_set_deployments(
+            result = await run_sdk(
+                chronicle.list_curated_rule_set_deployments,
                 page_size=page_size, page_token=page_token
             )
             return result
@@ -698,7 +704,9 @@ async def update_curated_rule_set_deployment(
             "alerting": alerting,
         }
 
-        result = chronicle.update_curated_rule_set_deployment(deployment_config)
+        result = await run_sdk(
+            chronicle.update_curated_rule_set_deployment, deployment_config
+        )
 
         logger.info(
             f"Successfully updated curated rule set deployment: "
@@ -13,9 +13,20 @@
 # limitations under the License.
 """Security Operations MCP tools for data table management."""
 
+import asyncio
 import logging
+import os
+import tempfile
 from typing import Any, Dict, List, Optional
 
+from secops_mcp.data_table_index import DataTableIndex, data_table_cache
+from secops_mcp.data_table_sync import (
+    DEFAULT_CONCURRENCY,
+    iter_file_rows,
+    sync_table_rows,
+    table_columns,
+)
+from secops_mcp.sdk_executor import run_sdk
 from secops_mcp.server import get_chronicle_client, server
 
 
@@ -122,7 +133,8 @@ async def create_data_table(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Create the data table
-        data_table = chronicle.create_data_table(
+        data_table = await run_sdk(
+            chronicle.create_data_table,
             name=name,
             description=description,
             header=header,
@@ -248,7 +260,10 @@ async def add_rows_to_data_table(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Add rows to the data table
-        result_response = chronicle.create_data_table_rows(table_name, rows)
+        result_response = await run_sdk(
+            chronicle.create_data_table_rows, table_name, rows
+        )
+        data_table_cache.invalidate((str(chronicle.instance_id), table_name))
 
         result = f'Successfully added rows to data table: {table_name}\n'
         result += f'Rows added: {len(rows)}\n'
@@ -270,6 +285,119 @@ async def add_rows_to_data_table(
         logger.error(f'Error adding rows to data table {table_name}: {str(e)}', exc_info=True)
         return f'Error adding rows to data table {table_name}: {str(e)}'
 
+def _import_path(file_path: str) -> Optional[str]:
+    """Resolves a file path in the import directory; None if it is outside."""
+    directory = os.path.realpath(
+        os.environ.get('SECOPS_IMPORT_DIR') or tempfile.gettempdir()
+    )
+    path = os.path.realpath(os.path.join(directory, file_path))
+    if os.path.commonpath([directory, path]) != directory:
+        return None
+    return path
+
+
+@server.tool()
+async def sync_data_table_from_file(
+    table_name: str,
+    file_path: str,
+    file_format: Optional[str] = None,
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+    dry_run: bool = False,
+    project_id: Optional[str] = None,
+    customer_id: Optional[str] = None,
+    region: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Make a data table's rows match a CSV or NDJSON file on the MCP server host.
+
+    Streams the file, compares its rows with the table's current rows by a hash of
+    their values, and sends only the difference: rows the table is missing are
+    inserted, and table rows the file no longer has are deleted. Requests are
+    chunked to fit the API limits and sent in parallel. Use this for large tables
+    that are regenerated periodically (asset inventories, allow lists) instead of
+    rewriting every row.
+
+    **Workflow Integration:**
+    - Use for nightly or scheduled refreshes of tables produced by other systems.
+    - Run with `dry_run=True` first to see how many rows would change.
+    - Rows never pass through tool arguments, so tables of any size can be synced.
+
+    **Use Cases:**
+    - Sync a 200k-row asset inventory where a few hundred rows change each night.
+    - Keep a threat intelligence table in step with an exported feed file.
+
+    Args:
+        table_name (str): Name of the existing data table to sync.
+        file_path (str): Path of the CSV or NDJSON file in the import directory (SECOPS_IMPORT_DIR,
+                         or the system temporary directory), absolute or relative to it. A CSV file
+                         needs a header row with the table's column names; NDJSON lines are objects
+                         keyed by column name, or arrays of values in column order.
+        file_format (Optional[str]): "csv" or "ndjson". Defaults to the file extension
+                                     (.csv, or .ndjson/.jsonl/.json).
+        max_concurrency (int): Requests sent at once. Defaults to 4.
+        dry_run (bool): Only report what would change. Defaults to False.
+        project_id (Optional[str]): Google Cloud project ID. Defaults to environment configuration.
+        customer_id (Optional[str]): Chronicle customer ID. Defaults to environment configuration.
+        region (Optional[str]): Chronicle region (e.g., "us", "europe"). Defaults to environment configuration.
+
+    Returns:
+        Dict[str, Any]: Counts of file rows, table rows, unchanged rows, rows to insert and delete,
+            rows inserted and deleted, and any errors. Contains an 'error' key if the sync fails.
+
+    Example Usage:
+        sync_data_table_from_file(
+            table_name="asset_inventory",
+            file_path="assets.csv",
+            dry_run=True
+        )
+
+    Next Steps (using MCP-enabled tools):
+        - Run again without `dry_run` to apply the changes.
+        - Check the result with `list_data_table_rows`.
+    """
+    try:
+        logger.info(f'Syncing data table {table_name} from {file_path}')
+
+        file_path = _import_path(file_path)
+        if file_path is None:
+            return {'error': 'file_path must be inside SECOPS_IMPORT_DIR'}
+        if file_format is None:
+            extension = os.path.splitext(file_path)[1].lower()
+            file_format = 'csv' if extension == '.csv' else 'ndjson'
+        if not os.path.isfile(file_path):
+            return {'error': f'File not found: {file_path}'}
+
+        chronicle = get_chronicle_client(project_id, customer_id, region)
+
+        data_table = await run_sdk(chronicle.get_data_table, table_name)
+        columns = table_columns(data_table)
+        existing_rows = await run_sdk(
+            chronicle.list_data_table_rows, table_name, order_by='createTime asc'
+        )
+
+        async def insert(rows: List[List[str]]):
+            return await run_sdk(chronicle.create_data_table_rows, table_name, rows)
+
+        async def delete(row_ids: List[str]):
+            return await run_sdk(chronicle.delete_data_table_rows, table_name, row_ids)
+
+        result = await sync_table_rows(
+            existing_rows,
+            lambda: iter_file_rows(file_path, columns, file_format),
+            insert,
+            delete,
+            concurrency=max_concurrency,
+            dry_run=dry_run,
+        )
+        if not dry_run:
+            data_table_cache.invalidate((str(chronicle.instance_id), table_name))
+        result['table_name'] = table_name
+        result['dry_run'] = dry_run
+        return result
+
+    except Exception as e:
+        logger.error(f'Error syncing data table {table_name}: {str(e)}', exc_info=True)
+        return {'error': f'Error syncing data table {table_name}: {str(e)}'}
+
 @server.tool()
 async def list_data_table_rows(
     table_name: str,
@@ -343,7 +471,7 @@ async def list_data_table_rows(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # List rows in the data table
-        rows = chronicle.list_data_table_rows(table_name)
+        rows = await run_sdk(chronicle.list_data_table_rows, table_name)
 
         if not rows:
             return f'Data table "{table_name}" has no rows or was not found.'
@@ -373,6 +501,105 @@ async def list_data_table_rows(
         logger.error(f'Error listing rows in data table {table_name}: {str(e)}', exc_info=True)
         return f'Error listing rows in data table {table_name}: {str(e)}'
 
+@server.tool()
+async def lookup_data_table_rows(
+    table_name: str,
+    column: str,
+    value: str,
+    match: str = 'exact',
+    case_insensitive: bool = False,
+    max_rows: int = 50,
+    refresh: bool = False,
+    project_id: Optional[str] = None,
+    customer_id: Optional[str] = None,
+    region: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Find the rows of a data table whose column matches a value.
+
+    Answers "which rows have column X = v" from an indexed copy of the table kept
+    by the server, instead of listing the whole table. The copy is loaded on first
+    use and reloaded when the table's update time changes (or after
+    `SECOPS_DATA_TABLE_CACHE_MAX_AGE` seconds), so repeated lookups in a large
+    table are fast and return only the matching rows.
+
+    **Match Types:**
+    - exact: The column value equals `value`.
+    - prefix: The column value starts with `value`.
+    - cidr: The column holds networks (or addresses) that contain the address or network in `value`,
+      e.g. which CIDR rows cover "10.1.2.3".
+    - in_cidr: The column holds addresses that fall inside the network in `value`, e.g. which hosts
+      are in "10.1.0.0/16".
+
+    **Workflow Integration:**
+    - Use during investigations to check whether an indicator, host or user appears in a context table.
+    - Use instead of `list_data_table_rows` whenever only a few rows are needed.
+
+    Args:
+        table_name (str): Name of the data table.
+        column (str): Column to match on.
+        value (str): Value, prefix, address or network to match.
+        match (str): One of "exact", "prefix", "cidr" or "in_cidr". Defaults to "exact".
+        case_insensitive (bool): Ignore case for exact and prefix matches. Defaults to False.
+        max_rows (int): Maximum number of matching rows to return. Defaults to 50.
+        refresh (bool): Reload the table even if the cached copy is current. Defaults to False.
+        project_id (Optional[str]): Google Cloud project ID. Defaults to environment configuration.
+        customer_id (Optional[str]): Chronicle customer ID. Defaults to environment configuration.
+        region (Optional[str]): Chronicle region (e.g., "us", "europe"). Defaults to environment configuration.
+
+    Returns:
+        Dict[str, Any]: 'total_matches', 'rows' (each with 'row_id' and a column to value mapping),
+            'table_rows', 'version' and whether a cached copy was used ('cached').
+            Contains an 'error' key if the lookup fails.
+
+    Example Usage:
+        lookup_data_table_rows(table_name="asset_inventory", column="hostname", value="web-01")
+        lookup_data_table_rows(table_name="corp_networks", column="cidr", value="10.1.2.3", match="cidr")
+
+    Next Steps (using MCP-enabled tools):
+        - Use the matching rows' context to prioritize alerts or enrich findings.
+        - Remove stale rows with `delete_data_table_rows` using the returned row IDs.
+    """
+    try:
+        logger.info(f'Looking up {match} {column}={value} in data table {table_name}')
+
+        chronicle = get_chronicle_client(project_id, customer_id, region)
+
+        data_table = await run_sdk(chronicle.get_data_table, table_name)
+        version = data_table.get('updateTime')
+
+        async def load() -> DataTableIndex:
+            rows = await run_sdk(
+                chronicle.list_data_table_rows, table_name, order_by='createTime asc'
+            )
+            return await asyncio.to_thread(
+                DataTableIndex, table_columns(data_table), rows, version
+            )
+
+        table, cached = await data_table_cache.get(
+            (str(chronicle.instance_id), table_name), version, load, refresh=refresh
+        )
+        # The first lookup on a column builds its index over every row.
+        positions = await asyncio.to_thread(
+            table.lookup, column, value, match, case_insensitive
+        )
+
+        return {
+            'table_name': table_name,
+            'column': column,
+            'match': match,
+            'total_matches': len(positions),
+            'rows': [table.row(position) for position in positions[:max_rows]],
+            'table_rows': table.row_count,
+            'version': version,
+            'cached': cached,
+        }
+
+    except (KeyError, ValueError) as e:
+        return {'error': e.args[0] if e.args else str(e)}
+    except Exception as e:
+        logger.error(f'Error looking up rows in data table {table_name}: {str(e)}', exc_info=True)
+        return {'error': f'Error looking up rows in data table {table_name}: {str(e)}'}
+
 @server.tool()
 async def delete_data_table_rows(
     table_name: str,
@@ -456,7 +683,8 @@ async def delete_data_table_rows(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Delete rows from the data table
-        chronicle.delete_data_table_rows(table_name, row_ids)
+        await run_sdk(chronicle.delete_data_table_rows, table_name, row_ids)
+        data_table_cache.invalidate((str(chronicle.instance_id), table_name))
 
         result = f'Successfully deleted rows from data table: {table_name}\n'
         result += f'Rows deleted: {len(row_ids)}\n'
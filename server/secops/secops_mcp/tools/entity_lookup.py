@@ -13,16 +13,23 @@
 # limitations under the License.
 """Security Operations MCP tools for entity lookup."""
 
+import asyncio
 import logging
+from collections import Counter
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
+from secops_mcp.entity_cache import entity_summary_cache, normalize_indicator
+from secops_mcp.sdk_executor import run_sdk
 from secops_mcp.server import get_chronicle_client, server
 
 
 # Configure logging
 logger = logging.getLogger('secops-mcp')
 
+MAX_BATCH_ENTITIES = 500
+MAX_BATCH_CONCURRENCY = 32
+
 @server.tool()
 async def lookup_entity(
     entity_value: str,
@@ -88,7 +95,8 @@ async def lookup_entity(
         end_time = datetime.now(timezone.utc)
         start_time = end_time - timedelta(hours=hours_back)
 
-        entity_summary = chronicle.summarize_entity(
+        entity_summary = await run_sdk(
+            chronicle.summarize_entity,
             value=entity_value,
             start_time=start_time,
             end_time=end_time,
@@ -191,3 +199,152 @@ async def lookup_entity(
     except Exception as e:
         logger.error(f'Error looking up entity: {str(e)}', exc_info=True)
         return f'Error looking up entity: {str(e)}'
+
+
+def _isoformat(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _entity_record(entity_summary: Any) -> Dict[str, Any]:
+    """Converts an entity summary into a JSON-serializable record."""
+    primary_entity = getattr(entity_summary, 'primary_entity', None)
+    if not entity_summary or not primary_entity:
+        return {'found': False}
+
+    metadata = getattr(primary_entity, 'metadata', None)
+    metric = getattr(primary_entity, 'metric', None)
+    related_entities = getattr(entity_summary, 'related_entities', None) or []
+    related_types = Counter(
+        getattr(getattr(entity, 'metadata', None), 'entity_type', 'Unknown')
+        for entity in related_entities
+    )
+    alert_counts = getattr(entity_summary, 'alert_counts', None) or []
+    timeline = getattr(entity_summary, 'timeline', None)
+    buckets = getattr(timeline, 'buckets', None) or []
+
+    return {
+        'found': True,
+        'entity_type': getattr(metadata, 'entity_type', 'Unknown'),
+        'first_seen': _isoformat(getattr(metric, 'first_seen', None)),
+        'last_seen': _isoformat(getattr(metric, 'last_seen', None)),
+        'related_entity_count': len(related_entities),
+        'related_entity_types': dict(related_types),
+        'alerts': [
+            {'rule': getattr(alert, 'rule', 'Unknown'), 'count': getattr(alert, 'count', 0)}
+            for alert in alert_counts
+        ],
+        'has_more_alerts': bool(getattr(entity_summary, 'has_more_alerts', False)),
+        'event_count': sum(getattr(bucket, 'event_count', 0) for bucket in buckets),
+        'alert_count': sum(getattr(bucket, 'alert_count', 0) for bucket in buckets),
+        'prevalence_available': bool(getattr(entity_summary, 'prevalence', None)),
+    }
+
+
+@server.tool()
+async def lookup_entities(
+    entity_values: List[str],
+    hours_back: int = 24,
+    max_concurrency: int = 8,
+    bypass_cache: bool = False,
+    project_id: Optional[str] = None,
+    customer_id: Optional[str] = None,
+    region: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Look up many entities (IPs, domains, hashes, users, etc.) in Chronicle SIEM at once.
+
+    Batch version of `lookup_entity` for IOC triage lists. Values are normalized (whitespace,
+    quotes and brackets removed, defanged indicators like `1.2.3[.]4` or `hxxp://` restored,
+    IPs, domains, hashes and emails lowercased) and deduplicated, then summarized concurrently.
+    Summaries are cached for a few minutes, so overlapping lists are cheap to look up again.
+
+    **Workflow Integration:**
+    - Use when an alert, case, report or threat intelligence feed yields many indicators,
+      instead of calling `lookup_entity` once per indicator.
+    - Use the structured records to rank indicators (e.g. by alert count or recent activity)
+      and pick which to investigate further with `search_security_events`.
+
+    Args:
+        entity_values (List[str]): Values to look up (up to 500), e.g. IP addresses, domain names,
+            file hashes, email addresses or user names.
+        hours_back (int): How many hours of historical data to consider for the summaries. Defaults to 24.
+        max_concurrency (int): Maximum number of lookups in flight (up to 32). Defaults to 8.
+        bypass_cache (bool): Look every entity up again instead of using cached summaries. Defaults to False.
+        project_id (Optional[str]): Google Cloud project ID. Defaults to environment configuration.
+        customer_id (Optional[str]): Chronicle customer ID. Defaults to environment configuration.
+        region (Optional[str]): Chronicle region (e.g., "us", "europe"). Defaults to environment configuration.
+
+    Returns:
+        Dict[str, Any]: A dictionary containing:
+            - 'entities' (List[Dict]): One record per distinct normalized value, in input order, with
+              'value', 'kind' (ip, domain, md5, sha1, sha256, email, url or other), 'inputs' (the
+              original spellings), 'found', 'cached' and, if found, 'entity_type', 'first_seen',
+              'last_seen', 'related_entity_count', 'related_entity_types', 'alerts',
+              'has_more_alerts', 'event_count', 'alert_count' and 'prevalence_available'.
+              Failed lookups have an 'error' instead.
+            - 'requested' (int), 'distinct' (int), 'found' (int) and 'failed' (int) counts.
+
+    Example Usage:
+        lookup_entities(entity_values=["198.51.100[.]10", "EVIL.example.com", "198.51.100.10"], hours_back=72)
+    """
+    try:
+        if len(entity_values) > MAX_BATCH_ENTITIES:
+            return {
+                'error': f'At most {MAX_BATCH_ENTITIES} entities can be looked up at once, '
+                f'got {len(entity_values)}'
+            }
+
+        entities: Dict[str, Dict[str, Any]] = {}
+        for raw_value in entity_values:
+            if not raw_value or not raw_value.strip():
+                continue
+            value, kind = normalize_indicator(raw_value)
+            record = entities.setdefault(
+                value, {'value': value, 'kind': kind, 'inputs': []}
+            )
+            if raw_value not in record['inputs']:
+                record['inputs'].append(raw_value)
+
+        chronicle = get_chronicle_client(project_id, customer_id, region)
+        end_time = datetime.now(timezone.utc)
+        start_time = end_time - timedelta(hours=hours_back)
+        semaphore = asyncio.Semaphore(max(1, min(max_concurrency, MAX_BATCH_CONCURRENCY)))
+
+        async def summarize(value: str) -> Dict[str, Any]:
+            async with semaphore:
+                entity_summary = await run_sdk(
+                    chronicle.summarize_entity,
+                    value=value,
+                    start_time=start_time,
+                    end_time=end_time,
+                )
+            return _entity_record(entity_summary)
+
+        async def lookup(record: Dict[str, Any]):
+            key = (str(chronicle.instance_id), record['value'], hours_back)
+            try:
+                summary, cached = await entity_summary_cache.lookup(
+                    key, lambda: summarize(record['value']), bypass=bypass_cache
+                )
+                record.update(summary)
+                record['cached'] = cached
+            except Exception as e:
+                logger.warning(f'Error looking up entity {record["value"]}: {str(e)}')
+                record.update({'found': False, 'cached': False, 'error': str(e)})
+
+        logger.info(
+            f'Looking up {len(entities)} distinct entities '
+            f'({len(entity_values)} requested)'
+        )
+        await asyncio.gather(*(lookup(record) for record in entities.values()))
+
+        records = list(entities.values())
+        return {
+            'entities': records,
+            'requested': len(entity_values),
+            'distinct': len(records),
+            'found': sum(1 for record in records if record.get('found')),
+            'failed': sum(1 for record in records if 'error' in record),
+        }
+    except Exception as e:
+        logger.error(f'Error looking up entities: {str(e)}', exc_info=True)
+        return {'error': f'Error looking up entities: {str(e)}'}
@@ -16,6 +16,7 @@
 import logging
 from typing import Any, Dict, Optional
 
+from secops_mcp.sdk_executor import run_sdk
 from secops_mcp.server import get_chronicle_client, server
 
 
@@ -75,7 +76,7 @@ async def list_feeds(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Get all feeds
-        feeds = chronicle.list_feeds()
+        feeds = await run_sdk(chronicle.list_feeds)
 
         # Process feeds into a structured response
         result = {
@@ -155,7 +156,7 @@ async def get_feed(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Get feed details
-        feed = chronicle.get_feed(feed_id)
+        feed = await run_sdk(chronicle.get_feed, feed_id)
 
         if not feed:
             return {"error": f"Feed with ID {feed_id} not found"}
@@ -233,7 +234,8 @@ async def create_feed(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Create the feed
-        return chronicle.create_feed(
+        return await run_sdk(
+            chronicle.create_feed,
             display_name=display_name, details=feed_details
         )
 
@@ -307,7 +309,8 @@ async def update_feed(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Update the feed
-        return chronicle.update_feed(
+        return await run_sdk(
+            chronicle.update_feed,
             feed_id=feed_id,
             display_name=display_name,
             details=feed_details or {},
@@ -367,7 +370,7 @@ async def enable_feed(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Enable the feed
-        enabled_feed = chronicle.enable_feed(feed_id)
+        enabled_feed = await run_sdk(chronicle.enable_feed, feed_id)
 
         # Format the response
         result = {
@@ -432,7 +435,7 @@ async def disable_feed(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Disable the feed
-        disabled_feed = chronicle.disable_feed(feed_id)
+        disabled_feed = await run_sdk(chronicle.disable_feed, feed_id)
 
         # Format the response
         result = {
@@ -497,7 +500,7 @@ async def delete_feed(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Delete the feed
-        chronicle.delete_feed(feed_id)
+        await run_sdk(chronicle.delete_feed, feed_id)
 
         # Format the response
         result = {"id": feed_id, "message": "Feed deleted successfully"}
@@ -559,7 +562,7 @@ async def generate_feed_secret(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Generate the secret
-        secret_result = chronicle.generate_secret(feed_id)
+        secret_result = await run_sdk(chronicle.generate_secret, feed_id)
 
         # Format the response
         result = {"id": feed_id, "message": "Secret generated successfully"}
@@ -16,6 +16,7 @@
 import logging
 from typing import Any, Dict, List, Optional
 
+from secops_mcp.sdk_executor import run_sdk
 from secops_mcp.server import get_chronicle_client, server
 
 
@@ -78,7 +79,8 @@ async def list_investigations(
         chronicle = get_chronicle_client(project_id, customer_id, region)
         print(f"Listing investigations (page_size={page_size})...")
 
-        result = chronicle.list_investigations(
+        result = await run_sdk(
+            chronicle.list_investigations,
             page_size=page_size, page_token=page_token
         )
 
@@ -151,7 +153,8 @@ async def get_investigation(
         chronicle = get_chronicle_client(project_id, customer_id, region)
         print(f"Retrieving investigation: {investigation_id}...")
 
-        investigation = chronicle.get_investigation(
+        investigation = await run_sdk(
+            chronicle.get_investigation,
             investigation_id=investigation_id
         )
 
@@ -228,7 +231,9 @@ async def trigger_investigation(
         chronicle = get_chronicle_client(project_id, customer_id, region)
         print(f"Triggering investigation for alert: {alert_id}...")
 
-        investigation = chronicle.trigger_investigation(alert_id=alert_id)
+        investigation = await run_sdk(
+            chronicle.trigger_investigation, alert_id=alert_id
+        )
 
         if not investigation:
             return {
@@ -366,7 +371,8 @@ async def fetch_associated_investigations(
             f"{detection_label}(s)..."
         )
 
-        result = chronicle.fetch_associated_investigations(
+        result = await run_sdk(
+            chronicle.fetch_associated_investigations,
             detection_type=detection_type,
             alert_ids=alert_ids,
             case_ids=case_ids,
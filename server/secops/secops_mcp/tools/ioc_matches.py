@@ -17,6 +17,7 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+from secops_mcp.sdk_executor import run_sdk
 from secops_mcp.server import get_chronicle_client, server
 
 
@@ -75,7 +76,8 @@ async def get_ioc_matches(
         end_time = datetime.now(timezone.utc)
         start_time = end_time - timedelta(hours=hours_back)
 
-        iocs = chronicle.list_iocs(
+        iocs = await run_sdk(
+            chronicle.list_iocs,
             start_time=start_time, end_time=end_time, max_matches=max_matches
         )
 
@@ -13,12 +13,23 @@
 # limitations under the License.
 """Security Operations MCP tools for log ingestion."""
 
+import asyncio
 import json
 import logging
+import os
 import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Union
 
+from secops_mcp.file_tailer import DEFAULT_CHECKPOINT_PATH, TailCheckpoint, tail_files
+from secops_mcp.ingestion_engine import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_MAX_RETRIES,
+    decompress_entries,
+    entry_overhead,
+    ingest_batches,
+)
+from secops_mcp.sdk_executor import run_sdk
 from secops_mcp.server import get_chronicle_client, server
 
 
@@ -28,7 +39,10 @@ logger = logging.getLogger('secops-mcp')
 @server.tool()
 async def ingest_raw_log(
     log_type: str,
-    log_message: Union[str, List[str]],
+    log_message: Optional[Union[str, List[str]]] = None,
+    compressed_log_data: Optional[str] = None,
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+    max_retries: int = DEFAULT_MAX_RETRIES,
     project_id: Optional[str] = None,
     customer_id: Optional[str] = None,
     region: Optional[str] = None,
@@ -42,6 +56,10 @@ async def ingest_raw_log(
     Allows ingestion of raw log data in various formats (JSON, XML, CEF, etc.) into Chronicle
     for parsing and normalization into UDM format. Supports both single log and batch ingestion.
 
+    Lists of logs and compressed log data are packed into batches that fit the
+    import request size limit, submitted a few batches at a time, and batches
+    that fail are retried on their own. The response reports ingested and failed
+    entries and throughput in entries/s and bytes/s.
 
 
     **Workflow Integration:**
@@ -62,6 +80,10 @@ async def ingest_raw_log(
                        Use get_available_log_types to see supported types.
         log_message (Union[str, List[str]]): Log content as string or list of strings for batch ingestion.
                                            For JSON logs, provide as JSON string. For XML/other formats, provide raw content.
+        compressed_log_data (Optional[str]): Base64 encoded gzip of newline-delimited logs, one log per line, at most 256 MB once decompressed.
+                                             Use instead of log_message for large batches.
+        max_concurrency (int): Batches submitted at once. Defaults to 4.
+        max_retries (int): Times a failed batch is retried, with backoff. Defaults to 3.
         project_id (str): Google Cloud project ID (required).
         customer_id (str): Chronicle customer ID (required).
         region (str): Chronicle region (e.g., "us", "europe") (required).
@@ -106,13 +128,13 @@ async def ingest_raw_log(
 
         
         
+        if (log_message is None) == (compressed_log_data is None):
+            return 'Error ingesting raw log: provide exactly one of log_message or compressed_log_data'
+
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Prepare ingestion parameters
-        ingestion_params = {
-            'log_type': log_type,
-            'log_message': log_message
-        }
+        ingestion_params = {'log_type': log_type}
 
         if forwarder_id:
             ingestion_params['forwarder_id'] = forwarder_id
@@ -123,19 +145,53 @@ async def ingest_raw_log(
         if collection_time:
             ingestion_params['collection_time'] = datetime.fromisoformat(collection_time.replace('Z', '+00:00'))
 
-        # Ingest the log(s)
-        result = chronicle.ingest_log(**ingestion_params)
-
-        # Format response
-        operation = result.get('operation', 'Unknown operation')
-        log_count = len(log_message) if isinstance(log_message, list) else 1
-        
-        response = f'Successfully ingested {log_count} log(s) of type {log_type}.\n'
-        response += f'Operation: {operation}'
-        
+        if isinstance(log_message, str):
+            # A single string may hold several logs; the SDK splits it by log type.
+            result = await run_sdk(chronicle.ingest_log, log_message=log_message, **ingestion_params)
+            response = f'Successfully ingested 1 log(s) of type {log_type}.\n'
+            response += f"Operation: {result.get('operation', 'Unknown operation')}"
+            if labels:
+                response += f'\nLabels applied: {labels}'
+            return response
+
+        if log_message is not None:
+            entries = log_message
+        else:
+            # Decompress off the event loop; large payloads take a while.
+            entries = await asyncio.to_thread(decompress_entries, compressed_log_data)
+
+        if not forwarder_id:
+            # Resolve the default forwarder once instead of once per batch.
+            forwarder = await run_sdk(chronicle.get_or_create_forwarder)
+            ingestion_params['forwarder_id'] = forwarder['name']
+
+        async def submit(batch: List[str]) -> Dict[str, Any]:
+            return await run_sdk(chronicle.ingest_log, log_message=batch, **ingestion_params)
+
+        report = (await ingest_batches(
+            submit,
+            entries,
+            overhead=entry_overhead(labels),
+            concurrency=max_concurrency,
+            max_retries=max_retries,
+        )).to_dict()
+
+        response = (
+            f"Ingested {report['entries']} log(s) of type {log_type} in {report['batches']} batch(es) "
+            f"({report['entries_per_second']} entries/s, {report['bytes_per_second']} bytes/s).\n"
+        )
+        if report['failed_entries'] or report['rejected_entries']:
+            response += (
+                f"Failed: {report['failed_entries']} log(s) in {report['failed_batches']} batch(es); "
+                f"rejected as too large: {report['rejected_entries']}.\n"
+            )
+        response += f"Retries: {report['retries']}\n"
+        response += f"Operations: {', '.join(report['operations']) or 'none'}"
+        if report['errors']:
+            response += '\nErrors:\n' + '\n'.join(f'- {error}' for error in report['errors'])
         if labels:
             response += f'\nLabels applied: {labels}'
-        
+
         return response
 
     except Exception as e:
@@ -268,7 +324,7 @@ async def ingest_udm_events(
                 event['metadata']['id'] = str(uuid.uuid4())
 
         # Ingest the UDM events
-        result = chronicle.ingest_udm(udm_events=udm_events)
+        result = await run_sdk(chronicle.ingest_udm, udm_events=udm_events)
 
         # Format response
         event_count = len(events_to_ingest)
@@ -291,6 +347,131 @@ async def ingest_udm_events(
         logger.error(f'Error ingesting UDM events: {str(e)}', exc_info=True)
         return f'Error ingesting UDM events: {str(e)}'
 
+@server.tool()
+async def tail_log_files(
+    paths: List[str],
+    log_type: Optional[str] = None,
+    udm: bool = False,
+    pattern: str = '*',
+    follow_seconds: int = 0,
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    project_id: Optional[str] = None,
+    customer_id: Optional[str] = None,
+    region: Optional[str] = None,
+    forwarder_id: Optional[str] = None,
+    labels: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """Ingest new lines of log files on the MCP server host into Chronicle SIEM.
+
+    Works like a forwarder: each call reads what was appended to the given files
+    (or to the files in the given directories) since the last call, and sends it
+    to Chronicle in batches. Read positions of ingested batches are saved in a
+    checkpoint file every few seconds and at the end of each call, so a restarted
+    server resumes where it stopped. Only paths under the directory set in
+    SECOPS_TAIL_ROOT can be tailed; the tool is disabled if it is not set.
+    Files are followed across rotation: a renamed file is finished under its new
+    name, and a truncated or replaced file is read again from the start. Logs
+    never pass through tool arguments, so files of any size can be ingested.
+    Batches rejected permanently are skipped and listed in 'errors'; after any
+    other failed batch the file is left until the next call, which resends the
+    lines from the failed batch on.
+
+    **Workflow Integration:**
+    - Use for log files that are already on the server host (collectors, replay corpora, exports).
+    - Call repeatedly, or with `follow_seconds`, to keep shipping new lines as they are written.
+    - Ingested logs are parsed and become searchable like logs from `ingest_raw_log`.
+
+    **Use Cases:**
+    - Forward an application log directory without deploying a separate forwarder.
+    - Backfill a replay corpus of millions of lines from local files.
+    - Ship NDJSON files of UDM events produced by a custom tool (`udm=True`).
+
+    Args:
+        paths (List[str]): Files or directories to tail. For a file, rotated copies next to it
+                           (e.g. `app.log.1`) are finished if they were being tailed.
+        log_type (Optional[str]): Chronicle log type of the lines, e.g. "OKTA". Required unless udm is True.
+        udm (bool): Lines are UDM events as JSON objects, ingested without parsing. Defaults to False.
+        pattern (str): Glob for file names in tailed directories. Defaults to "*".
+        follow_seconds (int): Keep polling for new lines for this many seconds. Defaults to 0 (read once).
+        max_concurrency (int): Batches submitted at once. Defaults to 4.
+        max_retries (int): Times a failed batch is retried, with backoff. Defaults to 3.
+        project_id (Optional[str]): Google Cloud project ID. Defaults to environment configuration.
+        customer_id (Optional[str]): Chronicle customer ID. Defaults to environment configuration.
+        region (Optional[str]): Chronicle region (e.g., "us", "europe"). Defaults to environment configuration.
+        forwarder_id (Optional[str]): Forwarder for raw logs. If not provided, uses the default forwarder.
+        labels (Optional[Dict[str, str]]): Labels to attach to raw logs.
+
+    Returns:
+        Dict[str, Any]: Ingested, failed and rejected entry counts, batches, retries, throughput
+            (`entries_per_second`, `bytes_per_second`), the files read and any errors.
+            Contains an 'error' key if the files cannot be tailed.
+
+    Example Usage:
+        tail_log_files(paths=["/var/log/app"], log_type="NGINX", pattern="*.log")
+        tail_log_files(paths=["/data/udm/events.ndjson"], udm=True, follow_seconds=300)
+
+    Next Steps (using MCP-enabled tools):
+        - Verify ingestion by searching for the new logs with `search_udm`.
+        - Call again later to ship lines written since this call.
+    """
+    try:
+        logger.info(f'Tailing log files: {paths}')
+
+        if not udm and not log_type:
+            return {'error': 'log_type is required unless udm is True'}
+        root = os.environ.get('SECOPS_TAIL_ROOT')
+        if not root:
+            return {'error': 'Tailing is disabled: set SECOPS_TAIL_ROOT to the directory whose files may be tailed'}
+        root = os.path.realpath(root)
+        outside = [
+            path for path in paths
+            if os.path.commonpath([root, os.path.realpath(path)]) != root
+        ]
+        if outside:
+            return {'error': f'Paths outside SECOPS_TAIL_ROOT: {outside}'}
+        missing = [path for path in paths if not os.path.exists(path)]
+        if missing:
+            return {'error': f'Paths not found: {missing}'}
+
+        chronicle = get_chronicle_client(project_id, customer_id, region)
+
+        if udm:
+            async def submit(batch: List[str]) -> Dict[str, Any]:
+                events = [json.loads(line) for line in batch]
+                return await run_sdk(chronicle.ingest_udm, udm_events=events)
+        else:
+            ingestion_params = {'log_type': log_type}
+            if labels:
+                ingestion_params['labels'] = labels
+            if forwarder_id:
+                ingestion_params['forwarder_id'] = forwarder_id
+            else:
+                forwarder = await run_sdk(chronicle.get_or_create_forwarder)
+                ingestion_params['forwarder_id'] = forwarder['name']
+
+            async def submit(batch: List[str]) -> Dict[str, Any]:
+                return await run_sdk(chronicle.ingest_log, log_message=batch, **ingestion_params)
+
+        checkpoint = TailCheckpoint(
+            os.environ.get('SECOPS_TAIL_CHECKPOINT_PATH', DEFAULT_CHECKPOINT_PATH)
+        )
+        return await tail_files(
+            submit,
+            paths,
+            checkpoint,
+            pattern=pattern,
+            udm=udm,
+            follow_seconds=follow_seconds,
+            labels=None if udm else labels,
+            concurrency=max_concurrency,
+            max_retries=max_retries,
+        )
+
+    except Exception as e:
+        logger.error(f'Error tailing log files: {str(e)}', exc_info=True)
+        return {'error': f'Error tailing log files: {str(e)}'}
+
 @server.tool()
 async def get_available_log_types(
     project_id: Optional[str] = None,
@@ -356,10 +537,10 @@ async def get_available_log_types(
 
         if search_term:
             # Search for specific log types
-            log_types = chronicle.search_log_types(search_term)
+            log_types = await run_sdk(chronicle.search_log_types, search_term)
         else:
             # Get all log types (limit to first 50 to avoid overwhelming output)
-            log_types = chronicle.get_all_log_types()[:50]
+            log_types = (await run_sdk(chronicle.get_all_log_types))[:50]
 
         if not log_types:
             return f'No log types found{" matching search term: " + search_term if search_term else ""}.'
@@ -16,7 +16,9 @@
 import logging
 from typing import Any, Dict, List, Optional
 
-from secops.chronicle import ReferenceListView
+from secops.chronicle import ReferenceListSyntaxType, ReferenceListView
+from secops_mcp.reference_list_diff import current_entries, diff_entries
+from secops_mcp.sdk_executor import run_sdk
 from secops_mcp.server import get_chronicle_client, server
 
 # Configure logging
@@ -118,7 +120,8 @@ async def create_reference_list(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Create the reference list
-        reference_list = chronicle.create_reference_list(
+        reference_list = await run_sdk(
+            chronicle.create_reference_list,
             name=name,
             description=description,
             entries=entries,
@@ -235,7 +238,7 @@ async def get_reference_list(
         )
         
         # Get the reference list
-        reference_list = chronicle.get_reference_list(name, view=view)
+        reference_list = await run_sdk(chronicle.get_reference_list, name, view=view)
 
         if not reference_list:
             return f'Reference list "{name}" was not found.'
@@ -298,6 +301,8 @@ async def update_reference_list(
     region: Optional[str] = None,
     entries: Optional[List[str]] = None,
     description: Optional[str] = None,
+    add_entries: Optional[List[str]] = None,
+    remove_entries: Optional[List[str]] = None,
 ) -> str:
     """Update an existing reference list in Chronicle SIEM.
 
@@ -322,8 +327,12 @@ async def update_reference_list(
 
     **Update Behavior:**
     - If entries are provided, they completely replace the existing entries.
+    - add_entries and remove_entries change only those entries: the current list is fetched
+      by the server and the change is applied there, so large lists never need to be sent.
+      Entries already present are not added twice, and nothing is sent if nothing changes.
+      CIDR lists compare entries by network (`10.0.0.1` equals `10.0.0.1/32`).
     - If description is provided, it updates the reference list description.
-    - At least one of entries or description must be provided.
+    - At least one of entries, add_entries, remove_entries or description must be provided.
 
     Args:
         name (str): Name of the existing reference list to update.
@@ -332,9 +341,12 @@ async def update_reference_list(
         region (str): Chronicle region (e.g., "us", "europe") (required).
         entries (Optional[List[str]]): New list of entries to replace existing ones. If provided, completely replaces current entries.
         description (Optional[str]): New description for the reference list.
+        add_entries (Optional[List[str]]): Entries to append if not already present. Cannot be combined with entries.
+        remove_entries (Optional[List[str]]): Entries to remove. Cannot be combined with entries.
 
     Returns:
-        str: Success message with details about the updated reference list.
+        str: Success message with details about the updated reference list, including the
+             number of entries added and removed.
              Returns error message if update fails.
 
     Example Usage:
@@ -356,6 +368,13 @@ async def update_reference_list(
             region="us"
         )
 
+        # Append IOCs to a large blocklist without sending the whole list
+        update_reference_list(
+            name="blocked_domains",
+            add_entries=["evil.example.com", "bad.example.net"],
+            remove_entries=["false-positive.example.org"]
+        )
+
         # Update both entries and description
         update_reference_list(
             name="trusted_networks",
@@ -375,13 +394,13 @@ async def update_reference_list(
     """
     try:
         # Validate that at least one update parameter is provided
-        if entries is None and description is None:
-            return "Error: Either entries or description must be provided for update."
+        if entries is None and description is None and not add_entries and not remove_entries:
+            return "Error: Either entries, add_entries, remove_entries or description must be provided for update."
+        if entries is not None and (add_entries or remove_entries):
+            return "Error: entries replaces the whole list and cannot be combined with add_entries or remove_entries."
 
         logger.info(f'Updating reference list: {name}')
 
-        
-        
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Prepare update parameters
@@ -391,13 +410,43 @@ async def update_reference_list(
         if description is not None:
             update_params["description"] = description
 
+        diff = None
+        if add_entries or remove_entries:
+            reference_list = await run_sdk(
+                chronicle.get_reference_list, name, view=ReferenceListView.FULL
+            )
+            before = current_entries(reference_list)
+            diff = diff_entries(
+                before,
+                add_entries or [],
+                remove_entries or [],
+                reference_list.get("syntaxType", ReferenceListSyntaxType.STRING.value),
+            )
+            if diff.changed:
+                update_params["entries"] = diff.entries
+            delta = (
+                f'Entries added: {len(diff.added)} ({diff.already_present} already present)\n'
+                f'Entries removed: {len(diff.removed)} ({diff.not_found} not found)\n'
+                f'Total entries: {len(diff.entries)} (was {len(before)})\n'
+            )
+            if len(update_params) == 1:
+                return f'No changes to reference list: {name}\n' + delta
+
         # Update the reference list
-        updated_list = chronicle.update_reference_list(**update_params)
+        updated_list = await run_sdk(chronicle.update_reference_list, **update_params)
 
         result = f'Successfully updated reference list: {name}\n'
         
         # Show what was updated
-        if entries is not None:
+        if diff is not None:
+            result += delta
+            if diff.added:
+                result += '\nSample of added entries:\n'
+                for entry in diff.added[:5]:
+                    result += f'  - {entry}\n'
+                if len(diff.added) > 5:
+                    result += f'  ... and {len(diff.added) - 5} more entries\n'
+        elif entries is not None:
             result += f'Entries updated: {len(entries)} total entries\n'
             
             # Show sample of new entries
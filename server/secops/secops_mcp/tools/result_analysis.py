@@ -0,0 +1,202 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Security Operations MCP tools for analyzing stored search results."""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from secops_mcp.result_store import result_store
+from secops_mcp.server import server
+
+# Configure logging
+logger = logging.getLogger('secops-mcp')
+
+
+@server.tool()
+async def describe_results(result_handle: str) -> Dict[str, Any]:
+    """Describe a stored search result: its row count and available fields.
+
+    Search tools called with `store_results=True` (`search_udm`, `search_security_events`)
+    return a `result_handle`. Stored results stay available for an hour after last use and
+    can be analyzed with `filter_results`, `group_results` and `distinct_values` without
+    running the Chronicle search again.
+
+    Args:
+        result_handle (str): The handle returned by a search tool or `filter_results`.
+
+    Returns:
+        Dict[str, Any]: 'rows' (int), 'source' (str, the search that produced the rows) and
+            'fields' (Dict[str, int], each field path with the number of rows that have it).
+            Returns an 'error' key if the handle is unknown or expired.
+    """
+    try:
+        table = result_store.get(result_handle)
+        fields = {
+            field: sum(1 for value in column if value is not None)
+            for field, column in sorted(table.columns.items())
+        }
+        return {'rows': table.row_count, 'source': table.source, 'fields': fields}
+    except KeyError as e:
+        return {'error': e.args[0]}
+    except Exception as e:
+        logger.error(f'Error describing results: {str(e)}', exc_info=True)
+        return {'error': str(e)}
+
+
+@server.tool()
+async def filter_results(
+    result_handle: str,
+    filters: List[Dict[str, Any]],
+    fields: Optional[List[str]] = None,
+    limit: int = 20,
+) -> Dict[str, Any]:
+    """Filter stored search results locally and store the matching rows.
+
+    Use it to count or narrow down events from a previous search (e.g. only failed logins,
+    only events from one host) without querying Chronicle again. The matching rows are
+    stored under a new handle for further analysis.
+
+    Args:
+        result_handle (str): The handle returned by a search tool or a previous filter.
+        filters (List[Dict[str, Any]]): Conditions that must all match. Filters are dicts with
+            'field' (e.g. 'principal.ip'), 'op' and 'value'. Supported ops: eq, ne, in (value is
+            a list), contains (case-insensitive), prefix, regex, gt, gte, lt, lte (numeric, else
+            text order; ISO timestamps compare correctly) and exists (value true or false).
+            On repeated fields such as principal.ip a row matches if any value matches.
+        fields (Optional[List[str]]): Fields to include in the returned sample rows. Defaults to all.
+        limit (int): Maximum number of sample rows to return. Defaults to 20.
+
+    Returns:
+        Dict[str, Any]: 'result_handle' (str, handle of the matching rows), 'rows' (int, number
+            of matching rows) and 'sample' (List[Dict], up to `limit` matching rows).
+            Returns an 'error' key if the handle or a filter is invalid.
+
+    Example Usage:
+        filter_results(
+            result_handle="res_1a2b3c4d5e6f",
+            filters=[
+                {"field": "metadata.event_type", "op": "eq", "value": "USER_LOGIN"},
+                {"field": "security_result.action", "op": "eq", "value": "BLOCK"},
+            ],
+        )
+    """
+    try:
+        table = result_store.get(result_handle)
+        rows = table.filter_rows(filters)
+        handle = result_store.put(
+            table.take(rows, source=f'{result_handle} filtered by {filters}')
+        )
+        return {
+            'result_handle': handle,
+            'rows': len(rows),
+            'sample': table.records(rows[:max(0, limit)], fields),
+        }
+    except KeyError as e:
+        return {'error': e.args[0]}
+    except ValueError as e:
+        return {'error': str(e)}
+    except Exception as e:
+        logger.error(f'Error filtering results: {str(e)}', exc_info=True)
+        return {'error': str(e)}
+
+
+@server.tool()
+async def group_results(
+    result_handle: str,
+    group_by: List[str],
+    filters: Optional[List[Dict[str, Any]]] = None,
+    limit: int = 10,
+) -> Dict[str, Any]:
+    """Count stored search results per value of one or more fields (group by / top-k).
+
+    Answers follow-up questions like "top target hostnames" or "logins per user and IP"
+    from a previous search without querying Chronicle again.
+
+    Args:
+        result_handle (str): The handle returned by a search tool or `filter_results`.
+        group_by (List[str]): Field paths to group by, e.g. ["principal.ip"] or
+            ["principal.user.userid", "target.hostname"]. An empty list counts all rows. Rows with several values in a
+            repeated field are counted once per value; missing values group as null.
+        filters (Optional[List[Dict[str, Any]]]): Optional conditions applied before grouping,
+            in the same format as `filter_results`.
+        limit (int): Number of largest groups to return (the k of top-k). Defaults to 10.
+
+    Returns:
+        Dict[str, Any]: 'rows' (int, rows grouped), 'group_count' (int, number of distinct groups)
+            and 'groups' (List[Dict], the largest groups, each with the group_by fields and 'count').
+            Returns an 'error' key if the handle or a filter is invalid.
+    """
+    try:
+        table = result_store.get(result_handle)
+        rows = table.filter_rows(filters) if filters else None
+        counts = table.group_counts(group_by, rows)
+        groups = []
+        for key, count in counts.most_common(max(0, limit)):
+            values = key if len(group_by) > 1 else (key,)
+            group = dict(zip(group_by, values))
+            group['count'] = count
+            groups.append(group)
+        return {
+            'rows': table.row_count if rows is None else len(rows),
+            'group_count': len(counts),
+            'groups': groups,
+        }
+    except KeyError as e:
+        return {'error': e.args[0]}
+    except ValueError as e:
+        return {'error': str(e)}
+    except Exception as e:
+        logger.error(f'Error grouping results: {str(e)}', exc_info=True)
+        return {'error': str(e)}
+
+
+@server.tool()
+async def distinct_values(
+    result_handle: str,
+    field: str,
+    filters: Optional[List[Dict[str, Any]]] = None,
+    limit: int = 100,
+) -> Dict[str, Any]:
+    """List the distinct values of a field in stored search results.
+
+    Use it to extract indicators (IPs, users, hashes, domains) from a previous search for
+    enrichment or for building reference lists, without querying Chronicle again.
+
+    Args:
+        result_handle (str): The handle returned by a search tool or `filter_results`.
+        field (str): Field path, e.g. "target.ip" or "target.file.sha256".
+        filters (Optional[List[Dict[str, Any]]]): Optional conditions applied first, in the
+            same format as `filter_results`.
+        limit (int): Maximum number of values to return, most frequent first. Defaults to 100.
+
+    Returns:
+        Dict[str, Any]: 'distinct_count' (int) and 'values' (List, up to `limit` values).
+            Returns an 'error' key if the handle or a filter is invalid.
+    """
+    try:
+        table = result_store.get(result_handle)
+        rows = table.filter_rows(filters) if filters else None
+        counts = table.group_counts([field], rows)
+        counts.pop(None, None)
+        return {
+            'distinct_count': len(counts),
+            'values': [value for value, _ in counts.most_common(max(0, limit))],
+        }
+    except KeyError as e:
+        return {'error': e.args[0]}
+    except ValueError as e:
+        return {'error': str(e)}
+    except Exception as e:
+        logger.error(f'Error listing distinct values: {str(e)}', exc_info=True)
+        return {'error': str(e)}
@@ -17,6 +17,7 @@ import logging
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+from secops_mcp.sdk_executor import run_sdk
 from secops_mcp.server import get_chronicle_client, server
 
 # Configure logging
@@ -110,7 +111,8 @@ async def create_rule_exclusion(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Create the rule exclusion and return SDK response directly
-        return chronicle.create_rule_exclusion(
+        return await run_sdk(
+            chronicle.create_rule_exclusion,
             display_name=display_name,
             refinement_type=refinement_type,
             query=query,
@@ -199,7 +201,7 @@ async def get_rule_exclusion(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Get exclusion details
-        exclusion = chronicle.get_rule_exclusion(exclusion_id)
+        exclusion = await run_sdk(chronicle.get_rule_exclusion, exclusion_id)
 
         if not exclusion:
             return {
@@ -301,7 +303,7 @@ async def list_rule_exclusions(
             kwargs["page_token"] = page_token
 
         # List exclusions
-        exclusions = chronicle.list_rule_exclusions(**kwargs)
+        exclusions = await run_sdk(chronicle.list_rule_exclusions, **kwargs)
 
         # Add summary statistics
         exclusion_count = len(exclusions.get("findingsRefinements", []))
@@ -398,7 +400,8 @@ async def patch_rule_exclusion(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Update the exclusion and return SDK response directly
-        return chronicle.patch_rule_exclusion(
+        return await run_sdk(
+            chronicle.patch_rule_exclusion,
             exclusion_id=exclusion_id,
             display_name=display_name,
             query=query,
@@ -515,7 +518,8 @@ async def update_rule_exclusion_deployment(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Update deployment settings
-        return chronicle.update_rule_exclusion_deployment(
+        return await run_sdk(
+            chronicle.update_rule_exclusion_deployment,
             exclusion_id=exclusion_id,
             enabled=enabled,
             archived=archived,
@@ -626,7 +630,8 @@ async def compute_rule_exclusion_activity(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Compute exclusion activity
-        activity = chronicle.compute_rule_exclusion_activity(
+        activity = await run_sdk(
+            chronicle.compute_rule_exclusion_activity,
             exclusion_id=exclusion_id,
             start_time=start_time,
             end_time=end_time,
@@ -15,8 +15,11 @@
 
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+from secops_mcp.event_projection import shape_events
+from secops_mcp.result_cache import cached_search_udm
+from secops_mcp.result_store import result_store
 from secops_mcp.server import get_chronicle_client, server
 from secops_mcp.utils import parse_time_range
 
@@ -31,6 +34,11 @@ async def search_udm(
     start_time: Optional[str] = None,
     end_time: Optional[str] = None,
     max_events: Optional[int] = None,
+    shards: Optional[int] = None,
+    bypass_result_cache: bool = False,
+    store_results: bool = False,
+    fields: Optional[List[str]] = None,
+    compact: bool = False,
     project_id: str = None,
     customer_id: str = None,
     region: str = None,
@@ -43,6 +51,21 @@ async def search_udm(
         start_time (Optional[str]): Start time in ISO 8601 format (e.g. "2023-01-01T00:00:00Z"). Overrides hours_back.
         end_time (Optional[str]): End time in ISO 8601 format. Defaults to current time if not provided.
         max_events (Optional[int]): Maximum number of events to return.
+        shards (Optional[int]): Split the time range into this many sub-windows and search them
+            concurrently, splitting again any sub-window that hits `max_events`. Results are merged
+            newest first without duplicates. Use it for long, busy time ranges (e.g. 7-24 for a week).
+        bypass_result_cache (bool): Search the whole time range again instead of reusing results
+            cached by recent identical searches. Defaults to False.
+        store_results (bool): Also keep the returned events in a local result store and add
+            'result_handle' to the response. Follow-up questions can then be answered with
+            `filter_results`, `group_results` and `distinct_values` without searching again.
+            Defaults to False.
+        fields (Optional[List[str]]): UDM field paths to return for each event, e.g.
+            ["metadata.event_timestamp", "principal.ip", "target.hostname"]. A path may select a
+            whole message (e.g. "principal"). Event names are always kept. Defaults to all fields.
+        compact (bool): Return events as 'columns' (field paths) and 'rows' (one list of values
+            per event) instead of 'events', so keys are not repeated per event. Repeated fields
+            are lists and missing fields are null. Best combined with `fields`. Defaults to False.
         project_id (Optional[str]): Google Cloud project ID.
         customer_id (Optional[str]): Chronicle customer ID.
         region (Optional[str]): Chronicle region (e.g., "us", "europe").
@@ -63,16 +86,29 @@ async def search_udm(
 
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
-        # Call the search_udm method on the chronicle client
-        search_results = chronicle.search_udm(
-            query=query,
-            start_time=start_dt,
-            end_time=end_dt,
+        # Search through the result cache, which only searches the parts of
+        # the time range not covered by recently cached results.
+        search_results = await cached_search_udm(
+            chronicle,
+            query,
+            start_dt,
+            end_dt,
             max_events=max_events,
+            shards=shards,
+            bypass_cache=bypass_result_cache,
         )
 
         logger.info(f'Successfully found {search_results.get("total_events", 0)} events.')
 
+        if store_results and isinstance(search_results, dict):
+            search_results.update(
+                result_store.store_events(
+                    search_results.get('events', []), source=f'search_udm: {query}'
+                )
+            )
+
+        if isinstance(search_results, dict):
+            search_results = shape_events(search_results, fields, compact)
         return search_results
 
     except Exception as e:
@@ -18,6 +18,7 @@ import logging
 from datetime import datetime, timedelta, timezone
 
 from typing import Any, Dict, Optional
+from secops_mcp.sdk_executor import run_sdk
 from secops_mcp.server import get_chronicle_client, server
 
 
@@ -80,7 +81,8 @@ async def get_security_alerts(
         end_time = datetime.now(timezone.utc)
         start_time = end_time - timedelta(hours=hours_back)
 
-        alert_response = chronicle.get_alerts(
+        alert_response = await run_sdk(
+            chronicle.get_alerts,
             start_time=start_time,
             end_time=end_time,
             snapshot_query=status_filter,
@@ -198,7 +200,7 @@ async def get_security_alert_by_id(
 
     try:
         chronicle = get_chronicle_client(project_id, customer_id, region)
-        response = chronicle.get_alert(alert_id, include_detections)
+        response = await run_sdk(chronicle.get_alert, alert_id, include_detections)
     except Exception as e:
         return f'Error retrieving security alert for {alert_id}: {str(e)}'
 
@@ -282,7 +284,17 @@ Next Steps (using MCP-enabled tools):
     """
     try:
         chronicle = get_chronicle_client(project_id, customer_id, region)
-        response = chronicle.update_alert(alert_id, reason=reason, status=status, verdict=verdict, comment=comment, root_cause=root_cause, priority=priority, severity=severity)
+        response = await run_sdk(
+            chronicle.update_alert,
+            alert_id,
+            reason=reason,
+            status=status,
+            verdict=verdict,
+            comment=comment,
+            root_cause=root_cause,
+            priority=priority,
+            severity=severity,
+        )
     except Exception as e:
         return f'Error retrieving security alert for {alert_id}: {str(e)}'
 
@@ -15,9 +15,14 @@
 
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+from secops_mcp.event_projection import shape_events
+from secops_mcp.result_cache import cached_search_udm
+from secops_mcp.result_store import result_store
+from secops_mcp.sdk_executor import run_sdk
 from secops_mcp.server import get_chronicle_client, server
+from secops_mcp.translation_cache import TranslationCache, translation_cache
 from secops_mcp.utils import parse_time_range
 
 
@@ -35,6 +40,12 @@ async def search_security_events(
     end_time: Optional[str] = None,
     max_events: int = 100,
     region: Optional[str] = None,
+    bypass_translation_cache: bool = False,
+    shards: Optional[int] = None,
+    bypass_result_cache: bool = False,
+    store_results: bool = False,
+    fields: Optional[List[str]] = None,
+    compact: bool = False,
 ) -> Dict[str, Any]:
     """Search for security events in Chronicle SIEM using natural language.
 
@@ -71,6 +82,23 @@ async def search_security_events(
         end_time (Optional[str]): End time in ISO 8601 format. Defaults to current time if not provided.
         max_events (int): Maximum number of event records to return. Defaults to 100.
         region (Optional[str]): Chronicle region (e.g., "us", "europe"). Defaults to environment configuration.
+        bypass_translation_cache (bool): Translate `text` again even if an identical query was translated recently.
+            Use it if a cached `udm_query` looks wrong. Defaults to False.
+        shards (Optional[int]): Split the time range into this many sub-windows and search them
+            concurrently, splitting again any sub-window that hits `max_events`. Results are merged
+            newest first without duplicates. Use it for long, busy time ranges (e.g. 7-24 for a week).
+        bypass_result_cache (bool): Search the whole time range again instead of reusing results
+            cached by recent identical searches. Defaults to False.
+        store_results (bool): Also keep the returned events in a local result store and add
+            'result_handle' to the response. Follow-up questions can then be answered with
+            `filter_results`, `group_results` and `distinct_values` without searching again.
+            Defaults to False.
+        fields (Optional[List[str]]): UDM field paths to return for each event, e.g.
+            ["metadata.event_timestamp", "principal.ip", "target.hostname"]. A path may select a
+            whole message (e.g. "principal"). Event names are always kept. Defaults to all fields.
+        compact (bool): Return events as 'columns' (field paths) and 'rows' (one list of values
+            per event) instead of 'events', so keys are not repeated per event. Repeated fields
+            are lists and missing fields are null. Best combined with `fields`. Defaults to False.
 
     Returns:
         Dict[str, Any]: A dictionary containing:
@@ -133,15 +161,23 @@ async def search_security_events(
 
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
-        # Use the new natural language search method
-        udm_query = chronicle.translate_nl_to_udm(text)
+        # Use the new natural language search method. Translations of
+        # previously seen queries are served from the translation cache.
+        udm_query = await translation_cache.translate(
+            TranslationCache.key(str(chronicle.instance_id), text),
+            lambda: run_sdk(chronicle.translate_nl_to_udm, text),
+            bypass=bypass_translation_cache,
+        )
         logger.info(f'YL2 UDM Query: {udm_query}')
 
-        events = chronicle.search_udm(
-            query=udm_query,
-            start_time=start_dt,
-            end_time=end_dt,
+        events = await cached_search_udm(
+            chronicle,
+            udm_query,
+            start_dt,
+            end_dt,
             max_events=max_events,
+            shards=shards,
+            bypass_cache=bypass_result_cache,
         )
 
         # For compatibility with old format, check if we need to transform response
@@ -159,8 +195,15 @@ async def search_security_events(
             f' {len(event_list)} returned'
         )
 
+        if store_results:
+            events.update(
+                result_store.store_events(
+                    event_list, source=f'search_security_events: {udm_query}'
+                )
+            )
+
         # Return a new dictionary with UDM query first, then events data
-        return {'udm_query': udm_query, 'events': events}
+        return {'udm_query': udm_query, 'events': shape_events(events, fields, compact)}
 
     except Exception as e:
         logger.error(f'Error searching security events: {str(e)}', exc_info=True)
@@ -14,8 +14,17 @@
 """Security Operations MCP tools for security rules."""
 
 import logging
-from typing import Any, Dict, Optional
-
+import re
+from typing import Any, Dict, List, Optional
+
+from secops_mcp.rule_index import (
+    SEARCH_MODES,
+    RuleCorpus,
+    refresh_corpus,
+    rule_corpus_cache,
+    tokenize,
+)
+from secops_mcp.sdk_executor import run_sdk
 from secops_mcp.server import get_chronicle_client, server
 
 
@@ -73,7 +82,8 @@ async def list_security_rules(
             page_size = 1000
 
         chronicle = get_chronicle_client(project_id, customer_id, region)
-        rules_response = chronicle.list_rules(
+        rules_response = await run_sdk(
+            chronicle.list_rules,
             page_size=page_size, page_token=page_token
         )
         return rules_response
@@ -129,13 +139,136 @@ async def search_security_rules(
     """
     try:
         chronicle = get_chronicle_client(project_id, customer_id, region)
-        rules_response = chronicle.search_rules(query)
+        rules_response = await run_sdk(chronicle.search_rules, query)
         return rules_response
     except Exception as e:
         logger.error(f"Error searching security rules: {str(e)}", exc_info=True)
         return {"error": str(e), "rules": []}
 
 
+def _matching_lines(text: str, matches, limit: int = 3) -> List[str]:
+    lines = []
+    for line in text.splitlines():
+        if matches(line):
+            lines.append(line.strip())
+            if len(lines) >= limit:
+                break
+    return lines
+
+
+@server.tool()
+async def search_rule_corpus(
+    query: str,
+    mode: str = "regex",
+    case_insensitive: bool = False,
+    max_results: int = 50,
+    include_text: bool = False,
+    refresh: bool = False,
+    project_id: Optional[str] = None,
+    customer_id: Optional[str] = None,
+    region: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Search detection rules using a local, indexed copy of the rule corpus.
+
+    Much faster than `search_security_rules` for repeated searches: the server keeps
+    every rule's text and metadata locally and brings the copy up to date by listing
+    only revision IDs (at most once a minute, or when `refresh` is set) and fetching
+    just the rules that changed. Searches then run locally, in milliseconds, even over
+    thousands of YARA-L rules.
+
+    **Search Modes:**
+    - regex: Rules whose text matches the regular expression, like `search_security_rules`.
+    - tokens: Rules containing every word of the query as a token. Tokens are identifiers,
+      IPs, MITRE IDs and dotted UDM paths, plus the parts of dotted values, case-insensitive
+      (e.g. "T1059" matches "T1059.001", "log_type" matches "metadata.log_type").
+
+    **Examples:**
+    - Rules for a MITRE technique: query="T1059", mode="tokens".
+    - Rules hardcoding an address: query="192.168.1.1", mode="tokens".
+    - Rules for a log type: query='log_type = "WORKSPACE', mode="regex".
+
+    Args:
+        query (str): Regular expression, or words for tokens mode.
+        mode (str): "regex" or "tokens". Defaults to "regex".
+        case_insensitive (bool): Case-insensitive regex matching. Defaults to False.
+        max_results (int): Maximum number of rules to return. Defaults to 50.
+        include_text (bool): Include each rule's full text. Defaults to False (matching lines only).
+        refresh (bool): Check for changed rules before searching. Defaults to False.
+        project_id (Optional[str]): Google Cloud project ID. Defaults to environment configuration.
+        customer_id (Optional[str]): Chronicle customer ID. Defaults to environment configuration.
+        region (Optional[str]): Chronicle region (e.g., "us", "europe"). Defaults to environment configuration.
+
+    Returns:
+        Dict[str, Any]: 'total_matches', 'corpus_rules' and 'rules', each with 'rule_id',
+            'revision_id', 'display_name', 'severity', 'metadata' and 'matching_lines'
+            (and 'text' if requested). Contains an 'error' key if the search fails.
+
+    Next Steps (using MCP-enabled tools):
+        - Get the full definition of a matching rule with `get_detection_rule`.
+        - Review recent detections of a matching rule with `get_rule_detections`.
+    """
+    try:
+        if mode not in SEARCH_MODES:
+            return {"error": f"Unknown mode '{mode}'; use one of {list(SEARCH_MODES)}"}
+        if mode == "regex":
+            try:
+                regex = re.compile(query, re.IGNORECASE if case_insensitive else 0)
+            except re.error as e:
+                return {"error": f"Invalid regular expression: {e}"}
+
+        chronicle = get_chronicle_client(project_id, customer_id, region)
+
+        async def refresh_rules(corpus: RuleCorpus) -> Dict[str, int]:
+            async def list_revisions():
+                return await run_sdk(
+                    chronicle.list_rules, view="REVISION_METADATA_ONLY", as_list=True
+                )
+
+            async def list_full():
+                return await run_sdk(chronicle.list_rules, view="FULL", as_list=True)
+
+            async def get_rule(rule_id: str):
+                return await run_sdk(chronicle.get_rule, rule_id)
+
+            return await refresh_corpus(corpus, list_revisions, list_full, get_rule)
+
+        corpus = await rule_corpus_cache.get(
+            str(chronicle.instance_id), refresh_rules, force=refresh
+        )
+
+        if mode == "regex":
+            docs = corpus.search_regex(query, case_insensitive)
+            matches = regex.search
+        else:
+            docs = corpus.search_tokens(query)
+            wanted = tokenize(query)
+            matches = lambda line: bool(wanted & tokenize(line))
+
+        rules = []
+        for doc in docs[:max_results]:
+            severity = doc.rule.get("severity") or {}
+            record = {
+                "rule_id": doc.rule_id,
+                "revision_id": doc.revision_id,
+                "display_name": doc.display_name,
+                "severity": severity.get("displayName") if isinstance(severity, dict) else severity,
+                "metadata": doc.rule.get("metadata", {}),
+                "matching_lines": _matching_lines(doc.text, matches),
+            }
+            if include_text:
+                record["text"] = doc.text
+            rules.append(record)
+
+        return {
+            "total_matches": len(docs),
+            "corpus_rules": len(corpus.rules),
+            "rules": rules,
+        }
+    except Exception as e:
+        logger.error(f"Error searching rule corpus: {str(e)}", exc_info=True)
+        return {"error": str(e), "rules": []}
+
+
 @server.tool()
 async def get_detection_rule(
     rule_id: str,
@@ -208,7 +341,7 @@ async def get_detection_rule(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Get the rule using the client
-        rule_response = chronicle.get_rule(rule_id)
+        rule_response = await run_sdk(chronicle.get_rule, rule_id)
 
         logger.info(f"Successfully retrieved rule: {rule_id}")
         return rule_response
@@ -308,7 +441,8 @@ async def get_rule_detections(
                     f"alert_state must be one of {valid_alert_states}, got {alert_state}"
                 )
 
-        detections_response = chronicle.list_detections(
+        detections_response = await run_sdk(
+            chronicle.list_detections,
             rule_id, alert_state, page_size, page_token
         )
 
@@ -389,7 +523,7 @@ async def list_rule_errors(
             }
 
         logger.info(f"Requesting errors for rule_id: {rule_id}")
-        response = chronicle.list_errors(rule_id)
+        response = await run_sdk(chronicle.list_errors, rule_id)
 
         return response
 
@@ -487,7 +621,8 @@ async def create_rule(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Create the rule
-        rule = chronicle.create_rule(rule_text)
+        rule = await run_sdk(chronicle.create_rule, rule_text)
+        rule_corpus_cache.invalidate(str(chronicle.instance_id))
 
         # Extract rule ID from the response
         rule_id = rule.get("name", "").split("/")[-1]
@@ -612,7 +747,8 @@ async def test_rule(
         logger.info(f"Rule test time range: {start_time} to {end_time}")
 
         # Test the rule
-        test_results = chronicle.run_rule_test(
+        test_results = await run_sdk(
+            chronicle.run_rule_test,
             rule_text=rule_text,
             start_time=start_time,
             end_time=end_time,
@@ -787,7 +923,7 @@ async def validate_rule(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Validate the rule
-        validation_result = chronicle.validate_rule(rule_text)
+        validation_result = await run_sdk(chronicle.validate_rule, rule_text)
 
         # Format response based on validation result
         response = f"Rule Validation Results:\n\n"
@@ -956,7 +1092,7 @@ async def create_retrohunt(
             end_dt = end_dt.replace(tzinfo=timezone.utc)
 
         # Create retrohunt
-        retrohunt = chronicle.create_retrohunt(rule_id, start_dt, end_dt)
+        retrohunt = await run_sdk(chronicle.create_retrohunt, rule_id, start_dt, end_dt)
 
         # Extract operation ID from response
         operation_name = retrohunt.get("name", "")
@@ -1091,7 +1227,7 @@ async def get_retrohunt(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Get retrohunt status
-        retrohunt_status = chronicle.get_retrohunt(rule_id, operation_id)
+        retrohunt_status = await run_sdk(chronicle.get_retrohunt, rule_id, operation_id)
 
         # Extract key information from metadata
         metadata = retrohunt_status.get("metadata", {})
@@ -1240,7 +1376,8 @@ async def search_rule_alerts(
             end_dt = end_dt.replace(tzinfo=timezone.utc)
 
         # Search for rule alerts
-        alerts_response = chronicle.search_rule_alerts(
+        alerts_response = await run_sdk(
+            chronicle.search_rule_alerts,
             start_time=start_dt,
             end_time=end_dt,
             page_size=max_alerts,
@@ -17,6 +17,7 @@ import json
 import logging
 from typing import Optional
 
+from secops_mcp.sdk_executor import run_sdk
 from secops_mcp.server import get_chronicle_client, server
 
 
@@ -75,7 +76,7 @@ async def get_threat_intel(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Call the Gemini method from the SecOps SDK
-        response = chronicle.gemini(query)
+        response = await run_sdk(chronicle.gemini, query)
 
         # Handle GeminiResponse object
         if hasattr(response, 'get_text_content'):
@@ -13,17 +13,37 @@
 # limitations under the License.
 """Security Operations MCP tools for UDM search and export."""
 
+import asyncio
+import csv
+import gzip
 import json
 import logging
+import os
+import tempfile
+from collections import deque
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
-
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from secops_mcp.result_cache import (
+    epoch_seconds,
+    normalize_udm_query,
+    udm_result_cache,
+)
+from secops_mcp.sdk_executor import run_sdk
 from secops_mcp.server import get_chronicle_client, server
+from secops_mcp.sharded_search import MAX_SHARDS, MIN_SHARD_WINDOW, split_window
 from secops_mcp.utils import parse_time_range
 
 # Configure logging
 logger = logging.getLogger("secops-mcp")
 
+TIMESTAMP_FIELD = "metadata.event_timestamp"
+# Sub-window exports run ahead of the one being written to the file.
+EXPORT_WINDOWS_IN_FLIGHT = 3
+# fetch_udm_search_csv returns at most this many data rows; an export that
+# reaches it may have been cut off.
+EXPORT_ROW_LIMIT = 10000
+
 
 @server.tool()
 async def export_udm_search_csv(
@@ -33,6 +53,7 @@ async def export_udm_search_csv(
     start_time: Optional[str] = None,
     end_time: Optional[str] = None,
     case_insensitive: bool = True,
+    bypass_result_cache: bool = False,
     project_id: str = None,
     customer_id: str = None,
     region: str = None,
@@ -79,6 +100,9 @@ async def export_udm_search_csv(
         start_time (Optional[str]): Start time in ISO 8601 format (e.g. "2023-01-01T00:00:00Z"). Overrides hours_back.
         end_time (Optional[str]): End time in ISO 8601 format. Defaults to current time if not provided.
         case_insensitive (bool): Whether to perform case-insensitive search. Defaults to True.
+        bypass_result_cache (bool): Export the whole time range again instead of reusing rows
+            cached by recent identical exports. Rows are only cached when `fields` includes
+            metadata.event_timestamp. Defaults to False.
         project_id (Optional[str]): Google Cloud project ID. Defaults to environment configuration.
         customer_id (Optional[str]): Chronicle customer ID. Defaults to environment configuration.
         region (Optional[str]): Chronicle region (e.g., "us", "europe"). Defaults to environment configuration.
@@ -141,62 +165,183 @@ async def export_udm_search_csv(
 
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
+        if TIMESTAMP_FIELD in fields:
+            # Rows can be assigned to time buckets, so reuse cached results.
+            return await _cached_export_csv(
+                chronicle,
+                query,
+                fields,
+                start_dt,
+                end_dt,
+                case_insensitive,
+                bypass_result_cache,
+            )
+
         # Call the fetch_udm_search_csv method on the chronicle client
-        csv_results = chronicle.fetch_udm_search_csv(
+        csv_results = await run_sdk(
+            chronicle.fetch_udm_search_csv,
             query=query,
             start_time=start_dt,
             end_time=end_dt,
             fields=fields,
             case_insensitive=case_insensitive,
         )
+        return _format_csv_results(csv_results)
 
-        # SDK/Wrapper is returning JSON string directly instead of CSV
-        if isinstance(csv_results, str):
-            try:
-                csv_results = json.loads(csv_results)   
-            except json.JSONDecodeError:
-                return csv_results
-
-        if isinstance(csv_results, list):
-            csv_results = csv_results[0]
-            
-        if (
-            csv_results.get("queryValidationErrors")
-            or csv_results.get("runtimeErrors")
-            or csv_results.get("failureCsvFieldValidations")
-        ):
-
-            export_errors = (
-                csv_results.get("queryValidationErrors")
-                or csv_results.get("runtimeErrors")
-                or csv_results.get("failureCsvFieldValidations")
-            )
+    except Exception as e:
+        logger.error(
+            f"Error exporting UDM search to CSV: {str(e)}", exc_info=True
+        )
+        return f"Error exporting UDM search results: {str(e)}"
+
+
+@server.tool()
+async def export_udm_search_csv_to_file(
+    query: str,
+    fields: List[str],
+    hours_back: int = 24,
+    start_time: Optional[str] = None,
+    end_time: Optional[str] = None,
+    case_insensitive: bool = True,
+    shards: int = 24,
+    compress: bool = False,
+    file_name: Optional[str] = None,
+    overwrite: bool = False,
+    project_id: str = None,
+    customer_id: str = None,
+    region: str = None,
+) -> Dict[str, Any]:
+    """Export large UDM search results to a local CSV file instead of returning them.
+
+    Splits the time range into sub-windows, exports each with the same query and
+    fields as export_udm_search_csv, and appends the rows to a file on the MCP
+    server host as each sub-window completes. Only the file location and counts
+    are returned, so exports of hundreds of thousands of rows neither exhaust
+    server memory nor overflow the client.
+
+    **Workflow Integration:**
+    - Use instead of export_udm_search_csv when a query is expected to match more rows
+      than can reasonably be returned in a response (e.g. a week of busy log types).
+    - Hand the returned path to file-based tools or scripts for further analysis.
+
+    Args:
+        query (str): UDM query to search for events. Use Chronicle query syntax.
+        fields (List[str]): List of UDM fields to include in the CSV export.
+        hours_back (int): How many hours back from the current time to search. Used if start_time is not provided.
+        start_time (Optional[str]): Start time in ISO 8601 format (e.g. "2023-01-01T00:00:00Z"). Overrides hours_back.
+        end_time (Optional[str]): End time in ISO 8601 format. Defaults to current time if not provided.
+        case_insensitive (bool): Whether to perform case-insensitive search. Defaults to True.
+        shards (int): Number of sub-windows the time range is exported in. Rows are written in
+            chronological order of sub-window. A sub-window that reaches the export row limit
+            is split in half and exported again. Defaults to 24.
+        compress (bool): Write a gzip-compressed file (.csv.gz). Defaults to False.
+        file_name (Optional[str]): Name of the file to create in the export directory
+            (SECOPS_EXPORT_DIR, or the system temporary directory). A unique name is generated
+            if not provided.
+        overwrite (bool): Replace an existing file named file_name. If False (default), the export
+            fails instead.
+        project_id (Optional[str]): Google Cloud project ID. Defaults to environment configuration.
+        customer_id (Optional[str]): Chronicle customer ID. Defaults to environment configuration.
+        region (Optional[str]): Chronicle region (e.g., "us", "europe"). Defaults to environment configuration.
+
+    Returns:
+        Dict[str, Any]: A dictionary containing:
+            - 'path' (str): Absolute path of the written file.
+            - 'rows' (int): Number of data rows written, excluding the header row.
+            - 'bytes' (int): Size of the file in bytes.
+            - 'shards' (int): Number of sub-windows exported.
+            - 'truncated' (bool): Whether a one-minute sub-window still reached the export row
+              limit, so some of its rows are missing.
+            - 'errors' (List[str]): Sub-windows whose export failed or was truncated; their rows are missing.
+            Returns an 'error' key instead if nothing could be exported.
+    """
+    try:
+        try:
+            start_dt, end_dt = parse_time_range(start_time, end_time, hours_back)
+        except ValueError as e:
+            logger.error(f"Error parsing date format: {str(e)}", exc_info=True)
+            return {"error": f"Error parsing date format: {str(e)}. Use ISO 8601 format (e.g., 2023-01-01T12:00:00Z)"}
 
-            logger.error(
-                f"Error exporting UDM search to CSV: {export_errors}",
-                exc_info=True,
+        logger.info(
+            f"Exporting UDM search results to file - Query: {query}, "
+            f"Fields: {fields}, Effective Time Range: {start_dt} to {end_dt}"
+        )
+
+        chronicle = get_chronicle_client(project_id, customer_id, region)
+        path = _export_path(file_name, compress)
+        # Generated names are created empty by _export_path; only chosen names
+        # can collide with an earlier export.
+        must_not_exist = bool(file_name) and not overwrite
+        if must_not_exist and os.path.exists(path):
+            return {"error": f"Export file {path} already exists. Pass overwrite=True to replace it."}
+        windows = split_window(start_dt, end_dt, max(1, min(shards, MAX_SHARDS)))
+
+        async def export_window(start: datetime, end: datetime):
+            return await run_sdk(
+                chronicle.fetch_udm_search_csv,
+                query=query,
+                start_time=start,
+                end_time=end,
+                fields=fields,
+                case_insensitive=case_insensitive,
             )
-            return f"Error exporting UDM search results: {export_errors}"
 
+        header = None
         row_count = 0
-        if (
-            "csv" in csv_results
-            and csv_results["csv"]
-            and csv_results["csv"].get("row")
-        ):
-            row_count = len(csv_results["csv"]["row"])
-            logger.info(f"Successfully exported {row_count} rows to CSV format")
-            # Returning CSV as a string
-            return "\n".join(csv_results["csv"]["row"])
-
-        # Return raw response as default
-        return "No results found"
+        errors = []
+        truncated = []
+        tmp_path = f"{path}.part"
+        opener = gzip.open if compress else open
+        # Keep a few exports in flight, but write them in order and drop each
+        # window's rows as soon as they are written.
+        pending = deque()
+        try:
+            with opener(tmp_path, "wt", encoding="utf-8", newline="") as f:
+                for start, end in windows:
+                    pending.append(
+                        (start, end, asyncio.ensure_future(export_window(start, end)))
+                    )
+                    if len(pending) < EXPORT_WINDOWS_IN_FLIGHT:
+                        continue
+                    header, written = await _write_export_window(
+                        f, pending.popleft(), header, errors, truncated, export_window
+                    )
+                    row_count += written
+                while pending:
+                    header, written = await _write_export_window(
+                        f, pending.popleft(), header, errors, truncated, export_window
+                    )
+                    row_count += written
+        except BaseException:
+            for _, _, future in pending:
+                future.cancel()
+            _remove_failed_export(tmp_path, None if file_name else path)
+            raise
+
+        # Nothing was written and every sub-window failed.
+        if errors and header is None and len(errors) >= len(windows):
+            _remove_failed_export(tmp_path, None if file_name else path)
+            return {"error": f"Error exporting UDM search results: {errors[0]}"}
+        if must_not_exist and os.path.exists(path):
+            os.remove(tmp_path)
+            return {"error": f"Export file {path} already exists. Pass overwrite=True to replace it."}
+        os.replace(tmp_path, path)
+        size = os.path.getsize(path)
+        logger.info(f"Exported {row_count} rows ({size} bytes) to {path}")
+        return {
+            "path": path,
+            "rows": row_count,
+            "bytes": size,
+            "shards": len(windows),
+            "truncated": bool(truncated),
+            "errors": errors,
+        }
 
     except Exception as e:
         logger.error(
-            f"Error exporting UDM search to CSV: {str(e)}", exc_info=True
+            f"Error exporting UDM search to file: {str(e)}", exc_info=True
         )
-        return f"Error exporting UDM search results: {str(e)}"
+        return {"error": f"Error exporting UDM search results: {str(e)}"}
 
 
 @server.tool()
@@ -288,7 +433,8 @@ async def find_udm_field_values(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Call the aliased library function
-        results = chronicle.find_udm_field_values(
+        results = await run_sdk(
+            chronicle.find_udm_field_values,
             query=query, page_size=page_size
         )
 
@@ -310,3 +456,216 @@ async def find_udm_field_values(
     except Exception as e:
         logger.error(f"Error finding UDM field values: {str(e)}", exc_info=True)
         return {"error": str(e), "values": []}
+
+
+def _parse_csv_results(csv_results: Any) -> Tuple[Optional[List[str]], Any]:
+    """Returns (rows, errors) of a fetch_udm_search_csv response.
+
+    rows is None if the response is not a CSV export result.
+    """
+    # SDK/Wrapper is returning JSON string directly instead of CSV
+    if isinstance(csv_results, str):
+        try:
+            csv_results = json.loads(csv_results)
+        except json.JSONDecodeError:
+            return None, None
+
+    if isinstance(csv_results, list):
+        csv_results = csv_results[0]
+
+    export_errors = (
+        csv_results.get("queryValidationErrors")
+        or csv_results.get("runtimeErrors")
+        or csv_results.get("failureCsvFieldValidations")
+    )
+    if export_errors:
+        return None, export_errors
+    return (csv_results.get("csv") or {}).get("row") or [], None
+
+
+def _format_csv_results(csv_results: Any) -> str:
+    """Formats a fetch_udm_search_csv response as the tool result."""
+    rows, export_errors = _parse_csv_results(csv_results)
+    if export_errors:
+        logger.error(
+            f"Error exporting UDM search to CSV: {export_errors}",
+            exc_info=True,
+        )
+        return f"Error exporting UDM search results: {export_errors}"
+    if rows is None:
+        return csv_results
+    if rows:
+        logger.info(f"Successfully exported {len(rows)} rows to CSV format")
+        # Returning CSV as a string
+        return "\n".join(rows)
+
+    # Return raw response as default
+    return "No results found"
+
+
+async def _cached_export_csv(
+    chronicle: Any,
+    query: str,
+    fields: List[str],
+    start_dt: datetime,
+    end_dt: datetime,
+    case_insensitive: bool,
+    bypass_cache: bool,
+) -> str:
+    """Exports CSV rows through the UDM result cache.
+
+    Rows are bucketed by their metadata.event_timestamp column. The header
+    row is cached next to the buckets.
+    """
+    scope = (
+        str(chronicle.instance_id),
+        "csv",
+        normalize_udm_query(query),
+        tuple(fields),
+        case_insensitive,
+    )
+    header_key = scope + ("header",)
+    header = (udm_result_cache.get(header_key) or [None])[0]
+    column = fields.index(TIMESTAMP_FIELD)
+
+    def row_time(row: str) -> Optional[float]:
+        try:
+            value = next(csv.reader([row]))[column]
+            return epoch_seconds(datetime.fromisoformat(value))
+        except (IndexError, ValueError):
+            return None
+
+    failures = []
+
+    async def fetch_range(start: datetime, end: datetime):
+        nonlocal header
+        csv_results = await run_sdk(
+            chronicle.fetch_udm_search_csv,
+            query=query,
+            start_time=start,
+            end_time=end,
+            fields=fields,
+            case_insensitive=case_insensitive,
+        )
+        rows, _ = _parse_csv_results(csv_results)
+        if rows is None:
+            failures.append(csv_results)
+            return [], False, csv_results
+        if not rows:
+            return [], True, csv_results
+        header = rows[0]
+        udm_result_cache.put(header_key, [header])
+        # Rows past the cut-off of a truncated export are missing, so its
+        # buckets must not be cached.
+        return rows[1:], len(rows) - 1 < EXPORT_ROW_LIMIT, csv_results
+
+    segments = await udm_result_cache.fetch(
+        scope, start_dt, end_dt, fetch_range, row_time, bypass=bypass_cache
+    )
+    if len(segments) == 1 and not segments[0].cached:
+        return _format_csv_results(segments[0].raw)
+    if failures:
+        # The export of a gap failed.
+        return _format_csv_results(failures[0])
+    rows = [row for segment in segments for row in segment.items]
+    if header is None:
+        if not rows:
+            return "No results found"
+        # The header was evicted; export the whole range again.
+        return await _cached_export_csv(
+            chronicle, query, fields, start_dt, end_dt, case_insensitive, True
+        )
+
+    logger.info(
+        f"Successfully exported {len(rows)} rows to CSV format "
+        f"({sum(segment.cached for segment in segments)} cached time buckets)"
+    )
+    return "\n".join([header] + rows)
+
+
+def _export_path(file_name: Optional[str], compress: bool) -> str:
+    """Returns the path of a new export file in the export directory."""
+    directory = os.environ.get("SECOPS_EXPORT_DIR") or tempfile.gettempdir()
+    os.makedirs(directory, exist_ok=True)
+    suffix = ".csv.gz" if compress else ".csv"
+    if not file_name:
+        fd, path = tempfile.mkstemp(
+            prefix="udm_export_", suffix=suffix, dir=directory
+        )
+        os.close(fd)
+        return path
+    # Only a file name is accepted, never a path outside the directory.
+    file_name = os.path.basename(file_name)
+    if not file_name.endswith(suffix):
+        file_name += suffix
+    return os.path.join(os.path.abspath(directory), file_name)
+
+
+def _remove_failed_export(tmp_path: str, generated_path: Optional[str]):
+    """Removes the partial file of a failed export and its generated name."""
+    for path in (tmp_path, generated_path):
+        if path and os.path.exists(path):
+            os.remove(path)
+
+
+async def _write_export_window(
+    f: Any,
+    window: Tuple[datetime, datetime, "asyncio.Future"],
+    header: Optional[str],
+    errors: List[str],
+    truncated: List[str],
+    export_window: Callable[[datetime, datetime], Awaitable[Any]],
+) -> Tuple[Optional[str], int]:
+    """Writes the rows of one exported sub-window to the export file.
+
+    A sub-window whose export reached EXPORT_ROW_LIMIT rows is split in half
+    and exported again, down to MIN_SHARD_WINDOW; one that still reaches the
+    limit is written as is and listed in `truncated` and `errors`.
+
+    Returns the header row written to the file so far and the number of data
+    rows written. Failures are appended to `errors`.
+    """
+    start, end, future = window
+    span = f"{start.isoformat()} to {end.isoformat()}"
+    try:
+        rows, export_errors = _parse_csv_results(await future)
+    except Exception as e:
+        logger.warning(f"Export of {span} failed: {str(e)}")
+        errors.append(f"{span}: {str(e)}")
+        return header, 0
+    if export_errors or rows is None:
+        errors.append(f"{span}: {export_errors or 'unexpected response'}")
+        return header, 0
+    if not rows:
+        return header, 0
+    data = rows[1:]
+    if len(data) >= EXPORT_ROW_LIMIT:
+        if end - start >= MIN_SHARD_WINDOW * 2:
+            logger.debug(f"Export of {span} hit the row limit, splitting")
+            halves = [
+                (s, e, asyncio.ensure_future(export_window(s, e)))
+                for s, e in split_window(start, end, 2)
+            ]
+            written = 0
+            try:
+                for half in halves:
+                    header, count = await _write_export_window(
+                        f, half, header, errors, truncated, export_window
+                    )
+                    written += count
+            except BaseException:
+                for _, _, half_future in halves:
+                    half_future.cancel()
+                raise
+            return header, written
+        truncated.append(span)
+        errors.append(
+            f"{span}: reached the export limit of {EXPORT_ROW_LIMIT} rows; "
+            "later rows of this window are missing"
+        )
+    if header is None:
+        header = rows[0]
+        await asyncio.to_thread(f.write, header + "\n")
+    if data:
+        await asyncio.to_thread(f.write, "\n".join(data) + "\n")
+    return header, len(data)
@@ -16,6 +16,7 @@
 import logging
 from typing import Any, Dict, Optional
 
+from secops_mcp.sdk_executor import run_sdk
 from secops_mcp.server import get_chronicle_client, server
 
 # Configure logging
@@ -108,7 +109,8 @@ async def create_watchlist(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Create the watchlist and return SDK response directly
-        return chronicle.create_watchlist(
+        return await run_sdk(
+            chronicle.create_watchlist,
             name=name,
             display_name=display_name,
             multiplying_factor=multiplying_factor,
@@ -207,7 +209,8 @@ async def update_watchlist(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Update the watchlist and return SDK response directly
-        return chronicle.update_watchlist(
+        return await run_sdk(
+            chronicle.update_watchlist,
             watchlist_id=watchlist_id,
             display_name=display_name,
             description=description,
@@ -299,7 +302,7 @@ async def delete_watchlist(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Delete the watchlist
-        result = chronicle.delete_watchlist(watchlist_id, force=force)
+        result = await run_sdk(chronicle.delete_watchlist, watchlist_id, force=force)
 
         # If delete returns None or empty, return success confirmation
         if not result:
@@ -386,7 +389,7 @@ async def get_watchlist(
         chronicle = get_chronicle_client(project_id, customer_id, region)
 
         # Get watchlist details
-        watchlist = chronicle.get_watchlist(watchlist_id)
+        watchlist = await run_sdk(chronicle.get_watchlist, watchlist_id)
 
         if not watchlist:
             return {"error": f"Watchlist with ID {watchlist_id} not found"}
@@ -491,7 +494,7 @@ async def list_watchlists(
             kwargs["as_list"] = as_list
 
         # List watchlists
-        watchlists = chronicle.list_watchlists(**kwargs)
+        watchlists = await run_sdk(chronicle.list_watchlists, **kwargs)
 
         # If as_list=True, watchlists is a direct list
         # If as_list=False, it's a dict with pagination metadata
@@ -0,0 +1,186 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cache of natural language to UDM query translations.
+
+Translating a natural language query is a slow, model-backed round trip, and
+playbooks keep sending the same phrases. Translations are cached by
+normalized text in an LRU cache, optionally persisted to a JSON file.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import threading
+import time
+import unicodedata
+from typing import Any, Awaitable, Callable, Optional
+
+from secops_mcp.async_cache import AsyncTTLCache, ttl_from_env
+
+logger = logging.getLogger('secops-mcp')
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL_SECONDS = 24 * 3600
+DEFAULT_SAVE_DELAY_SECONDS = 5.0
+
+_QUOTES = str.maketrans({
+    '‘': "'", '’': "'", '‚': "'", '‛': "'",
+    '“': "'", '”': "'", '„': "'", '‟': "'",
+    '`': "'", '"': "'",
+})
+_QUOTED = re.compile(r"('[^']*')")
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_query(text: str) -> str:
+    """Normalizes a natural language query for use as a cache key.
+
+    Whitespace is collapsed and every kind of quote becomes a single quote.
+    Text outside quotes is lowercased; quoted values keep their case, since
+    UDM comparisons on them may be case-sensitive.
+    """
+    text = unicodedata.normalize('NFKC', text).translate(_QUOTES)
+    text = _WHITESPACE.sub(' ', text).strip()
+    parts = _QUOTED.split(text)
+    # Odd parts are the quoted values.
+    return ''.join(
+        part if i % 2 else part.lower() for i, part in enumerate(parts)
+    )
+
+
+class TranslationCache(AsyncTTLCache):
+    """LRU cache of UDM translations, keyed by instance and normalized text."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = DEFAULT_TTL_SECONDS,
+        path: Optional[str] = None,
+        save_delay: float = DEFAULT_SAVE_DELAY_SECONDS,
+    ):
+        """Initializes the cache.
+
+        Args:
+            max_entries: The maximum number of cached translations.
+            ttl: Seconds a translation stays valid; 0 disables the cache
+                and None keeps translations until they are evicted.
+            path: Optional JSON file the cache is loaded from and saved to.
+            save_delay: Seconds to wait after a change before saving, so a
+                burst of translations is written once.
+        """
+        # Entries are timestamped with the Unix time, so that persisted
+        # entries expire across restarts.
+        super().__init__(max_entries, ttl, clock=time.time)
+        self.path = path
+        self.save_delay = save_delay
+        self._save_task: Optional[asyncio.Task] = None
+        self._dirty = False
+        if path:
+            self._load()
+
+    @staticmethod
+    def key(instance: str, text: str) -> str:
+        """Builds the cache key of a query sent to a Chronicle instance."""
+        return instance + '|' + normalize_query(text)
+
+    def _cacheable(self, value: Any) -> bool:
+        return bool(value)
+
+    def put(self, key: str, udm_query: str):
+        super().put(key, udm_query)
+        if self.path and self.enabled:
+            self._dirty = True
+            self._schedule_save()
+
+    async def translate(
+        self,
+        key: str,
+        translate: Callable[[], Awaitable[str]],
+        bypass: bool = False,
+    ) -> str:
+        """Returns the cached translation, or translates and caches it.
+
+        Concurrent misses for the same key share one translation.
+
+        Args:
+            key: The cache key, from `TranslationCache.key`.
+            translate: Performs the translation.
+            bypass: Whether to ignore the cached translation. The fresh
+                translation still replaces it.
+        """
+        udm_query, _ = await self.get_or_fetch(key, translate, bypass)
+        return udm_query
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f'Ignoring unreadable translation cache {self.path}: {e}')
+            return
+        for key, (udm_query, created_at) in entries.items():
+            if not self._expired(created_at):
+                self._entries[key] = (udm_query, created_at)
+        self._evict()
+
+    def _schedule_save(self):
+        """Saves the cache in a thread `save_delay` seconds after a change.
+
+        Outside an event loop the cache is saved right away.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._save()
+            return
+        if self._save_task is None or self._save_task.done():
+            self._save_task = loop.create_task(self._save_later())
+
+    async def _save_later(self):
+        await asyncio.sleep(self.save_delay)
+        await asyncio.to_thread(self._save)
+
+    def close(self):
+        """Writes changes that are still waiting for their delayed save."""
+        if self.path and self._dirty:
+            self._save()
+
+    def _save(self):
+        with self._lock:
+            self._dirty = False
+            entries = {key: list(entry) for key, entry in self._entries.items()}
+        tmp_path = f'{self.path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f'Failed to save translation cache {self.path}: {e}')
+
+
+def _from_env() -> TranslationCache:
+    return TranslationCache(
+        max_entries=int(
+            os.environ.get('SECOPS_NL_CACHE_SIZE', DEFAULT_MAX_ENTRIES)
+        ),
+        ttl=ttl_from_env('SECOPS_NL_CACHE_TTL', DEFAULT_TTL_SECONDS),
+        path=os.environ.get('SECOPS_NL_CACHE_PATH') or None,
+    )
+
+
+translation_cache = _from_env()
@@ -0,0 +1,70 @@
+"""Unit tests for the shared LRU cache with a TTL and single-flight fetches."""
+
+import sys
+import os
+import asyncio
+
+import pytest
+
+# Ensure server/secops is in path to import secops_mcp
+current_dir = os.path.dirname(os.path.abspath(__file__))
+server_secops_dir = os.path.dirname(current_dir)
+if server_secops_dir not in sys.path:
+    sys.path.append(server_secops_dir)
+
+from secops_mcp.async_cache import AsyncTTLCache, ttl_from_env
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_the_ttl():
+    """Entries older than the TTL are misses; a TTL of None keeps them."""
+    clock = Clock()
+    cache = AsyncTTLCache(max_entries=10, ttl=60, clock=clock)
+    forever = AsyncTTLCache(max_entries=10, ttl=None, clock=clock)
+    disabled = AsyncTTLCache(max_entries=10, ttl=0, clock=clock)
+    for c in (cache, forever, disabled):
+        c.put("a", 1)
+
+    assert disabled.get("a") is None
+    clock.now += 61
+    assert cache.get("a") is None
+    assert forever.get("a") == 1
+
+
+def test_ttl_from_env(monkeypatch):
+    """TTL settings are seconds, with 'never' for entries that do not expire."""
+    assert ttl_from_env("TEST_CACHE_TTL", 60) == 60
+    monkeypatch.setenv("TEST_CACHE_TTL", "0")
+    assert ttl_from_env("TEST_CACHE_TTL", 60) == 0
+    monkeypatch.setenv("TEST_CACHE_TTL", "Never")
+    assert ttl_from_env("TEST_CACHE_TTL", 60) is None
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_shares_misses_and_skips_failures():
+    """Concurrent misses share a fetch; failed fetches are not cached."""
+    cache = AsyncTTLCache(max_entries=10, ttl=60)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        if calls == 1:
+            raise RuntimeError("unavailable")
+        return "value"
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_fetch("k", fetch)
+    results = await asyncio.gather(*(cache.get_or_fetch("k", fetch) for _ in range(3)))
+    assert results == [("value", False)] * 3
+    assert await cache.get_or_fetch("k", fetch) == ("value", True)
+    assert await cache.get_or_fetch("k", fetch, bypass=True) == ("value", False)
+    assert calls == 3
@@ -0,0 +1,91 @@
+"""Unit tests for the Chronicle client pool."""
+
+import sys
+import os
+import datetime
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Ensure server/secops is in path to import secops_mcp
+current_dir = os.path.dirname(os.path.abspath(__file__))
+server_secops_dir = os.path.dirname(current_dir)
+if server_secops_dir not in sys.path:
+    sys.path.append(server_secops_dir)
+
+from secops_mcp.client_pool import ChronicleClientPool
+
+
+def make_client(expiry_seconds=3600):
+    client = MagicMock()
+    credentials = client.session.credentials
+    credentials.token = "token"
+    credentials.expiry = datetime.datetime.now(
+        datetime.timezone.utc
+    ).replace(tzinfo=None) + datetime.timedelta(seconds=expiry_seconds)
+    return client
+
+
+@pytest.fixture
+def factory():
+    return MagicMock(side_effect=lambda *args: make_client())
+
+
+def test_get_reuses_client_per_key(factory):
+    """Clients are created once per project, customer, region and credentials."""
+    pool = ChronicleClientPool(factory, refresh_interval=0)
+
+    first = pool.get("p", "c", "us")
+    assert pool.get("p", "c", "us") is first
+    assert pool.get("p", "c", "eu") is not first
+    assert pool.get("p", "c", "us", "/sa.json") is not first
+    assert factory.call_count == 3
+    factory.assert_any_call("p", "c", "us", "/sa.json")
+
+
+def test_get_creates_one_client_under_concurrency(factory):
+    """Concurrent first calls share a single client."""
+    pool = ChronicleClientPool(factory, refresh_interval=0)
+    clients = []
+    threads = [
+        threading.Thread(target=lambda: clients.append(pool.get("p", "c", "us")))
+        for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert factory.call_count == 1
+    assert all(client is clients[0] for client in clients)
+
+
+def test_refresh_tokens_only_refreshes_expiring_credentials():
+    """Only tokens expiring within the refresh margin are refreshed."""
+    fresh = make_client(expiry_seconds=3600)
+    expiring = make_client(expiry_seconds=60)
+    clients = iter([fresh, expiring])
+    pool = ChronicleClientPool(
+        lambda *args: next(clients), refresh_interval=0, refresh_margin=300
+    )
+    pool.get("p", "c", "us")
+    pool.get("p", "c", "eu")
+
+    with patch("google.auth.transport.requests.Request"):
+        pool.refresh_tokens()
+
+    fresh.session.credentials.refresh.assert_not_called()
+    expiring.session.credentials.refresh.assert_called_once()
+
+
+def test_close_closes_sessions_and_clears_pool(factory):
+    """close() closes every session and later calls create new clients."""
+    pool = ChronicleClientPool(factory, refresh_interval=3600)
+    client = pool.get("p", "c", "us")
+
+    pool.close()
+
+    client.session.close.assert_called_once()
+    assert pool.get("p", "c", "us") is not client
+    pool.close()
@@ -0,0 +1,177 @@
+"""Unit tests for streaming UDM CSV exports to a file."""
+
+import sys
+import os
+import gzip
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Ensure server/secops is in path to import secops_mcp
+current_dir = os.path.dirname(os.path.abspath(__file__))
+server_secops_dir = os.path.dirname(current_dir)
+if server_secops_dir not in sys.path:
+    sys.path.append(server_secops_dir)
+
+from secops_mcp.tools.udm_search import export_udm_search_csv_to_file
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+HEADER = "metadata.event_timestamp,principal.ip"
+
+
+def fetch_csv(query, start_time, end_time, fields, case_insensitive):
+    """Returns one row per minute of the requested window."""
+    minutes = int((end_time - start_time).total_seconds() // 60)
+    rows = [
+        f"{(start_time + timedelta(minutes=i)).isoformat()},10.0.0.{i % 255}"
+        for i in range(minutes)
+    ]
+    return {"csv": {"row": [HEADER] + rows}}
+
+
+@pytest.fixture
+def chronicle(tmp_path, monkeypatch):
+    monkeypatch.setenv("SECOPS_EXPORT_DIR", str(tmp_path))
+    chronicle = MagicMock()
+    chronicle.fetch_udm_search_csv.side_effect = fetch_csv
+    with patch(
+        "secops_mcp.tools.udm_search.get_chronicle_client", return_value=chronicle
+    ):
+        yield chronicle
+
+
+@pytest.mark.asyncio
+async def test_export_writes_rows_in_order(chronicle, tmp_path):
+    """Sub-window rows are appended in time order below a single header."""
+    result = await export_udm_search_csv_to_file(
+        query="q",
+        fields=HEADER.split(","),
+        start_time=START.isoformat(),
+        end_time=(START + timedelta(hours=10)).isoformat(),
+        shards=10,
+        file_name="logins",
+    )
+
+    assert result["path"] == str(tmp_path / "logins.csv")
+    assert result["rows"] == 600
+    assert result["shards"] == 10
+    assert result["errors"] == []
+    assert chronicle.fetch_udm_search_csv.call_count == 10
+    with open(result["path"]) as f:
+        lines = f.read().splitlines()
+    assert result["bytes"] == os.path.getsize(result["path"])
+    assert lines[0] == HEADER
+    assert len(lines) == 601
+    assert lines[1:] == sorted(lines[1:])
+
+
+@pytest.mark.asyncio
+async def test_export_gzip_and_partial_failure(chronicle, tmp_path):
+    """Failed sub-windows are reported and the rest is still written."""
+
+    def flaky(query, start_time, end_time, fields, case_insensitive):
+        if start_time == START:
+            raise RuntimeError("quota exceeded")
+        return fetch_csv(query, start_time, end_time, fields, case_insensitive)
+
+    chronicle.fetch_udm_search_csv.side_effect = flaky
+    result = await export_udm_search_csv_to_file(
+        query="q",
+        fields=HEADER.split(","),
+        start_time=START.isoformat(),
+        end_time=(START + timedelta(hours=4)).isoformat(),
+        shards=4,
+        compress=True,
+        file_name="../escape",
+    )
+
+    assert result["path"] == str(tmp_path / "escape.csv.gz")
+    assert result["rows"] == 180
+    assert len(result["errors"]) == 1
+    assert "quota exceeded" in result["errors"][0]
+    with gzip.open(result["path"], "rt") as f:
+        assert f.read().splitlines()[0] == HEADER
+    assert not os.path.exists(result["path"] + ".part")
+
+
+@pytest.mark.asyncio
+async def test_export_keeps_existing_files_unless_overwrite(chronicle, tmp_path):
+    """A file_name that is already taken fails the export unless overwrite is set."""
+    existing = tmp_path / "logins.csv"
+    existing.write_text("earlier export\n")
+    kwargs = dict(
+        query="q",
+        fields=HEADER.split(","),
+        start_time=START.isoformat(),
+        end_time=(START + timedelta(hours=2)).isoformat(),
+        shards=2,
+        file_name="logins",
+    )
+
+    result = await export_udm_search_csv_to_file(**kwargs)
+    assert "already exists" in result["error"]
+    assert existing.read_text() == "earlier export\n"
+    chronicle.fetch_udm_search_csv.assert_not_called()
+
+    result = await export_udm_search_csv_to_file(overwrite=True, **kwargs)
+    assert result["rows"] == 120
+    assert existing.read_text().splitlines()[0] == HEADER
+
+
+@pytest.mark.asyncio
+async def test_failed_export_leaves_no_files(chronicle, tmp_path):
+    """A failed export removes the file it generated a name for."""
+    chronicle.fetch_udm_search_csv.side_effect = RuntimeError("quota exceeded")
+    result = await export_udm_search_csv_to_file(
+        query="q",
+        fields=HEADER.split(","),
+        start_time=START.isoformat(),
+        end_time=(START + timedelta(hours=2)).isoformat(),
+        shards=2,
+    )
+
+    assert "quota exceeded" in result["error"]
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_windows_at_the_row_limit_are_split(chronicle, tmp_path):
+    """A window that returns EXPORT_ROW_LIMIT rows is exported again in halves."""
+    with patch("secops_mcp.tools.udm_search.EXPORT_ROW_LIMIT", 60):
+        result = await export_udm_search_csv_to_file(
+            query="q",
+            fields=HEADER.split(","),
+            start_time=START.isoformat(),
+            end_time=(START + timedelta(hours=2)).isoformat(),
+            shards=1,
+            file_name="split",
+        )
+
+    assert result["rows"] == 120
+    assert result["truncated"] is False
+    assert result["errors"] == []
+    # The 2 hour window, its 1 hour halves, and their 30 minute halves.
+    assert chronicle.fetch_udm_search_csv.call_count == 7
+    with open(result["path"]) as f:
+        lines = f.read().splitlines()
+    assert lines[0] == HEADER
+    assert lines[1:] == sorted(lines[1:])
+
+
+@pytest.mark.asyncio
+async def test_one_minute_windows_at_the_row_limit_are_reported(chronicle, tmp_path):
+    """A window that cannot be split further is written and reported as truncated."""
+    with patch("secops_mcp.tools.udm_search.EXPORT_ROW_LIMIT", 1):
+        result = await export_udm_search_csv_to_file(
+            query="q",
+            fields=HEADER.split(","),
+            start_time=START.isoformat(),
+            end_time=(START + timedelta(minutes=1)).isoformat(),
+            shards=1,
+            file_name="capped",
+        )
+
+    assert result["rows"] == 1
+    assert result["truncated"] is True
+    assert "export limit of 1 rows" in result["errors"][0]
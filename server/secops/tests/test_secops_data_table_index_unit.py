@@ -0,0 +1,120 @@
+"""Unit tests for indexed data table lookups."""
+
+import sys
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Ensure server/secops is in path to import secops_mcp
+current_dir = os.path.dirname(os.path.abspath(__file__))
+server_secops_dir = os.path.dirname(current_dir)
+if server_secops_dir not in sys.path:
+    sys.path.append(server_secops_dir)
+
+from secops_mcp.data_table_index import DataTableCache, DataTableIndex
+from secops_mcp.tools.data_table_management import lookup_data_table_rows
+
+
+def make_rows(values):
+    return [
+        {"name": f"dataTables/t/dataTableRows/r{i}", "values": row}
+        for i, row in enumerate(values)
+    ]
+
+
+INDEX = DataTableIndex(
+    ["network", "host", "owner"],
+    make_rows(
+        [
+            ["10.0.0.0/8", "Web-01", "alice"],
+            ["10.1.0.0/16", "web-02", "bob"],
+            ["10.1.2.3", "db-01", "carol"],
+            ["192.168.0.0/24", "web-10", "dave"],
+            ["2001:db8::/32", "WEB-03", "erin"],
+            ["not-a-network", "db-02", "frank"],
+        ]
+    ),
+)
+
+
+@pytest.mark.parametrize(
+    "column, value, match, case_insensitive, expected",
+    [
+        ("host", "web-02", "exact", False, [1]),
+        ("host", "web-01", "exact", False, []),
+        ("host", "web-01", "exact", True, [0]),
+        ("host", "web-0", "prefix", False, [1]),
+        ("host", "web-", "prefix", True, [0, 1, 3, 4]),
+        ("network", "10.1.2.3", "cidr", False, [0, 1, 2]),
+        ("network", "10.1.9.0/24", "cidr", False, [0, 1]),
+        ("network", "2001:db8::1", "cidr", False, [4]),
+        ("network", "10.1.0.0/16", "in_cidr", False, [2]),
+        ("network", "172.16.0.1", "cidr", False, []),
+    ],
+)
+def test_lookup(column, value, match, case_insensitive, expected):
+    """Each match type returns matching row positions in row order."""
+    assert INDEX.lookup(column, value, match, case_insensitive) == expected
+
+
+def test_lookup_errors():
+    """Unknown columns, match types and bad cidr values raise."""
+    with pytest.raises(KeyError):
+        INDEX.lookup("site", "x")
+    with pytest.raises(ValueError):
+        INDEX.lookup("host", "x", "regex")
+    with pytest.raises(ValueError):
+        INDEX.lookup("network", "web", "cidr")
+    assert INDEX.row(2) == {
+        "row_id": "r2",
+        "values": {"network": "10.1.2.3", "host": "db-01", "owner": "carol"},
+    }
+
+
+@pytest.fixture
+def chronicle():
+    chronicle = MagicMock()
+    chronicle.instance_id = "projects/p/locations/us/instances/c"
+    chronicle.get_data_table.return_value = {
+        "updateTime": "v1",
+        "columnInfo": [
+            {"columnIndex": 0, "originalColumn": "host"},
+            {"columnIndex": 1, "originalColumn": "owner"},
+        ],
+    }
+    chronicle.list_data_table_rows.return_value = make_rows(
+        [[f"host-{i}", f"user-{i % 3}"] for i in range(100)]
+    )
+    with patch(
+        "secops_mcp.tools.data_table_management.get_chronicle_client", return_value=chronicle
+    ), patch(
+        "secops_mcp.tools.data_table_management.data_table_cache", DataTableCache()
+    ):
+        yield chronicle
+
+
+@pytest.mark.asyncio
+async def test_lookup_tool_caches_until_version_changes(chronicle):
+    """The table is listed once per version; results are capped by max_rows."""
+    first = await lookup_data_table_rows("assets", "owner", "user-1", max_rows=2)
+    assert first["total_matches"] == 33
+    assert first["rows"] == [
+        {"row_id": "r1", "values": {"host": "host-1", "owner": "user-1"}},
+        {"row_id": "r4", "values": {"host": "host-4", "owner": "user-1"}},
+    ]
+    assert first["cached"] is False
+
+    second = await lookup_data_table_rows("assets", "host", "host-9", match="prefix")
+    assert second["total_matches"] == 11 and second["cached"] is True
+    assert chronicle.list_data_table_rows.call_count == 1
+
+    chronicle.get_data_table.return_value = dict(
+        chronicle.get_data_table.return_value, updateTime="v2"
+    )
+    third = await lookup_data_table_rows("assets", "host", "host-9")
+    assert third["cached"] is False and third["version"] == "v2"
+    assert chronicle.list_data_table_rows.call_count == 2
+
+    error = await lookup_data_table_rows("assets", "site", "x")
+    assert "Unknown column 'site'" in error["error"]
@@ -0,0 +1,153 @@
+"""Unit tests for incremental data table sync."""
+
+import sys
+import os
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Ensure server/secops is in path to import secops_mcp
+current_dir = os.path.dirname(os.path.abspath(__file__))
+server_secops_dir = os.path.dirname(current_dir)
+if server_secops_dir not in sys.path:
+    sys.path.append(server_secops_dir)
+
+from secops_mcp.data_table_sync import insert_chunks, iter_file_rows
+from secops_mcp.tools.data_table_management import sync_data_table_from_file
+
+DATA_TABLE = {
+    "name": "projects/p/locations/us/instances/c/dataTables/assets",
+    "columnInfo": [
+        {"columnIndex": 1, "originalColumn": "owner", "columnType": "STRING"},
+        {"columnIndex": 0, "originalColumn": "host", "columnType": "STRING"},
+    ],
+}
+
+
+def table_row(row_id, host, owner):
+    return {"name": f"{DATA_TABLE['name']}/dataTableRows/{row_id}", "values": [host, owner]}
+
+
+def test_iter_file_rows_maps_columns(tmp_path):
+    """CSV headers and NDJSON keys are mapped to the table's column order."""
+    csv_file = tmp_path / "rows.csv"
+    csv_file.write_text("owner,host\nalice, web-1 \n\nbob,db-1\n")
+    ndjson_file = tmp_path / "rows.ndjson"
+    ndjson_file.write_text('{"host": "web-1", "owner": "alice"}\n\n["db-1", true]\n')
+
+    assert list(iter_file_rows(str(csv_file), ["host", "owner"])) == [
+        ["web-1", "alice"],
+        ["db-1", "bob"],
+    ]
+    assert list(iter_file_rows(str(ndjson_file), ["host", "owner"], "ndjson")) == [
+        ["web-1", "alice"],
+        ["db-1", "true"],
+    ]
+    with pytest.raises(ValueError, match="does not match"):
+        list(iter_file_rows(str(csv_file), ["host", "site"]))
+
+
+def test_insert_chunks_respects_limits():
+    """Insert chunks stay within the row and size limits."""
+    rows = [["x" * 100]] * 25
+
+    assert [len(c) for c in insert_chunks(rows, max_rows=10)] == [10, 10, 5]
+    assert [len(c) for c in insert_chunks(rows, max_bytes=600)] == [4] * 6 + [1]
+
+
+@pytest.fixture
+def chronicle(tmp_path, monkeypatch):
+    monkeypatch.setenv("SECOPS_IMPORT_DIR", str(tmp_path))
+    chronicle = MagicMock()
+    chronicle.get_data_table.return_value = DATA_TABLE
+    chronicle.list_data_table_rows.return_value = [
+        table_row("r1", "web-1", "alice"),
+        table_row("r2", "web-2", "alice"),
+        table_row("r3", "db-1", "bob"),
+        table_row("r4", "db-1", "bob"),
+    ]
+    with patch(
+        "secops_mcp.tools.data_table_management.get_chronicle_client", return_value=chronicle
+    ):
+        yield chronicle
+
+
+@pytest.mark.asyncio
+async def test_sync_sends_only_the_difference(chronicle, tmp_path):
+    """Unchanged rows are left alone; only inserts and deletes are sent."""
+    path = tmp_path / "assets.csv"
+    path.write_text("host,owner\nweb-1,alice\ndb-1,bob\nweb-2,carol\nweb-3,dave\n")
+
+    preview = await sync_data_table_from_file("assets", "assets.csv", dry_run=True)
+    assert preview["to_insert"] == 2 and preview["to_delete"] == 2
+    assert preview["unchanged"] == 2
+    chronicle.create_data_table_rows.assert_not_called()
+
+    result = await sync_data_table_from_file("assets", str(path))
+
+    assert result["inserted"] == 2 and result["deleted"] == 2
+    assert result["errors"] == []
+    chronicle.create_data_table_rows.assert_called_once_with(
+        "assets", [["web-2", "carol"], ["web-3", "dave"]]
+    )
+    deleted = chronicle.delete_data_table_rows.call_args.args[1]
+    assert sorted(deleted) == ["r2", "r4"]
+
+
+@pytest.mark.asyncio
+async def test_sync_large_file_in_parallel_chunks(chronicle, tmp_path):
+    """Large inserts are chunked and failed chunks are reported."""
+    path = tmp_path / "assets.ndjson"
+    with open(path, "w") as f:
+        for i in range(2500):
+            f.write(json.dumps({"host": f"h{i}", "owner": "x"}) + "\n")
+    calls = []
+
+    def create_rows(name, rows):
+        calls.append(len(rows))
+        if rows[0] == ["h1000", "x"]:
+            raise RuntimeError("429 quota")
+        return [{}]
+
+    chronicle.create_data_table_rows.side_effect = create_rows
+
+    result = await sync_data_table_from_file("assets", str(path), max_concurrency=3)
+
+    assert sorted(calls) == [500, 1000, 1000]
+    assert result["inserted"] == 1500
+    assert result["deleted"] == 4
+    assert "429 quota" in result["errors"][0]
+
+
+@pytest.mark.asyncio
+async def test_sync_inserts_before_deleting_off_the_event_loop(chronicle, tmp_path):
+    """Rows are inserted before stale rows are deleted; the file is read in threads."""
+    (tmp_path / "assets.csv").write_text("host,owner\nweb-1,alice\nweb-3,dave\n")
+    loop_thread = threading.get_ident()
+    readers = set()
+    calls = []
+    chronicle.create_data_table_rows.side_effect = lambda name, rows: calls.append("insert")
+    chronicle.delete_data_table_rows.side_effect = lambda name, ids: calls.append("delete")
+
+    def read_rows(*args):
+        for values in iter_file_rows(*args):
+            readers.add(threading.get_ident())
+            yield values
+
+    with patch("secops_mcp.tools.data_table_management.iter_file_rows", read_rows):
+        result = await sync_data_table_from_file("assets", "assets.csv")
+
+    assert result["inserted"] == 1 and result["deleted"] == 3
+    assert calls == ["insert", "delete"]
+    assert readers and loop_thread not in readers
+
+
+@pytest.mark.asyncio
+async def test_sync_only_reads_files_in_the_import_directory(chronicle, tmp_path):
+    """Paths that resolve outside SECOPS_IMPORT_DIR are refused."""
+    for file_path in ["/etc/passwd", "../outside.csv"]:
+        result = await sync_data_table_from_file("assets", file_path)
+        assert "SECOPS_IMPORT_DIR" in result["error"]
+    chronicle.get_data_table.assert_not_called()
@@ -0,0 +1,155 @@
+"""Unit tests for batch entity lookup."""
+
+import sys
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Ensure server/secops is in path to import secops_mcp
+current_dir = os.path.dirname(os.path.abspath(__file__))
+server_secops_dir = os.path.dirname(current_dir)
+if server_secops_dir not in sys.path:
+    sys.path.append(server_secops_dir)
+
+from secops_mcp.entity_cache import EntitySummaryCache, normalize_indicator
+from secops_mcp.tools.entity_lookup import lookup_entities
+
+SEEN = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_summary(entity_type):
+    return SimpleNamespace(
+        primary_entity=SimpleNamespace(
+            metadata=SimpleNamespace(entity_type=entity_type),
+            metric=SimpleNamespace(first_seen=SEEN, last_seen=SEEN),
+        ),
+        related_entities=[
+            SimpleNamespace(metadata=SimpleNamespace(entity_type="ASSET")),
+            SimpleNamespace(metadata=SimpleNamespace(entity_type="ASSET")),
+        ],
+        alert_counts=[SimpleNamespace(rule="Suspicious Login", count=3)],
+        has_more_alerts=False,
+        timeline=SimpleNamespace(
+            buckets=[
+                SimpleNamespace(event_count=10, alert_count=1),
+                SimpleNamespace(event_count=5, alert_count=2),
+            ]
+        ),
+        prevalence=None,
+    )
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (" 198.51.100[.]10 ", ("198.51.100.10", "ip")),
+        ("2001:DB8::0001", ("2001:db8::1", "ip")),
+        ("EVIL[.]Example.com.", ("evil.example.com", "domain")),
+        ("D41D8CD98F00B204E9800998ECF8427E", ("d41d8cd98f00b204e9800998ecf8427e", "md5")),
+        ("hxxps://evil.example.com/Path", ("https://evil.example.com/Path", "url")),
+        ("Bob[@]Example.com", ("bob@example.com", "email")),
+        ("'DOMAIN\\Alice'", ("DOMAIN\\Alice", "other")),
+    ],
+)
+def test_normalize_indicator(raw, expected):
+    """Indicators are refanged, trimmed and lowercased by kind."""
+    assert normalize_indicator(raw) == expected
+
+
+@pytest.fixture
+def chronicle():
+    chronicle = MagicMock()
+    chronicle.instance_id = "projects/p/locations/us/instances/c"
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def summarize_entity(value, start_time, end_time):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        if value == "fail.example.com":
+            raise RuntimeError("backend error")
+        if value == "unknown.example.com":
+            return SimpleNamespace(primary_entity=None)
+        return make_summary("IP_ADDRESS" if value[0].isdigit() else "DOMAIN_NAME")
+
+    chronicle.summarize_entity.side_effect = summarize_entity
+    chronicle.active = active
+    with patch(
+        "secops_mcp.tools.entity_lookup.get_chronicle_client", return_value=chronicle
+    ), patch(
+        "secops_mcp.tools.entity_lookup.entity_summary_cache", EntitySummaryCache()
+    ):
+        yield chronicle
+
+
+@pytest.mark.asyncio
+async def test_lookup_entities_dedupes_and_structures(chronicle):
+    """Duplicate spellings are looked up once and records are structured."""
+    result = await lookup_entities(
+        entity_values=[
+            "198.51.100.10",
+            "198.51.100[.]10",
+            "evil.example.com",
+            "unknown.example.com",
+            "fail.example.com",
+            "  ",
+        ],
+    )
+
+    assert result["requested"] == 6
+    assert result["distinct"] == 4
+    assert result["found"] == 2
+    assert result["failed"] == 1
+    assert chronicle.summarize_entity.call_count == 4
+
+    ip = result["entities"][0]
+    assert ip["value"] == "198.51.100.10"
+    assert ip["inputs"] == ["198.51.100.10", "198.51.100[.]10"]
+    assert ip["entity_type"] == "IP_ADDRESS"
+    assert ip["first_seen"] == SEEN.isoformat()
+    assert ip["related_entity_types"] == {"ASSET": 2}
+    assert ip["alerts"] == [{"rule": "Suspicious Login", "count": 3}]
+    assert ip["event_count"] == 15 and ip["alert_count"] == 3
+    assert result["entities"][2] == {
+        "value": "unknown.example.com",
+        "kind": "domain",
+        "inputs": ["unknown.example.com"],
+        "found": False,
+        "cached": False,
+    }
+    assert "backend error" in result["entities"][3]["error"]
+
+
+@pytest.mark.asyncio
+async def test_lookup_entities_caps_concurrency_and_caches(chronicle):
+    """Lookups respect max_concurrency and repeated values hit the cache."""
+    values = [f"10.0.0.{i}" for i in range(12)]
+
+    await lookup_entities(entity_values=values, max_concurrency=3)
+    assert chronicle.active["peak"] <= 3
+    assert chronicle.summarize_entity.call_count == 12
+
+    again = await lookup_entities(entity_values=values[:4] + ["10.0.0.100"])
+    assert chronicle.summarize_entity.call_count == 13
+    assert [record["cached"] for record in again["entities"]] == [True] * 4 + [False]
+
+    await lookup_entities(entity_values=values[:2], bypass_cache=True)
+    assert chronicle.summarize_entity.call_count == 15
+
+
+@pytest.mark.asyncio
+async def test_lookup_entities_rejects_oversized_batches(chronicle):
+    """Batches over the limit are rejected without lookups."""
+    result = await lookup_entities(entity_values=["1.1.1.1"] * 501)
+
+    assert "At most 500" in result["error"]
+    chronicle.summarize_entity.assert_not_called()
@@ -0,0 +1,139 @@
+"""Unit tests for UDM event field projection and compact encoding."""
+
+import sys
+import os
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Ensure server/secops is in path to import secops_mcp
+current_dir = os.path.dirname(os.path.abspath(__file__))
+server_secops_dir = os.path.dirname(current_dir)
+if server_secops_dir not in sys.path:
+    sys.path.append(server_secops_dir)
+
+from secops_mcp.event_projection import project_events, shape_events, to_table
+from secops_mcp.result_cache import UdmResultCache
+from secops_mcp.tools.security_events import search_security_events
+from secops_mcp.translation_cache import TranslationCache
+
+
+def make_event(i):
+    return {
+        "name": f"events/{i}",
+        "udm": {
+            "metadata": {
+                "eventTimestamp": f"2024-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}Z",
+                "eventType": "NETWORK_CONNECTION",
+                "productName": "Firewall",
+                "vendorName": "Example",
+                "logType": "FIREWALL",
+                "ingestedTimestamp": "2024-01-01T00:05:00Z",
+                "baseLabels": {"logTypes": ["FIREWALL"], "allowScopedAccess": True},
+            },
+            "principal": {
+                "ip": [f"10.0.{i // 256 % 256}.{i % 256}"],
+                "port": 50000 + i % 1000,
+                "hostname": f"host-{i % 50}",
+                "asset": {"ip": [f"10.0.{i // 256 % 256}.{i % 256}"], "hostname": f"host-{i % 50}"},
+            },
+            "target": {
+                "ip": ["192.0.2.10"],
+                "port": 443,
+                "location": {"countryOrRegion": "US", "regionLatitude": 37.7, "regionLongitude": -122.4},
+            },
+            "network": {
+                "ipProtocol": "TCP",
+                "sentBytes": "1200",
+                "receivedBytes": "5400",
+                "sessionDuration": "1.5s",
+            },
+            "securityResult": [
+                {"action": ["ALLOW"], "ruleName": "allow-outbound-https", "severity": "INFORMATIONAL"}
+            ],
+            "additional": {"fields": {f"key{k}": f"value{k}" for k in range(10)}},
+        },
+    }
+
+
+def test_project_events_keeps_selected_paths():
+    """Projection keeps selected paths, including inside repeated messages."""
+    [event] = project_events(
+        [make_event(1)],
+        ["principal.ip", "udm.security_result.action", "target.location"],
+    )
+
+    assert event == {
+        "name": "events/1",
+        "udm": {
+            "principal": {"ip": ["10.0.0.1"]},
+            "securityResult": [{"action": ["ALLOW"]}],
+            "target": {
+                "location": {
+                    "countryOrRegion": "US",
+                    "regionLatitude": 37.7,
+                    "regionLongitude": -122.4,
+                }
+            },
+        },
+    }
+
+
+def test_to_table_expands_messages_and_fills_missing():
+    """Table columns follow fields; whole messages expand to their paths."""
+    table = to_table(
+        [make_event(1), {"name": "events/x", "udm": {}}],
+        ["metadata.event_type", "target.location", "principal.user.userid"],
+    )
+
+    assert table["columns"] == [
+        "name",
+        "metadata.event_type",
+        "target.location.country_or_region",
+        "target.location.region_latitude",
+        "target.location.region_longitude",
+        "principal.user.userid",
+    ]
+    assert table["rows"][0] == ["events/1", "NETWORK_CONNECTION", "US", 37.7, -122.4, None]
+    assert table["rows"][1] == ["events/x", None, None, None, None, None]
+
+
+def test_compact_projection_shrinks_payload_tenfold():
+    """A projected, compact 1,000-event result is over 10x smaller."""
+    result = {"events": [make_event(i) for i in range(1000)], "total_events": 1000}
+    fields = ["metadata.event_timestamp", "principal.ip", "target.ip", "security_result.action"]
+
+    shaped = shape_events(result, fields, compact=True)
+
+    assert "events" not in shaped
+    assert shaped["total_events"] == 1000
+    assert len(shaped["rows"]) == 1000
+    assert len(json.dumps(result)) > 10 * len(json.dumps(shaped))
+    assert shape_events(result, None, compact=False) is result
+
+
+@pytest.mark.asyncio
+async def test_search_security_events_applies_fields():
+    """search_security_events projects events when fields are given."""
+    chronicle = MagicMock()
+    chronicle.translate_nl_to_udm.return_value = "metadata.event_type = 'NETWORK_CONNECTION'"
+    chronicle.search_udm.return_value = {
+        "events": [make_event(i) for i in range(3)],
+        "total_events": 3,
+    }
+
+    with patch(
+        "secops_mcp.tools.security_events.get_chronicle_client", return_value=chronicle
+    ), patch(
+        "secops_mcp.tools.security_events.translation_cache", TranslationCache()
+    ), patch(
+        "secops_mcp.result_cache.udm_result_cache", UdmResultCache(ttl=0)
+    ):
+        result = await search_security_events(
+            text="connections", fields=["principal.hostname"], compact=True
+        )
+
+    assert result["events"]["columns"] == ["name", "principal.hostname"]
+    assert result["events"]["rows"][2] == ["events/2", "host-2"]
+    assert result["events"]["total_events"] == 3
@@ -0,0 +1,202 @@
+"""Unit tests for file-tailing ingestion with checkpoints."""
+
+import sys
+import os
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Ensure server/secops is in path to import secops_mcp
+current_dir = os.path.dirname(os.path.abspath(__file__))
+server_secops_dir = os.path.dirname(current_dir)
+if server_secops_dir not in sys.path:
+    sys.path.append(server_secops_dir)
+
+from secops_mcp.file_tailer import TailCheckpoint, tail_files
+from secops_mcp.tools.log_ingestion import tail_log_files
+
+
+class Recorder:
+    """Collects submitted lines; fails batches containing `fail_on`."""
+
+    def __init__(self, fail_on=None):
+        self.lines = []
+        self.fail_on = fail_on
+
+    async def __call__(self, batch):
+        if self.fail_on in batch:
+            raise RuntimeError("503 unavailable")
+        self.lines.extend(batch)
+        return {"operation": "operations/1"}
+
+
+async def run(paths, checkpoint_path, submit, **kwargs):
+    kwargs.setdefault("retry_delay", 0)
+    return await tail_files(submit, paths, TailCheckpoint(checkpoint_path), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_resumes_from_checkpoint_after_restart(tmp_path):
+    """Only complete lines are read, and a new run resumes after them."""
+    log = tmp_path / "logs" / "app.log"
+    log.parent.mkdir()
+    checkpoint = str(tmp_path / "state" / "checkpoint.json")
+    log.write_text("a1\na2\n\na3\npartial")
+
+    first = Recorder()
+    report = await run([str(log)], checkpoint, first, max_entries=2)
+    assert first.lines == ["a1", "a2", "a3"]
+    assert report["entries"] == 3 and report["batches"] == 2
+
+    with open(log, "a") as f:
+        f.write(" line\na4\n")
+    second = Recorder()
+    report = await run([str(log)], checkpoint, second)
+    assert second.lines == ["partial line", "a4"]
+
+    third = Recorder()
+    await run([str(log)], checkpoint, third)
+    assert third.lines == []
+
+
+@pytest.mark.asyncio
+async def test_follows_rotation_and_truncation(tmp_path):
+    """A rotated file is finished under its new name; truncation restarts."""
+    log = tmp_path / "app.log"
+    checkpoint = str(tmp_path / "checkpoint.json")
+    log.write_text("old1\nold2\n")
+    await run([str(log)], checkpoint, Recorder())
+
+    with open(log, "a") as f:
+        f.write("old3\nold4")
+    os.rename(log, tmp_path / "app.log.1")
+    log.write_text("new1\n")
+
+    recorder = Recorder()
+    await run([str(log)], checkpoint, recorder)
+    assert recorder.lines == ["old3", "old4", "new1"]
+
+    log.write_text("n1\n")
+    recorder = Recorder()
+    await run([str(log)], checkpoint, recorder)
+    assert recorder.lines == ["n1"]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_holds_checkpoint(tmp_path):
+    """The checkpoint never passes a failed batch, so it is sent again."""
+    log = tmp_path / "app.log"
+    checkpoint = str(tmp_path / "checkpoint.json")
+    log.write_text("".join(f"line{i}\n" for i in range(6)))
+
+    failing = Recorder(fail_on="line2")
+    report = await run([str(log)], checkpoint, failing, max_entries=2, max_retries=0, concurrency=1)
+    assert failing.lines == ["line0", "line1", "line4", "line5"]
+    assert report["failed_entries"] == 2
+
+    with open(checkpoint) as f:
+        assert list(json.load(f).values())[0]["offset"] == len("line0\nline1\n")
+
+    recorder = Recorder()
+    await run([str(log)], checkpoint, recorder)
+    assert recorder.lines == ["line2", "line3", "line4", "line5"]
+
+
+@pytest.mark.asyncio
+async def test_following_sends_each_line_once_past_failures(tmp_path):
+    """Rejected batches are skipped; a file with a failed batch is not polled again."""
+    rejected = tmp_path / "rejected.log"
+    failing = tmp_path / "failing.log"
+    rejected.write_text("ok1\nBAD\nok2\nok3\n")
+    failing.write_text("f1\nDOWN\nf2\n")
+    submitted = []
+
+    async def submit(batch):
+        submitted.extend(batch)
+        if "BAD" in batch:
+            raise ValueError("invalid log entry")
+        if "DOWN" in batch:
+            raise RuntimeError("503 unavailable")
+        return {}
+
+    checkpoint = str(tmp_path / "checkpoint.json")
+    report = await run(
+        [str(rejected), str(failing)], checkpoint, submit,
+        max_entries=1, max_retries=0, follow_seconds=3.5, poll_interval=1,
+    )
+
+    assert sorted(submitted) == sorted(["ok1", "BAD", "ok2", "ok3", "f1", "DOWN", "f2"])
+    assert report["failed_batches"] == 2
+    assert any("skipped the rejected batch" in error for error in report["errors"])
+
+    recorder = Recorder()
+    await run([str(rejected), str(failing)], checkpoint, recorder)
+    assert recorder.lines == ["DOWN", "f2"]
+
+
+@pytest.mark.asyncio
+async def test_directory_udm_lines(tmp_path):
+    """Directory files matching the pattern are read; bad UDM lines are rejected."""
+    (tmp_path / "a.ndjson").write_text('{"metadata": {}}\nnot json\n')
+    (tmp_path / "b.txt").write_text('{"metadata": {}}\n')
+
+    recorder = Recorder()
+    report = await run(
+        [str(tmp_path)], str(tmp_path / "checkpoint.json"), recorder, pattern="*.ndjson", udm=True
+    )
+
+    assert recorder.lines == ['{"metadata": {}}']
+    assert report["rejected_entries"] == 1
+    assert report["files"] == [str(tmp_path / "a.ndjson")]
+
+
+@pytest.mark.asyncio
+async def test_tail_log_files_tool(tmp_path, monkeypatch):
+    """The tool sends raw log batches through one resolved forwarder."""
+    log = tmp_path / "app.log"
+    log.write_text("".join(f"line{i}\n" for i in range(5)))
+    monkeypatch.setenv("SECOPS_TAIL_CHECKPOINT_PATH", str(tmp_path / "checkpoint.json"))
+    monkeypatch.setenv("SECOPS_TAIL_ROOT", str(tmp_path))
+    chronicle = MagicMock()
+    chronicle.get_or_create_forwarder.return_value = {"name": "forwarders/f"}
+    chronicle.ingest_log.return_value = {"operation": "operations/1"}
+
+    with patch(
+        "secops_mcp.tools.log_ingestion.get_chronicle_client", return_value=chronicle
+    ):
+        result = await tail_log_files(paths=[str(log)], log_type="OKTA")
+        outside = await tail_log_files(paths=["/etc/hosts"], log_type="OKTA")
+        monkeypatch.delenv("SECOPS_TAIL_ROOT")
+        disabled = await tail_log_files(paths=[str(log)], log_type="OKTA")
+
+    assert result["entries"] == 5
+    chronicle.ingest_log.assert_called_once_with(
+        log_message=[f"line{i}" for i in range(5)], log_type="OKTA", forwarder_id="forwarders/f"
+    )
+    assert "outside SECOPS_TAIL_ROOT" in outside["error"]
+    assert "set SECOPS_TAIL_ROOT" in disabled["error"]
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_saves_are_throttled_and_off_the_event_loop(tmp_path):
+    """Offsets are saved in a thread, per interval and once at the end."""
+    log = tmp_path / "app.log"
+    log.write_text("".join(f"line{i}\n" for i in range(20)))
+    checkpoint = TailCheckpoint(str(tmp_path / "checkpoint.json"))
+    loop_thread = threading.get_ident()
+    savers = []
+    save = checkpoint.save
+
+    def record_save():
+        savers.append(threading.get_ident())
+        save()
+
+    checkpoint.save = record_save
+    report = await tail_files(Recorder(), [str(log)], checkpoint, max_entries=1, save_interval=60)
+
+    assert report["batches"] == 20
+    assert len(savers) == 1 and savers[0] != loop_thread
+    with open(tmp_path / "checkpoint.json") as f:
+        assert list(json.load(f).values())[0]["offset"] == log.stat().st_size
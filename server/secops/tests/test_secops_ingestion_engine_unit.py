@@ -0,0 +1,241 @@
+"""Unit tests for batched raw log ingestion."""
+
+import sys
+import os
+import asyncio
+import base64
+import gzip
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from secops.exceptions import APIError
+
+# Ensure server/secops is in path to import secops_mcp
+current_dir = os.path.dirname(os.path.abspath(__file__))
+server_secops_dir = os.path.dirname(current_dir)
+if server_secops_dir not in sys.path:
+    sys.path.append(server_secops_dir)
+
+from secops_mcp.ingestion_engine import (
+    decompress_entries,
+    encoded_size,
+    entry_overhead,
+    ingest_batches,
+    is_retryable,
+    iter_batches,
+    submit_batches,
+)
+from secops_mcp.tools.log_ingestion import ingest_raw_log
+
+
+def test_iter_batches_respects_bytes_and_count():
+    """Batches stay within both limits; oversized entries are set aside."""
+    entries = ["x" * 300] * 10 + ["y" * 5000, "", "z"]
+    rejected = []
+    limit = 3 * encoded_size("x" * 300)
+
+    batches = list(iter_batches(entries, max_bytes=limit, max_entries=2, oversized=rejected.append))
+
+    assert [len(batch) for batch in batches] == [2, 2, 2, 2, 2, 1]
+    assert batches[-1] == ["z"]
+    assert rejected == ["y" * 5000]
+
+    batches = list(iter_batches(entries[:10], max_bytes=limit, max_entries=100))
+    assert [len(batch) for batch in batches] == [3, 3, 3, 1]
+
+
+def test_entry_overhead_counts_labels():
+    """Labels are repeated on every entry and count toward its size."""
+    assert entry_overhead({"env": "prod"}) > entry_overhead()
+
+
+@pytest.mark.asyncio
+async def test_ingest_batches_retries_failed_batches():
+    """Only failed batches are retried, with bounded concurrency."""
+    attempts = {}
+    active = {"now": 0, "peak": 0}
+
+    async def submit(batch):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.001)
+        active["now"] -= 1
+        key = batch[0]
+        attempts[key] = attempts.get(key, 0) + 1
+        if key == "log 30" and attempts[key] < 3:
+            raise RuntimeError("503 unavailable")
+        if key == "log 70":
+            raise RuntimeError("500 internal")
+        return {"operation": f"op-{key}"}
+
+    report = await ingest_batches(
+        submit, [f"log {i}" for i in range(100)], max_entries=10, concurrency=3, max_retries=2, retry_delay=0
+    )
+
+    assert report.batches == 10
+    assert report.entries == 90
+    assert report.failed_batches == 1 and report.failed_entries == 10
+    assert report.retries == 4
+    assert attempts["log 0"] == 1 and attempts["log 30"] == 3 and attempts["log 70"] == 3
+    assert active["peak"] <= 3
+    assert len(report.operations) == 9
+    summary = report.to_dict()
+    assert summary["entries_per_second"] > 0 and summary["bytes_per_second"] > 0
+    assert "500 internal" in summary["errors"][0]
+
+
+@pytest.mark.asyncio
+async def test_ingest_batches_reads_source_lazily():
+    """Only a few batches are read from the source ahead of submission."""
+    produced = []
+    ahead = []
+
+    def source():
+        for i in range(50):
+            produced.append(i)
+            yield f"log {i}"
+
+    async def submit(batch):
+        ahead.append(len(produced) - int(batch[0].split()[1]))
+        await asyncio.sleep(0)
+
+    report = await ingest_batches(submit, source(), max_entries=1, concurrency=1)
+
+    assert report.entries == 50
+    assert max(ahead) <= 4
+
+
+@pytest.mark.asyncio
+async def test_ingest_batches_does_not_retry_value_errors():
+    """Validation errors fail the batch without retries."""
+    submit = MagicMock(side_effect=ValueError("Invalid log type"))
+
+    async def call(batch):
+        return submit(batch)
+
+    report = await ingest_batches(call, ["a", "b"], max_entries=1, retry_delay=0)
+
+    assert submit.call_count == 2
+    assert report.failed_batches == 2 and report.retries == 0
+
+
+@pytest.mark.parametrize(
+    "error, retryable",
+    [
+        (APIError("Failed to ingest log: method=POST, url=u, status=400, response={}"), False),
+        (APIError("Failed to ingest log: method=POST, url=u, status=403, response={}"), False),
+        (APIError("Failed to ingest log: method=POST, url=u, status=429, response={}"), True),
+        (APIError("Failed to ingest log: method=POST, url=u, status=503, response_text="), True),
+        (APIError("API request failed: request_error=ConnectionError, status_code=None,"), True),
+        (ValueError("Invalid log type"), False),
+        (RuntimeError("deadline exceeded"), True),
+    ],
+)
+def test_is_retryable(error, retryable):
+    """Only transient API statuses and errors without a status are retried."""
+    assert is_retryable(error) is retryable
+
+
+@pytest.mark.asyncio
+async def test_ingest_batches_does_not_retry_permanent_api_errors():
+    """A 404 fails the batch at once; a 503 is retried."""
+    attempts = []
+
+    async def submit(batch):
+        attempts.append(batch[0])
+        status = 404 if batch[0] == "a" else 503
+        raise APIError(f"Failed to ingest log: status={status}, response={{}}")
+
+    report = await ingest_batches(submit, ["a", "b"], max_entries=1, max_retries=2, retry_delay=0)
+
+    assert attempts.count("a") == 1 and attempts.count("b") == 3
+    assert report.failed_batches == 2 and report.retries == 2
+
+
+@pytest.mark.asyncio
+async def test_ingest_batches_reads_source_off_the_event_loop():
+    """The entry source is read in a worker thread, not on the event loop."""
+    loop_thread = threading.get_ident()
+    readers = set()
+
+    def source():
+        for i in range(5):
+            readers.add(threading.get_ident())
+            yield f"log {i}"
+
+    async def submit(batch):
+        return {}
+
+    report = await ingest_batches(submit, source(), max_entries=2)
+
+    assert report.entries == 5
+    assert loop_thread not in readers
+
+
+@pytest.mark.asyncio
+async def test_submit_batches_survives_failing_on_done():
+    """A raising on_done is reported; it does not stop the remaining batches."""
+    async def submit(batch):
+        return {}
+
+    def on_done(index, ok, retryable):
+        raise RuntimeError("checkpoint failed")
+
+    batches = [[f"log {i}"] for i in range(10)]
+    report = await asyncio.wait_for(
+        submit_batches(submit, batches, concurrency=1, retry_delay=0, on_done=on_done),
+        timeout=5,
+    )
+
+    assert report.entries == 10
+    assert "Completion callback of batch 0 failed: checkpoint failed" in report.errors
+
+
+def test_decompress_entries_limits_decompressed_size():
+    data = base64.b64encode(gzip.compress(b"a\n" * 1000)).decode()
+
+    assert len(decompress_entries(data, max_bytes=2000)) == 1000
+    with pytest.raises(ValueError, match="more than 1999 bytes"):
+        decompress_entries(data, max_bytes=1999)
+    with pytest.raises(ValueError, match="not base64 encoded gzip"):
+        decompress_entries("bm90IGd6aXA=")
+
+
+@pytest.fixture
+def chronicle():
+    chronicle = MagicMock()
+    chronicle.get_or_create_forwarder.return_value = {
+        "name": "projects/p/locations/us/instances/c/forwarders/f"
+    }
+    chronicle.ingest_log.return_value = {"operation": "operations/1"}
+    with patch(
+        "secops_mcp.tools.log_ingestion.get_chronicle_client", return_value=chronicle
+    ):
+        yield chronicle
+
+
+@pytest.mark.asyncio
+async def test_ingest_raw_log_batches_compressed_data(chronicle):
+    """Compressed newline-delimited logs are batched under one forwarder."""
+    lines = "\n".join(f'{{"id": {i}}}' for i in range(2500))
+    data = base64.b64encode(gzip.compress(lines.encode())).decode()
+
+    response = await ingest_raw_log(log_type="OKTA", compressed_log_data=data, labels={"env": "test"})
+
+    assert "Ingested 2500 log(s) of type OKTA in 3 batch(es)" in response
+    chronicle.get_or_create_forwarder.assert_called_once()
+    assert chronicle.ingest_log.call_count == 3
+    kwargs = chronicle.ingest_log.call_args.kwargs
+    assert kwargs["forwarder_id"].endswith("/forwarders/f")
+    assert kwargs["labels"] == {"env": "test"}
+
+
+@pytest.mark.asyncio
+async def test_ingest_raw_log_single_string_is_passed_through(chronicle):
+    """A single string goes to the SDK unchanged, in one call."""
+    response = await ingest_raw_log(log_type="OKTA", log_message='{"a": 1}')
+
+    assert "Successfully ingested 1 log(s)" in response
+    chronicle.ingest_log.assert_called_once_with(log_type="OKTA", log_message='{"a": 1}')
+    chronicle.get_or_create_forwarder.assert_not_called()
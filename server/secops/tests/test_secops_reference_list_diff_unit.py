@@ -0,0 +1,84 @@
+"""Unit tests for incremental reference list updates."""
+
+import sys
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Ensure server/secops is in path to import secops_mcp
+current_dir = os.path.dirname(os.path.abspath(__file__))
+server_secops_dir = os.path.dirname(current_dir)
+if server_secops_dir not in sys.path:
+    sys.path.append(server_secops_dir)
+
+from secops_mcp.reference_list_diff import diff_entries
+from secops_mcp.tools.reference_list_management import update_reference_list
+
+CIDR = "REFERENCE_LIST_SYNTAX_TYPE_CIDR"
+
+
+def test_diff_entries_keeps_order_and_skips_duplicates():
+    """New entries are appended once; removals drop every occurrence."""
+    diff = diff_entries(
+        ["a.com", "b.com", "c.com", "b.com"],
+        add=["d.com", " a.com ", "d.com", "e.com", "c.com"],
+        remove=["b.com", "x.com", "e.com"],
+    )
+
+    assert diff.entries == ["a.com", "c.com", "d.com"]
+    assert diff.added == ["d.com"]
+    assert diff.removed == ["b.com", "b.com"]
+    assert diff.already_present == 2
+    assert diff.not_found == 2
+
+
+def test_diff_entries_compares_cidr_networks():
+    """CIDR lists treat an address and its /32 network as the same entry."""
+    diff = diff_entries(["10.0.0.1", "192.168.0.0/16"], add=["10.0.0.1/32"], remove=["192.168.1.1/16"], syntax_type=CIDR)
+
+    assert diff.entries == ["10.0.0.1"]
+    assert diff.added == [] and diff.removed == ["192.168.0.0/16"]
+
+
+@pytest.fixture
+def chronicle():
+    chronicle = MagicMock()
+    chronicle.get_reference_list.return_value = {
+        "syntaxType": "REFERENCE_LIST_SYNTAX_TYPE_PLAIN_TEXT_STRING",
+        "entries": [{"value": f"ioc-{i}.example.com"} for i in range(100000)],
+    }
+    with patch(
+        "secops_mcp.tools.reference_list_management.get_chronicle_client", return_value=chronicle
+    ):
+        yield chronicle
+
+
+@pytest.mark.asyncio
+async def test_add_entries_updates_large_list(chronicle):
+    """Appending to a large list sends the merged list and reports the delta."""
+    new = [f"new-{i}.example.com" for i in range(50)]
+
+    result = await update_reference_list(
+        name="blocklist", add_entries=new + ["ioc-1.example.com"], remove_entries=["ioc-0.example.com"]
+    )
+
+    assert "Entries added: 50 (1 already present)" in result
+    assert "Entries removed: 1 (0 not found)" in result
+    assert "Total entries: 100049 (was 100000)" in result
+    entries = chronicle.update_reference_list.call_args.kwargs["entries"]
+    assert entries[0] == "ioc-1.example.com" and entries[-50:] == new
+
+
+@pytest.mark.asyncio
+async def test_no_op_changes_are_not_sent(chronicle):
+    """Nothing is sent when every entry is already present or absent."""
+    result = await update_reference_list(
+        name="blocklist", add_entries=["ioc-5.example.com"], remove_entries=["absent.example.com"]
+    )
+
+    assert result.startswith("No changes to reference list: blocklist")
+    chronicle.update_reference_list.assert_not_called()
+
+    error = await update_reference_list(name="blocklist", entries=["a"], add_entries=["b"])
+    assert error.startswith("Error: entries replaces the whole list")
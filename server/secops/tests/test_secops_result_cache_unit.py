@@ -0,0 +1,168 @@
+"""Unit tests for the time-bucketed UDM result cache."""
+
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Ensure server/secops is in path to import secops_mcp
+current_dir = os.path.dirname(os.path.abspath(__file__))
+server_secops_dir = os.path.dirname(current_dir)
+if server_secops_dir not in sys.path:
+    sys.path.append(server_secops_dir)
+
+from secops_mcp.result_cache import UdmResultCache, normalize_udm_query
+from secops_mcp.tools.search import search_udm
+from secops_mcp.tools.udm_search import export_udm_search_csv
+
+# Far enough in the past for every bucket to be settled.
+BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def iso(value):
+    return value.isoformat().replace("+00:00", "Z")
+
+
+class FakeChronicle:
+    """Serves search_udm and CSV exports from events every 10 minutes."""
+
+    def __init__(self):
+        self.instance_id = "projects/p/locations/us/instances/c"
+        self.times = [BASE + timedelta(minutes=10 * i) for i in range(6 * 48)]
+        self.search_udm = MagicMock(side_effect=self._search)
+        self.fetch_udm_search_csv = MagicMock(side_effect=self._csv)
+
+    def _matching(self, start_time, end_time):
+        return [t for t in self.times if start_time <= t <= end_time]
+
+    def _search(self, query, start_time, end_time, max_events):
+        events = [
+            {"name": f"events/{iso(t)}", "udm": {"metadata": {"eventTimestamp": iso(t)}}}
+            for t in self._matching(start_time, end_time)
+        ]
+        return {"events": events[:max_events or 10000], "total_events": len(events)}
+
+    def _csv(self, query, start_time, end_time, fields, case_insensitive):
+        rows = ["metadata.event_timestamp,principal.ip"] + [
+            f"{iso(t)},10.0.0.1" for t in self._matching(start_time, end_time)
+        ]
+        return {"csv": {"row": rows}}
+
+
+@pytest.fixture
+def chronicle():
+    chronicle = FakeChronicle()
+    with patch(
+        "secops_mcp.tools.search.get_chronicle_client", return_value=chronicle
+    ), patch(
+        "secops_mcp.tools.udm_search.get_chronicle_client", return_value=chronicle
+    ), patch(
+        "secops_mcp.result_cache.udm_result_cache", UdmResultCache()
+    ), patch(
+        "secops_mcp.tools.udm_search.udm_result_cache", UdmResultCache()
+    ):
+        yield chronicle
+
+
+def test_normalize_udm_query_keeps_quoted_whitespace():
+    """Whitespace is collapsed outside quoted strings only."""
+    assert normalize_udm_query('  a =  "x  y"\n AND b = 1 ') == 'a = "x  y" AND b = 1'
+
+
+@pytest.mark.asyncio
+async def test_sliding_window_only_searches_gaps(chronicle):
+    """A window shifted by seconds reuses the cached buckets it covers."""
+    end = BASE + timedelta(hours=24, seconds=30)
+    first = await search_udm(
+        query="q", start_time=iso(end - timedelta(hours=24)), end_time=iso(end)
+    )
+    assert chronicle.search_udm.call_count == 1
+    assert first["total_events"] == 144
+
+    shifted = end + timedelta(seconds=50)
+    second = await search_udm(
+        query=" q ",
+        start_time=iso(shifted - timedelta(hours=24)),
+        end_time=iso(shifted),
+    )
+
+    # Only the partial buckets at both ends are searched again.
+    assert chronicle.search_udm.call_count == 3
+    for call in chronicle.search_udm.call_args_list[1:]:
+        _, kwargs = call
+        assert kwargs["end_time"] - kwargs["start_time"] <= timedelta(minutes=15)
+    assert second["cached_buckets"] == 95
+    assert second["total_events"] == 144
+    assert [e["name"] for e in second["events"]] == sorted(
+        (e["name"] for e in first["events"]), reverse=True
+    )
+
+    await search_udm(
+        query="q",
+        start_time=iso(shifted - timedelta(hours=24)),
+        end_time=iso(shifted),
+        bypass_result_cache=True,
+    )
+    assert chronicle.search_udm.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_truncated_results_are_not_cached(chronicle):
+    """Buckets are not cached from a search that hit max_events."""
+    window = {"start_time": iso(BASE), "end_time": iso(BASE + timedelta(hours=6))}
+
+    await search_udm(query="q", max_events=5, **window)
+    await search_udm(query="q", max_events=5, **window)
+
+    assert chronicle.search_udm.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_recent_buckets_are_not_cached():
+    """Buckets within the settle delay of now are never cached."""
+    cache = UdmResultCache(bucket_seconds=60, settle=600)
+    now = datetime.now(timezone.utc)
+
+    async def fetch_range(start, end):
+        return [], True, None
+
+    await cache.fetch(
+        ("s",), now - timedelta(minutes=20), now, fetch_range, lambda item: None
+    )
+
+    cached = [key[-1] for key in cache._buckets]
+    assert cached
+    assert max(cached) + 60 <= now.timestamp() - 600
+
+
+@pytest.mark.asyncio
+async def test_csv_export_reuses_cached_rows(chronicle):
+    """CSV exports with a timestamp column reuse cached buckets."""
+    fields = ["metadata.event_timestamp", "principal.ip"]
+    window = {
+        "start_time": iso(BASE + timedelta(minutes=5)),
+        "end_time": iso(BASE + timedelta(hours=6, minutes=5)),
+    }
+
+    first = await export_udm_search_csv(query="q", fields=fields, **window)
+    second = await export_udm_search_csv(query="q", fields=fields, **window)
+
+    assert chronicle.fetch_udm_search_csv.call_count == 3
+    assert second.splitlines()[0] == "metadata.event_timestamp,principal.ip"
+    assert sorted(second.splitlines()) == sorted(first.splitlines())
+
+
+@pytest.mark.asyncio
+async def test_truncated_csv_exports_are_not_cached(chronicle):
+    """Buckets are not cached from an export that reached the row limit."""
+    fields = ["metadata.event_timestamp", "principal.ip"]
+    window = {"start_time": iso(BASE), "end_time": iso(BASE + timedelta(hours=6))}
+
+    with patch("secops_mcp.tools.udm_search.EXPORT_ROW_LIMIT", 36):
+        first = await export_udm_search_csv(query="q", fields=fields, **window)
+        await export_udm_search_csv(query="q", fields=fields, **window)
+
+    assert chronicle.fetch_udm_search_csv.call_count == 2
+    assert len(first.splitlines()) == 38
@@ -0,0 +1,155 @@
+"""Unit tests for the stored search result analysis tools."""
+
+import sys
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Ensure server/secops is in path to import secops_mcp
+current_dir = os.path.dirname(os.path.abspath(__file__))
+server_secops_dir = os.path.dirname(current_dir)
+if server_secops_dir not in sys.path:
+    sys.path.append(server_secops_dir)
+
+from secops_mcp.result_cache import UdmResultCache
+from secops_mcp.result_store import ResultStore, ResultTable, flatten_event
+from secops_mcp.tools.result_analysis import (
+    describe_results,
+    distinct_values,
+    filter_results,
+    group_results,
+)
+from secops_mcp.tools.search import search_udm
+
+
+def make_event(i, user, ips, action, hostname=None):
+    udm = {
+        "metadata": {"eventType": "USER_LOGIN", "eventTimestamp": f"2024-01-01T00:00:{i:02d}Z"},
+        "principal": {"user": {"userid": user}, "ip": ips},
+        "securityResult": [{"action": [action]}],
+    }
+    if hostname:
+        udm["target"] = {"hostname": hostname}
+    return {"name": f"events/{i}", "udm": udm}
+
+
+EVENTS = [
+    make_event(0, "alice", ["10.0.0.1"], "ALLOW", "web-1"),
+    make_event(1, "alice", ["10.0.0.1", "10.0.0.2"], "BLOCK", "web-1"),
+    make_event(2, "bob", ["10.0.0.3"], "BLOCK", "db-1"),
+    make_event(3, "bob", ["10.0.0.3"], "BLOCK"),
+    make_event(4, "carol", ["10.0.0.1"], "ALLOW", "web-2"),
+]
+
+
+def test_flatten_event_uses_udm_field_paths():
+    """Events flatten to snake_case UDM paths; repeated fields become tuples."""
+    row = flatten_event(EVENTS[1])
+
+    assert row["name"] == "events/1"
+    assert row["metadata.event_type"] == "USER_LOGIN"
+    assert row["principal.ip"] == ("10.0.0.1", "10.0.0.2")
+    assert row["security_result.action"] == ("BLOCK",)
+
+
+@pytest.fixture
+def handle():
+    store = ResultStore()
+    with patch("secops_mcp.tools.result_analysis.result_store", store):
+        yield store.put(ResultTable.from_events(EVENTS, source="test"))
+
+
+@pytest.mark.asyncio
+async def test_filter_and_group(handle):
+    """Filters narrow rows into a new handle that can be grouped further."""
+    filtered = await filter_results(
+        handle,
+        filters=[
+            {"field": "security_result.action", "op": "eq", "value": "BLOCK"},
+            {"field": "target.hostname", "op": "exists", "value": True},
+        ],
+        fields=["principal.user.userid"],
+    )
+    assert filtered["rows"] == 2
+    assert filtered["sample"] == [
+        {"principal.user.userid": "alice"},
+        {"principal.user.userid": "bob"},
+    ]
+
+    top_ips = await group_results(handle, group_by=["principal.ip"], limit=2)
+    assert top_ips["group_count"] == 3
+    assert top_ips["groups"] == [
+        {"principal.ip": "10.0.0.1", "count": 3},
+        {"principal.ip": "10.0.0.3", "count": 2},
+    ]
+
+    per_user = await group_results(
+        filtered["result_handle"], group_by=["principal.user.userid", "target.hostname"]
+    )
+    assert per_user["rows"] == 2
+    assert {"principal.user.userid": "bob", "target.hostname": "db-1", "count": 1} in (
+        per_user["groups"]
+    )
+
+    total = await group_results(handle, group_by=[])
+    assert total["groups"] == [{"count": 5}]
+
+
+@pytest.mark.asyncio
+async def test_distinct_values_and_describe(handle):
+    """Distinct values skip missing fields; describe lists field coverage."""
+    hosts = await distinct_values(handle, "target.hostname")
+    assert hosts == {"distinct_count": 3, "values": ["web-1", "db-1", "web-2"]}
+
+    users = await distinct_values(
+        handle,
+        "principal.user.userid",
+        filters=[{"field": "principal.ip", "op": "prefix", "value": "10.0.0.1"}],
+    )
+    assert sorted(users["values"]) == ["alice", "carol"]
+
+    description = await describe_results(handle)
+    assert description["rows"] == 5
+    assert description["fields"]["target.hostname"] == 4
+
+
+@pytest.mark.asyncio
+async def test_errors_are_returned(handle):
+    """Unknown handles and operators produce error results."""
+    assert "error" in await describe_results("res_missing")
+    result = await filter_results(
+        handle, filters=[{"field": "principal.ip", "op": "like", "value": "x"}]
+    )
+    assert "Unknown filter operator" in result["error"]
+
+
+def test_store_evicts_least_recently_used():
+    """The store keeps at most max_tables tables."""
+    store = ResultStore(max_tables=2)
+    first = store.put(ResultTable.from_events([]))
+    second = store.put(ResultTable.from_events([]))
+    store.get(first)
+    store.put(ResultTable.from_events([]))
+
+    store.get(first)
+    with pytest.raises(KeyError):
+        store.get(second)
+
+
+@pytest.mark.asyncio
+async def test_search_udm_stores_results():
+    """search_udm returns a handle to its events when asked to."""
+    chronicle = MagicMock()
+    chronicle.search_udm.return_value = {"events": EVENTS, "total_events": 5}
+    store = ResultStore()
+
+    with patch(
+        "secops_mcp.tools.search.get_chronicle_client", return_value=chronicle
+    ), patch("secops_mcp.tools.search.result_store", store), patch(
+        "secops_mcp.result_cache.udm_result_cache", UdmResultCache(ttl=0)
+    ):
+        result = await search_udm(query="q", store_results=True)
+
+    assert result["stored_rows"] == 5
+    assert store.get(result["result_handle"]).row_count == 5
@@ -0,0 +1,111 @@
+"""Unit tests for the local rule corpus index."""
+
+import sys
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Ensure server/secops is in path to import secops_mcp
+current_dir = os.path.dirname(os.path.abspath(__file__))
+server_secops_dir = os.path.dirname(current_dir)
+if server_secops_dir not in sys.path:
+    sys.path.append(server_secops_dir)
+
+from secops_mcp.rule_index import RuleCorpus, RuleCorpusCache, tokenize
+from secops_mcp.tools.security_rules import search_rule_corpus
+
+RULE_NAME = "projects/p/locations/us/instances/c/rules/"
+
+
+def make_rule(i, revision="v1", technique="T1059.001", ip="10.0.0.1", log_type="WORKSPACE_ACTIVITY"):
+    text = f"""rule rule_{i} {{
+  meta:
+    mitre_attack_technique = "{technique}"
+  events:
+    $e.metadata.log_type = "{log_type}"
+    $e.target.ip = "{ip}"
+  condition:
+    $e
+}}"""
+    return {
+        "name": f"{RULE_NAME}ru_{i}",
+        "revisionId": revision,
+        "displayName": f"rule_{i}",
+        "text": text,
+        "severity": {"displayName": "HIGH"},
+    }
+
+
+def test_tokenize_keeps_compound_tokens_and_parts():
+    """Dotted values are indexed whole and by part."""
+    tokens = tokenize('$e.metadata.log_type = "WORKSPACE" // T1059.001 10.0.0.1')
+
+    assert {"e.metadata.log_type", "log_type", "workspace", "t1059.001", "t1059", "10.0.0.1"} <= tokens
+
+
+def test_corpus_token_and_regex_search():
+    """Token search intersects postings; regex search scans rule text."""
+    corpus = RuleCorpus()
+    corpus.put(make_rule(1))
+    corpus.put(make_rule(2, technique="T1078", ip="192.168.1.1"))
+    corpus.put(make_rule(3, log_type="OKTA"))
+
+    assert [d.rule_id for d in corpus.search_tokens("T1059")] == ["ru_1", "ru_3"]
+    assert [d.rule_id for d in corpus.search_tokens("t1059 okta")] == ["ru_3"]
+    assert [d.rule_id for d in corpus.search_tokens("192.168.1.1")] == ["ru_2"]
+    assert corpus.search_tokens("nothing") == []
+    assert [d.rule_id for d in corpus.search_regex(r'log_type = "WORKSPACE')] == ["ru_1", "ru_2"]
+    assert [d.rule_id for d in corpus.search_regex("okta", case_insensitive=True)] == ["ru_3"]
+
+    corpus.put(make_rule(3, revision="v2"))
+    assert corpus.search_tokens("okta") == []
+    assert corpus.stale({"ru_1": "v1", "ru_3": "v3", "ru_4": "v1"}) == ["ru_3", "ru_4"]
+    assert sorted(corpus.rules) == ["ru_1", "ru_3"]
+
+
+@pytest.fixture
+def chronicle():
+    chronicle = MagicMock()
+    chronicle.instance_id = "projects/p/locations/us/instances/c"
+    rules = {f"ru_{i}": make_rule(i, technique=f"T{1000 + i}") for i in range(30)}
+    chronicle.rules = rules
+
+    def list_rules(view, as_list):
+        if view == "REVISION_METADATA_ONLY":
+            return [{"name": r["name"], "revisionId": r["revisionId"]} for r in rules.values()]
+        return list(rules.values())
+
+    chronicle.list_rules.side_effect = list_rules
+    chronicle.get_rule.side_effect = lambda rule_id: rules[rule_id]
+    with patch(
+        "secops_mcp.tools.security_rules.get_chronicle_client", return_value=chronicle
+    ), patch(
+        "secops_mcp.tools.security_rules.rule_corpus_cache", RuleCorpusCache(refresh_seconds=3600)
+    ):
+        yield chronicle
+
+
+@pytest.mark.asyncio
+async def test_search_rule_corpus_refreshes_by_revision(chronicle):
+    """The corpus loads once, then fetches only rules whose revision changed."""
+    result = await search_rule_corpus(query="T1007", mode="tokens")
+    assert result["total_matches"] == 1 and result["corpus_rules"] == 30
+    assert result["rules"][0]["rule_id"] == "ru_7"
+    assert result["rules"][0]["severity"] == "HIGH"
+    assert result["rules"][0]["matching_lines"] == ['mitre_attack_technique = "T1007"']
+    full_listings = [c for c in chronicle.list_rules.call_args_list if c.kwargs["view"] == "FULL"]
+    assert len(full_listings) == 1
+
+    again = await search_rule_corpus(query=r"T10\d5\b", max_results=2)
+    assert again["total_matches"] == 3 and len(again["rules"]) == 2
+    assert chronicle.list_rules.call_count == 2
+
+    chronicle.rules["ru_7"] = make_rule(7, revision="v2", technique="T9999")
+    del chronicle.rules["ru_8"]
+    refreshed = await search_rule_corpus(query="T9999", mode="tokens", refresh=True)
+    assert refreshed["total_matches"] == 1 and refreshed["corpus_rules"] == 29
+    chronicle.get_rule.assert_called_once_with("ru_7")
+
+    error = await search_rule_corpus(query="(")
+    assert "Invalid regular expression" in error["error"]
@@ -0,0 +1,90 @@
+"""Unit tests for the SDK thread-pool executor."""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+
+import pytest
+
+# Ensure server/secops is in path to import secops_mcp
+current_dir = os.path.dirname(os.path.abspath(__file__))
+server_secops_dir = os.path.dirname(current_dir)
+if server_secops_dir not in sys.path:
+    sys.path.append(server_secops_dir)
+
+from secops_mcp import sdk_executor
+from secops_mcp.sdk_executor import run_sdk
+
+
+@pytest.mark.asyncio
+async def test_run_sdk_does_not_block_event_loop():
+    """A slow SDK call runs in a worker thread while the loop keeps running."""
+    def slow_call(value):
+        time.sleep(0.2)
+        return value, threading.current_thread().name
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    value, thread_name = await run_sdk(slow_call, "result")
+    task.cancel()
+
+    assert value == "result"
+    assert thread_name.startswith("secops-sdk")
+    assert ticks > 5
+
+
+@pytest.mark.asyncio
+async def test_run_sdk_applies_per_operation_limit(monkeypatch):
+    """Calls of one operation never exceed its concurrency limit."""
+    monkeypatch.setenv("SECOPS_SDK_CONCURRENCY", "limited_call=2")
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def limited_call():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+
+    await asyncio.gather(*(run_sdk(limited_call) for _ in range(6)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_call_waiting_for_a_slot_never_runs(monkeypatch):
+    """A call cancelled before it starts is dropped."""
+    monkeypatch.setenv("SECOPS_SDK_CONCURRENCY", "single_call=1")
+    calls = []
+
+    def single_call(name):
+        time.sleep(0.1)
+        calls.append(name)
+
+    first = asyncio.create_task(run_sdk(single_call, "first"))
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(run_sdk(single_call, "second"))
+    await asyncio.sleep(0.01)
+    second.cancel()
+    await first
+
+    with pytest.raises(asyncio.CancelledError):
+        await second
+    assert calls == ["first"]
+
+
+def teardown_module():
+    sdk_executor.shutdown()
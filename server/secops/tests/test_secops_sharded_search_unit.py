@@ -0,0 +1,151 @@
+"""Unit tests for time-sharded UDM search."""
+
+import sys
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Ensure server/secops is in path to import secops_mcp
+current_dir = os.path.dirname(os.path.abspath(__file__))
+server_secops_dir = os.path.dirname(current_dir)
+if server_secops_dir not in sys.path:
+    sys.path.append(server_secops_dir)
+
+from secops_mcp.result_cache import UdmResultCache
+from secops_mcp.sharded_search import sharded_search_udm, split_window
+from secops_mcp.tools.search import search_udm
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+END = START + timedelta(days=7)
+
+
+def make_event(timestamp, name=None):
+    return {
+        "name": name or f"events/{timestamp.isoformat()}",
+        "udm": {
+            "metadata": {
+                "eventTimestamp": timestamp.isoformat().replace("+00:00", "Z")
+            }
+        },
+    }
+
+
+class FakeChronicle:
+    """Serves search_udm from a fixed list of events, at most `cap` per search."""
+
+    def __init__(self, events, cap=None):
+        self.events = events
+        self.cap = cap
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def search_udm(self, query, start_time, end_time, max_events):
+        with self.lock:
+            self.calls.append((start_time, end_time))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+        with self.lock:
+            self.active -= 1
+        matched = [
+            event
+            for timestamp, event in self.events
+            if start_time <= timestamp <= end_time
+        ]
+        limit = min(max_events, self.cap or max_events)
+        return {
+            "events": matched[:limit],
+            "total_events": min(len(matched), limit),
+            "more_data_available": len(matched) > limit,
+        }
+
+
+def test_split_window_covers_range():
+    """Sub-windows are contiguous and cover the whole range."""
+    windows = split_window(START, END, 7)
+
+    assert len(windows) == 7
+    assert windows[0][0] == START and windows[-1][1] == END
+    assert all(a[1] == b[0] for a, b in zip(windows, windows[1:]))
+
+
+@pytest.mark.asyncio
+async def test_sharded_search_splits_busy_windows_and_merges():
+    """Capped sub-windows are split until every event is found, newest first."""
+    # A burst of 40 events in one hour, plus one event per day.
+    timestamps = [START + timedelta(days=3, minutes=i) for i in range(40)]
+    timestamps += [START + timedelta(days=d, hours=12) for d in range(7)]
+    # Each search returns at most 5 events, whatever max_events asks for.
+    chronicle = FakeChronicle([(t, make_event(t)) for t in timestamps], cap=5)
+
+    result = await sharded_search_udm(
+        chronicle, "q", START, END, max_events=100, shards=7, max_concurrency=2
+    )
+    events = result["events"]
+    assert result["total_events"] == 47
+    assert result["more_data_available"] is False
+    assert result["shards"] > 7
+    assert chronicle.peak <= 2
+    assert events[0]["name"] == make_event(max(timestamps))["name"]
+    stamps = [e["udm"]["metadata"]["eventTimestamp"] for e in events]
+    assert stamps == sorted(stamps, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_sharded_search_stops_splitting_once_the_result_is_full():
+    """Once max_events events are found, capped sub-windows are not split."""
+    timestamps = [START + timedelta(days=3, minutes=i) for i in range(40)]
+    timestamps += [START + timedelta(days=d, hours=12) for d in range(7)]
+    chronicle = FakeChronicle([(t, make_event(t)) for t in timestamps])
+
+    result = await sharded_search_udm(
+        chronicle, "q", START, END, max_events=10, shards=7
+    )
+
+    assert result["shards"] == 7
+    assert len(result["events"]) == 10
+    assert result["more_data_available"] is True
+
+
+@pytest.mark.asyncio
+async def test_sharded_search_dedupes_boundary_events_and_reports_errors():
+    """Events on shard boundaries appear once; failed shards are reported."""
+    boundary = START + timedelta(days=1)
+    chronicle = FakeChronicle([(boundary, make_event(boundary))])
+    original = chronicle.search_udm
+
+    def flaky(query, start_time, end_time, max_events):
+        if start_time >= START + timedelta(days=6):
+            raise RuntimeError("deadline exceeded")
+        return original(query, start_time, end_time, max_events)
+
+    chronicle.search_udm = flaky
+    result = await sharded_search_udm(chronicle, "q", START, END, shards=7)
+
+    assert result["total_events"] == 1
+    assert len(result["errors"]) == 1
+    assert "deadline exceeded" in result["errors"][0]
+    assert result["more_data_available"] is True
+
+
+@pytest.mark.asyncio
+async def test_search_udm_uses_sharding_when_requested():
+    """search_udm only shards when more than one shard is requested."""
+    chronicle = MagicMock()
+    chronicle.search_udm.return_value = {"events": [], "total_events": 0}
+
+    with patch(
+        "secops_mcp.tools.search.get_chronicle_client", return_value=chronicle
+    ), patch("secops_mcp.result_cache.udm_result_cache", UdmResultCache(ttl=0)):
+        await search_udm(query="q", hours_back=24)
+        assert chronicle.search_udm.call_count == 1
+        result = await search_udm(query="q", hours_back=24, shards=4)
+
+    assert chronicle.search_udm.call_count == 5
+    assert result["shards"] == 4
@@ -0,0 +1,161 @@
+"""Unit tests for the natural language to UDM translation cache."""
+
+import sys
+import os
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# Ensure server/secops is in path to import secops_mcp
+current_dir = os.path.dirname(os.path.abspath(__file__))
+server_secops_dir = os.path.dirname(current_dir)
+if server_secops_dir not in sys.path:
+    sys.path.append(server_secops_dir)
+
+from secops_mcp.result_cache import UdmResultCache
+from secops_mcp.translation_cache import TranslationCache, normalize_query
+from secops_mcp.tools.security_events import search_security_events
+
+
+def test_normalize_query_ignores_case_whitespace_and_quote_style():
+    """Equivalent phrasings share one key; quoted values keep their case."""
+    assert normalize_query('  Find LOGIN events\tfor "Admin" ') == (
+        normalize_query("find login events for ‘Admin’")
+    )
+    assert normalize_query("events for 'Admin'") != normalize_query(
+        "events for 'admin'"
+    )
+
+
+@pytest.mark.asyncio
+async def test_translate_caches_and_bypasses():
+    """Hits skip the translation; bypass translates again and refreshes."""
+    cache = TranslationCache()
+    translate = MagicMock(side_effect=["query-1", "query-2"])
+
+    async def call():
+        return translate()
+
+    key = TranslationCache.key("instance", "Find logins")
+    assert await cache.translate(key, call) == "query-1"
+    assert await cache.translate(
+        TranslationCache.key("instance", "find   LOGINS"), call
+    ) == "query-1"
+    assert await cache.translate(key, call, bypass=True) == "query-2"
+    assert await cache.translate(key, call) == "query-2"
+    assert translate.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_translate_shares_concurrent_misses():
+    """Concurrent identical queries result in a single translation."""
+    cache = TranslationCache()
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "query"
+
+    key = TranslationCache.key("instance", "text")
+    results = await asyncio.gather(*(cache.translate(key, call) for _ in range(5)))
+
+    assert results == ["query"] * 5
+    assert calls == 1
+
+
+def test_lru_eviction():
+    """The least recently used entry is evicted first."""
+    cache = TranslationCache(max_entries=2)
+    cache.put("a", "qa")
+    cache.put("b", "qb")
+    cache.get("a")
+    cache.put("c", "qc")
+
+    assert cache.get("a") == "qa"
+    assert cache.get("b") is None
+    assert cache.get("c") == "qc"
+
+
+def test_persistent_store(tmp_path):
+    """Entries are saved to and loaded from the cache file, honoring the TTL."""
+    path = str(tmp_path / "nl_cache.json")
+    cache = TranslationCache(path=path)
+    cache.put("a", "qa")
+
+    assert TranslationCache(path=path).get("a") == "qa"
+
+    with open(path) as f:
+        entries = json.load(f)
+    entries["a"][1] -= 7200
+    with open(path, "w") as f:
+        json.dump(entries, f)
+    assert TranslationCache(path=path, ttl=3600).get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_search_security_events_reuses_translation():
+    """Repeated searches translate the query once unless the cache is bypassed."""
+    chronicle = MagicMock()
+    chronicle.instance_id = "projects/p/locations/us/instances/c"
+    chronicle.translate_nl_to_udm.return_value = "metadata.event_type = 'USER_LOGIN'"
+    chronicle.search_udm.return_value = {"total_events": 0, "events": []}
+
+    with patch(
+        "secops_mcp.tools.security_events.get_chronicle_client",
+        return_value=chronicle,
+    ), patch(
+        "secops_mcp.tools.security_events.translation_cache", TranslationCache()
+    ), patch(
+        "secops_mcp.result_cache.udm_result_cache", UdmResultCache(ttl=0)
+    ):
+        for text in ["Show logins", "show  logins"]:
+            result = await search_security_events(text=text)
+            assert result["udm_query"] == "metadata.event_type = 'USER_LOGIN'"
+        await search_security_events(
+            text="show logins", bypass_translation_cache=True
+        )
+
+    assert chronicle.translate_nl_to_udm.call_count == 2
+    assert chronicle.search_udm.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_saves_are_batched_off_the_event_loop(tmp_path):
+    """A burst of translations is saved once, in a thread, after a delay."""
+    path = str(tmp_path / "nl_cache.json")
+    cache = TranslationCache(path=path, save_delay=0.05)
+    saves = []
+    save = cache._save
+
+    def record_save():
+        saves.append(threading.get_ident())
+        save()
+
+    cache._save = record_save
+    for i in range(5):
+        key = TranslationCache.key("instance", f"query {i}")
+        await cache.translate(key, AsyncMock(return_value=f"udm {i}"))
+    assert saves == [] and not os.path.exists(path)
+
+    await asyncio.sleep(0.2)
+    assert len(saves) == 1 and saves[0] != threading.get_ident()
+    assert len(TranslationCache(path=path)._entries) == 5
+
+    cache.put("late", "udm late")
+    cache.close()
+    assert TranslationCache(path=path).get("late") == "udm late"
+
+
+def test_close_without_a_path_writes_nothing(tmp_path, monkeypatch):
+    """A cache that is not persisted has nothing to save at shutdown."""
+    monkeypatch.chdir(tmp_path)
+    cache = TranslationCache()
+    cache.put("k", "q")
+    cache.close()
+
+    assert list(tmp_path.iterdir()) == []